@@ -1,7 +1,11 @@
 import asyncio
 import logging
+import math
+import os
+import time
 from typing import TYPE_CHECKING
 
+import psutil
 from aiohttp import web
 from discord.ext import commands
 
@@ -20,6 +24,19 @@ class API(commands.Cog):
         self.host = bot.options.get("api-host", "127.0.0.1")
         self.port = int(bot.options.get("api-port", 5000))
 
+        # Built in metrics, updated on every scrape
+        self.process = psutil.Process(os.getpid())
+        self.gateway_latency = bot.metrics.gauge(
+            "titanium_gateway_latency_seconds", "Discord gateway heartbeat latency."
+        )
+        self.process_rss = bot.metrics.gauge(
+            "titanium_process_resident_memory_bytes", "Resident memory size."
+        )
+        self.process_fds = bot.metrics.gauge(
+            "titanium_process_open_fds", "Open file descriptors."
+        )
+        bot.metrics.add_collector(self.collect_metrics)
+
         logging.info(f"[API] Starting API server on {self.host}:{self.port}")
         self.server_task = asyncio.create_task(self.start_server())
 
@@ -46,6 +63,9 @@ class API(commands.Cog):
         self.app.router.add_get("/ping", self.ping)
         self.app.router.add_get("/status", self.status)
         self.app.router.add_get("/pfp", self.pfp)
+        self.app.router.add_get("/commands", self.command_stats)
+        self.app.router.add_get("/metrics", self.metrics)
+        self.app.router.add_get("/loop", self.loop_stalls)
 
     async def index(self, request: web.Request) -> web.Response:
         return web.json_response({"version": "Titanium API v1"})
@@ -83,7 +103,64 @@ class API(commands.Cog):
         pfp_url = self.bot.user.display_avatar.url if self.bot.user else None
         return web.json_response({"url": pfp_url})
 
+    async def command_stats(self, request: web.Request) -> web.Response:
+        metrics = self.bot.get_cog("CommandMetrics")
+
+        if metrics is None:
+            return web.json_response(
+                {"error": "Command metrics are not loaded"}, status=503
+            )
+
+        # Get time range from query, defaults to last 24 hours
+        try:
+            hours = float(request.query.get("hours", 24))
+        except ValueError:
+            return web.json_response({"error": "Invalid hours value"}, status=400)
+
+        if not math.isfinite(hours) or hours <= 0:
+            return web.json_response({"error": "Invalid hours value"}, status=400)
+
+        data = {
+            "hours": hours,
+            "commands": await metrics.get_summary(time.time() - hours * 3600),
+        }
+        return web.json_response(data)
+
+    def collect_metrics(self) -> None:
+        # Latency is inf before the first heartbeat
+        if self.bot.latency != float("inf"):
+            self.gateway_latency.set(self.bot.latency)
+
+        self.process_rss.set(self.process.memory_info().rss)
+
+        # Not available on Windows
+        if hasattr(self.process, "num_fds"):
+            self.process_fds.set(self.process.num_fds())
+
+    async def metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.bot.metrics.render().encode(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+    async def loop_stalls(self, request: web.Request) -> web.Response:
+        monitor = self.bot.get_cog("LoopMonitor")
+
+        if monitor is None:
+            return web.json_response(
+                {"error": "Loop monitor is not loaded"}, status=503
+            )
+
+        data = {
+            "lag": round(monitor.lag.values.get((), 0), 4),
+            "threshold": monitor.STALL_THRESHOLD,
+            "stalls": list(monitor.stalls),
+        }
+        return web.json_response(data)
+
     async def cog_unload(self):
+        self.bot.metrics.remove_collector(self.collect_metrics)
+
         if self.server_task:
             self.server_task.cancel()
 
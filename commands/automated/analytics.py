@@ -1,7 +1,8 @@
+import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Union
 
-import aiohttp
 import discord
 from discord import Color, app_commands
 from discord.ext import commands
@@ -11,9 +12,155 @@ if TYPE_CHECKING:
 
 
 class Analytics(commands.Cog):
+    # Max embeds Discord allows in a single webhook message
+    BATCH_SIZE = 10
+
+    # Max queued events before new events are dropped
+    QUEUE_SIZE = 1000
+
+    # Seconds to wait for more events before sending a partial batch
+    BATCH_WAIT = 2
+
     def __init__(self, bot: "TitaniumBot") -> None:
         self.bot = bot
 
+        # None tells the worker to stop
+        self.queue: asyncio.Queue[tuple[str, discord.Embed] | None] = asyncio.Queue(
+            maxsize=self.QUEUE_SIZE
+        )
+
+        # Events dropped while the queue was full, per webhook URL
+        self.dropped: dict[str, int] = {}
+
+        # Report queue depth in metrics
+        self.queue_depth = self.bot.metrics.gauge(
+            "titanium_queue_depth", "Events waiting in background queues.", ("queue",)
+        )
+        self.dropped_events = self.bot.metrics.counter(
+            "titanium_queue_dropped_total",
+            "Events dropped because a background queue was full.",
+            ("queue",),
+        )
+        self.bot.metrics.add_collector(self.collect_metrics)
+
+        self.worker_task = self.bot.loop.create_task(self.dispatch_worker())
+
+    async def cog_unload(self) -> None:
+        # Let the worker send the batch it is building and stop, then flush
+        # anything still waiting
+        await self.queue.put(None)
+        await self.worker_task
+
+        try:
+            while not self.queue.empty() or self.dropped:
+                await self.send_batch(self.take_batch())
+        except Exception as e:
+            logging.error(f"[ANALYTICS] Failed to flush analytics queue - {e}")
+
+        self.bot.metrics.remove_collector(self.collect_metrics)
+
+    def collect_metrics(self) -> None:
+        self.queue_depth.set(self.queue.qsize(), queue="analytics")
+
+    # Get webhook URL from config, None if not set
+    def get_webhook(self, option: str) -> str | None:
+        try:
+            if self.bot.options[option] is not None and self.bot.options[option] != "":
+                return self.bot.options[option]
+        except KeyError:
+            pass
+
+        return None
+
+    # Add an event to the queue without waiting
+    def enqueue(self, webhook_url: str, embed: discord.Embed) -> None:
+        try:
+            self.queue.put_nowait((webhook_url, embed))
+        except asyncio.QueueFull:
+            # Drop event, it will be reported in a summary embed later
+            self.dropped[webhook_url] = self.dropped.get(webhook_url, 0) + 1
+            self.dropped_events.inc(queue="analytics")
+
+    # Take up to one batch of queued events without waiting
+    def take_batch(self) -> list[tuple[str, discord.Embed]]:
+        batch = []
+
+        while len(batch) < self.BATCH_SIZE and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+        return batch
+
+    # Send a batch of events, grouped into one message per webhook
+    async def send_batch(self, batch: list[tuple[str, discord.Embed]]) -> None:
+        grouped: dict[str, list[discord.Embed]] = {}
+
+        for webhook_url, embed in batch:
+            grouped.setdefault(webhook_url, []).append(embed)
+
+        # Add summary for dropped events
+        for webhook_url, count in self.dropped.items():
+            embed = discord.Embed(
+                title="Dropped Events",
+                description=f"{count} analytics event{'s' if count != 1 else ''} dropped while the queue was full.",
+                color=Color.orange(),
+            )
+            grouped.setdefault(webhook_url, []).append(embed)
+
+        self.dropped = {}
+
+        if not grouped:
+            return
+
+        for webhook_url, embeds in grouped.items():
+            # Summary may push a group over the limit
+            for i in range(0, len(embeds), self.BATCH_SIZE):
+                try:
+                    webhook = discord.Webhook.from_url(
+                        webhook_url, session=self.bot.session
+                    )
+                    await webhook.send(embeds=embeds[i : i + self.BATCH_SIZE])
+                except Exception as e:
+                    logging.error(f"[ANALYTICS] Failed to send analytics webhook - {e}")
+
+    # Background worker, sends queued events in batches
+    async def dispatch_worker(self) -> None:
+        while True:
+            event = await self.queue.get()
+
+            if event is None:
+                return
+
+            batch = [event]
+            deadline = time.monotonic() + self.BATCH_WAIT
+            stopping = False
+
+            # Wait a bit for more events to fill the batch
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    break
+
+                try:
+                    event = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+
+                # Stopping, send what has been collected so far
+                if event is None:
+                    stopping = True
+                    break
+
+                batch.append(event)
+
+            try:
+                await self.send_batch(batch)
+            except Exception as e:
+                logging.error(f"[ANALYTICS] Failed to send analytics batch - {e}")
+
+            if stopping:
+                return
+
     # Analytics for slash commands
     @commands.Cog.listener()
     async def on_app_command_completion(
@@ -21,168 +168,122 @@ class Analytics(commands.Cog):
         interaction: discord.Interaction,
         command: Union[app_commands.Command, app_commands.ContextMenu],
     ) -> None:
-        try:
-            # Ignore if there is no webhook
-            if (
-                self.bot.options["analytics-webhook"] is not None
-                and self.bot.options["analytics-webhook"] != ""
-            ):
-                try:
-                    embed = discord.Embed(
-                        title=f"@{interaction.user.name} ran a command",
-                        color=Color.green(),
-                    )
+        webhook_url = self.get_webhook("analytics-webhook")
 
-                    # Check if the command is a context menu command
-                    if isinstance(command, app_commands.ContextMenu):
-                        embed.description = f"`{command.name}`"
-                    else:
-                        embed.description = f"`/{f'{command.parent.name} ' if command.parent is not None else ''}{command.name}`"
+        # Ignore if there is no webhook
+        if webhook_url is None:
+            return
 
-                    embed.timestamp = interaction.created_at
-                    embed.set_author(
-                        name=str(self.bot.user),
-                        icon_url=self.bot.user.display_avatar.url,
-                    )
+        embed = discord.Embed(
+            title=f"@{interaction.user.name} ran a command",
+            color=Color.green(),
+        )
 
-                    embed.add_field(
-                        name="User",
-                        value=f"{interaction.user.mention} ({interaction.user.id})",
-                    )
+        # Check if the command is a context menu command
+        if isinstance(command, app_commands.ContextMenu):
+            embed.description = f"`{command.name}`"
+        else:
+            embed.description = f"`/{f'{command.parent.name} ' if command.parent is not None else ''}{command.name}`"
 
-                    async with aiohttp.ClientSession() as session:
-                        webhook = discord.Webhook.from_url(
-                            self.bot.options["analytics-webhook"], session=session
-                        )
-                        await webhook.send(embed=embed)
-                except Exception as e:
-                    logging.error(f"[ANALYTICS] Failed to send analytics webhook - {e}")
-        except KeyError:
-            pass
+        embed.timestamp = interaction.created_at
+        embed.set_author(
+            name=str(self.bot.user),
+            icon_url=self.bot.user.display_avatar.url,
+        )
+
+        embed.add_field(
+            name="User",
+            value=f"{interaction.user.mention} ({interaction.user.id})",
+        )
+
+        self.enqueue(webhook_url, embed)
 
     # Analytics for raw interactions
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
+        webhook_url = self.get_webhook("raw-analytics-webhook")
+
+        # Ignore if there is no webhook
+        if webhook_url is None:
+            return
+
+        embed = discord.Embed(
+            title=f"@{interaction.user.name} started an interaction",
+            color=Color.green(),
+        )
+
+        # Check if the command is a context menu command
         try:
-            # Ignore if there is no webhook
-            if (
-                self.bot.options["raw-analytics-webhook"] is not None
-                and self.bot.options["raw-analytics-webhook"] != ""
-            ):
+            if isinstance(interaction.command, app_commands.ContextMenu):
+                embed.description = f"`{interaction.command.name}`"
+            else:
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        embed = discord.Embed(
-                            title=f"@{interaction.user.name} started an interaction",
-                            color=Color.green(),
-                        )
-
-                        # Check if the command is a context menu command
-                        try:
-                            if isinstance(
-                                interaction.command, app_commands.ContextMenu
-                            ):
-                                embed.description = f"`{interaction.command.name}`"
-                            else:
-                                try:
-                                    embed.description = f"`/{f'{interaction.command.parent.name} ' if interaction.command.parent is not None else ''}{interaction.command.name}`"
-                                except AttributeError:
-                                    embed.description = f"`{interaction.command.name}`"
-                        except AttributeError:
-                            embed.description = f"`{interaction.type}`"
-
-                        embed.timestamp = interaction.created_at
-                        embed.set_author(
-                            name=str(self.bot.user),
-                            icon_url=self.bot.user.display_avatar.url,
-                        )
-
-                        embed.add_field(
-                            name="User",
-                            value=f"{interaction.user.mention} ({interaction.user.id})",
-                        )
-
-                        async with aiohttp.ClientSession() as session:
-                            webhook = discord.Webhook.from_url(
-                                self.bot.options["raw-analytics-webhook"],
-                                session=session,
-                            )
-                            await webhook.send(embed=embed)
-                except Exception as e:
-                    logging.error(
-                        f"[ANALYTICS] Failed to send raw analytics webhook - {e}"
-                    )
-        except KeyError:
-            pass
+                    embed.description = f"`/{f'{interaction.command.parent.name} ' if interaction.command.parent is not None else ''}{interaction.command.name}`"
+                except AttributeError:
+                    embed.description = f"`{interaction.command.name}`"
+        except AttributeError:
+            embed.description = f"`{interaction.type}`"
+
+        embed.timestamp = interaction.created_at
+        embed.set_author(
+            name=str(self.bot.user),
+            icon_url=self.bot.user.display_avatar.url,
+        )
+
+        embed.add_field(
+            name="User",
+            value=f"{interaction.user.mention} ({interaction.user.id})",
+        )
+
+        self.enqueue(webhook_url, embed)
 
     # Analytics for server joins
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild):
-        try:
-            # Ignore if there is no webhook
-            if (
-                self.bot.options["analytics-webhook"] is not None
-                and self.bot.options["analytics-webhook"] != ""
-            ):
-                try:
-                    embed = discord.Embed(
-                        title="Joined Server",
-                        color=Color.green(),
-                    )
+        webhook_url = self.get_webhook("analytics-webhook")
 
-                    embed.description = (
-                        f"Titanium has joined **{guild.name}** ({guild.id})."
-                    )
-                    embed.set_thumbnail(url=guild.icon.url if guild.icon else None)
-                    embed.timestamp = guild.created_at
-                    embed.set_author(
-                        name=str(self.bot.user),
-                        icon_url=self.bot.user.display_avatar.url,
-                    )
+        # Ignore if there is no webhook
+        if webhook_url is None:
+            return
 
-                    async with aiohttp.ClientSession() as session:
-                        webhook = discord.Webhook.from_url(
-                            self.bot.options["analytics-webhook"], session=session
-                        )
-                        await webhook.send(embed=embed)
-                except Exception as e:
-                    logging.error(f"[ANALYTICS] Failed to send analytics webhook - {e}")
-        except KeyError:
-            pass
+        embed = discord.Embed(
+            title="Joined Server",
+            color=Color.green(),
+        )
+
+        embed.description = f"Titanium has joined **{guild.name}** ({guild.id})."
+        embed.set_thumbnail(url=guild.icon.url if guild.icon else None)
+        embed.timestamp = guild.created_at
+        embed.set_author(
+            name=str(self.bot.user),
+            icon_url=self.bot.user.display_avatar.url,
+        )
+
+        self.enqueue(webhook_url, embed)
 
     # Analytics for server removes
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild):
-        try:
-            # Ignore if there is no webhook
-            if (
-                self.bot.options["analytics-webhook"] is not None
-                and self.bot.options["analytics-webhook"] != ""
-            ):
-                try:
-                    embed = discord.Embed(
-                        title="Left Server",
-                        color=Color.red(),
-                    )
+        webhook_url = self.get_webhook("analytics-webhook")
 
-                    embed.description = (
-                        f"Titanium has left **{guild.name}** ({guild.id})."
-                    )
-                    embed.set_thumbnail(url=guild.icon.url if guild.icon else None)
-                    embed.timestamp = guild.created_at
-                    embed.set_author(
-                        name=str(self.bot.user),
-                        icon_url=self.bot.user.display_avatar.url,
-                    )
+        # Ignore if there is no webhook
+        if webhook_url is None:
+            return
 
-                    async with aiohttp.ClientSession() as session:
-                        webhook = discord.Webhook.from_url(
-                            self.bot.options["analytics-webhook"], session=session
-                        )
-                        await webhook.send(embed=embed)
-                except Exception as e:
-                    logging.error(f"[ANALYTICS] Failed to send analytics webhook - {e}")
-        except KeyError:
-            pass
+        embed = discord.Embed(
+            title="Left Server",
+            color=Color.red(),
+        )
+
+        embed.description = f"Titanium has left **{guild.name}** ({guild.id})."
+        embed.set_thumbnail(url=guild.icon.url if guild.icon else None)
+        embed.timestamp = guild.created_at
+        embed.set_author(
+            name=str(self.bot.user),
+            icon_url=self.bot.user.display_avatar.url,
+        )
+
+        self.enqueue(webhook_url, embed)
 
 
 async def setup(bot: "TitaniumBot") -> None:
@@ -0,0 +1,227 @@
+import logging
+import time
+from typing import TYPE_CHECKING, Union
+
+import asqlite
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+
+if TYPE_CHECKING:
+    from main import TitaniumBot
+
+
+class CommandMetrics(commands.Cog):
+    # Upper bounds of latency histogram buckets in ms, last bucket catches the rest
+    LATENCY_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, float("inf"))
+
+    # Width of each rolled up row in seconds
+    BUCKET_SECONDS = 3600
+
+    # Seconds before an unfinished interaction is forgotten
+    PENDING_TIMEOUT = 900
+
+    def __init__(self, bot: "TitaniumBot") -> None:
+        self.bot = bot
+        self.metrics_pool: asqlite.Pool = bot.metrics_pool
+
+        # Start times of running commands, by interaction ID
+        self.pending: dict[int, float] = {}
+
+        # Stats not yet written to SQL, by (bucket, command)
+        self.stats: dict[tuple[int, str], dict] = {}
+
+        self.bot.loop.create_task(self.sql_setup())
+        self.rollup.start()
+
+    async def sql_setup(self) -> None:
+        async with self.metrics_pool.acquire() as sql:
+            await sql.execute(
+                "CREATE TABLE IF NOT EXISTS commandStats (bucket INTEGER, command TEXT, invocations INTEGER, errors INTEGER, latencySum REAL, latencyMax REAL, PRIMARY KEY (bucket, command))"
+            )
+            await sql.execute(
+                "CREATE TABLE IF NOT EXISTS commandLatency (bucket INTEGER, command TEXT, le REAL, count INTEGER, PRIMARY KEY (bucket, command, le))"
+            )
+            await sql.commit()
+
+    async def cog_unload(self) -> None:
+        self.rollup.cancel()
+
+        # Write anything left before shutting down
+        try:
+            await self.write_stats()
+        except Exception as e:
+            logging.error(f"[METRICS] Failed to write command stats - {e}")
+
+    # Get full command name, including group for subcommands
+    def get_command_name(
+        self, command: Union[app_commands.Command, app_commands.ContextMenu]
+    ) -> str:
+        if isinstance(command, app_commands.ContextMenu):
+            return command.name
+        else:
+            return f"/{command.qualified_name}"
+
+    # Add a finished command to the in memory stats
+    def record(
+        self,
+        interaction: discord.Interaction,
+        command: Union[app_commands.Command, app_commands.ContextMenu],
+        error: bool,
+    ) -> None:
+        start = self.pending.pop(interaction.id, None)
+
+        if start is not None:
+            latency = (time.monotonic() - start) * 1000
+        else:
+            # Listener missed the interaction, fall back to Discord's timestamp
+            latency = (
+                discord.utils.utcnow() - interaction.created_at
+            ).total_seconds() * 1000
+
+        bucket = int(time.time() // self.BUCKET_SECONDS * self.BUCKET_SECONDS)
+        name = self.get_command_name(command)
+
+        stat = self.stats.setdefault(
+            (bucket, name),
+            {
+                "invocations": 0,
+                "errors": 0,
+                "latency_sum": 0.0,
+                "latency_max": 0.0,
+                "histogram": [0] * len(self.LATENCY_BUCKETS),
+            },
+        )
+
+        stat["invocations"] += 1
+        stat["errors"] += 1 if error else 0
+        stat["latency_sum"] += latency
+        stat["latency_max"] = max(stat["latency_max"], latency)
+
+        for i, le in enumerate(self.LATENCY_BUCKETS):
+            if latency <= le:
+                stat["histogram"][i] += 1
+                break
+
+    # Write in memory stats to SQL
+    async def write_stats(self) -> None:
+        if not self.stats:
+            return
+
+        stats, self.stats = self.stats, {}
+
+        async with self.metrics_pool.acquire() as sql:
+            for (bucket, name), stat in stats.items():
+                await sql.execute(
+                    """INSERT INTO commandStats (bucket, command, invocations, errors, latencySum, latencyMax) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (bucket, command) DO UPDATE SET
+                    invocations = invocations + excluded.invocations,
+                    errors = errors + excluded.errors,
+                    latencySum = latencySum + excluded.latencySum,
+                    latencyMax = MAX(latencyMax, excluded.latencyMax)""",
+                    (
+                        bucket,
+                        name,
+                        stat["invocations"],
+                        stat["errors"],
+                        stat["latency_sum"],
+                        stat["latency_max"],
+                    ),
+                )
+
+                for le, count in zip(self.LATENCY_BUCKETS, stat["histogram"]):
+                    if count == 0:
+                        continue
+
+                    await sql.execute(
+                        """INSERT INTO commandLatency (bucket, command, le, count) VALUES (?, ?, ?, ?)
+                        ON CONFLICT (bucket, command, le) DO UPDATE SET count = count + excluded.count""",
+                        (bucket, name, le, count),
+                    )
+
+            await sql.commit()
+
+    # Get per command stats since a UNIX timestamp, slowest average first
+    async def get_summary(self, since: float) -> list[dict]:
+        # Make sure recent stats are included
+        await self.write_stats()
+
+        summary: dict[str, dict] = {}
+
+        async with self.metrics_pool.acquire() as sql:
+            rows = await sql.fetchall(
+                "SELECT command, SUM(invocations), SUM(errors), SUM(latencySum), MAX(latencyMax) FROM commandStats WHERE bucket >= ? GROUP BY command",
+                (int(since // self.BUCKET_SECONDS * self.BUCKET_SECONDS),),
+            )
+
+            for command, invocations, errors, latency_sum, latency_max in rows:
+                summary[command] = {
+                    "command": command,
+                    "invocations": invocations,
+                    "errors": errors,
+                    "latency_avg_ms": round(latency_sum / invocations, 2)
+                    if invocations
+                    else 0,
+                    "latency_max_ms": round(latency_max, 2),
+                    "histogram": {},
+                }
+
+            rows = await sql.fetchall(
+                "SELECT command, le, SUM(count) FROM commandLatency WHERE bucket >= ? GROUP BY command, le ORDER BY le",
+                (int(since // self.BUCKET_SECONDS * self.BUCKET_SECONDS),),
+            )
+
+            for command, le, count in rows:
+                if command in summary:
+                    summary[command]["histogram"][
+                        "+Inf" if le == float("inf") else str(int(le))
+                    ] = count
+
+        return sorted(
+            summary.values(), key=lambda stat: stat["latency_avg_ms"], reverse=True
+        )
+
+    # Roll up stats to SQL
+    @tasks.loop(minutes=1)
+    async def rollup(self) -> None:
+        try:
+            await self.write_stats()
+        except Exception as e:
+            logging.error(f"[METRICS] Failed to write command stats - {e}")
+
+        # Forget interactions that never finished
+        cutoff = time.monotonic() - self.PENDING_TIMEOUT
+        self.pending = {
+            interaction_id: start
+            for interaction_id, start in self.pending.items()
+            if start > cutoff
+        }
+
+    # Mark command start
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction) -> None:
+        if interaction.type == discord.InteractionType.application_command:
+            self.pending[interaction.id] = time.monotonic()
+
+    # Successful commands
+    @commands.Cog.listener()
+    async def on_app_command_completion(
+        self,
+        interaction: discord.Interaction,
+        command: Union[app_commands.Command, app_commands.ContextMenu],
+    ) -> None:
+        self.record(interaction, command, error=False)
+
+    # Failed commands, dispatched by the tree error handler
+    @commands.Cog.listener()
+    async def on_app_command_error(
+        self,
+        interaction: discord.Interaction,
+        error: app_commands.AppCommandError,
+    ) -> None:
+        if interaction.command is not None:
+            self.record(interaction, interaction.command, error=True)
+
+
+async def setup(bot: "TitaniumBot") -> None:
+    await bot.add_cog(CommandMetrics(bot))
@@ -0,0 +1,181 @@
+import asyncio
+import collections
+import datetime
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING
+
+import discord
+from discord import Color
+from discord.ext import commands
+
+if TYPE_CHECKING:
+    from main import TitaniumBot
+
+
+class LoopMonitor(commands.Cog):
+    # Seconds between lag samples
+    INTERVAL = 0.5
+
+    # Lag in seconds before a sample counts as a stall
+    STALL_THRESHOLD = 0.25
+
+    # Seconds between watchdog checks
+    WATCHDOG_INTERVAL = 0.05
+
+    # Min seconds between stall reports sent to the error webhook
+    WEBHOOK_COOLDOWN = 60
+
+    def __init__(self, bot: "TitaniumBot") -> None:
+        self.bot = bot
+
+        self.lag = self.bot.metrics.gauge(
+            "titanium_event_loop_lag_seconds", "Most recent event loop lag sample."
+        )
+        self.lag_histogram = self.bot.metrics.histogram(
+            "titanium_event_loop_lag_histogram_seconds",
+            "Event loop lag samples.",
+            buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+        )
+        self.stall_count = self.bot.metrics.counter(
+            "titanium_event_loop_stalls_total", "Event loop stalls over the threshold."
+        )
+
+        # Recent stalls, newest last
+        self.stalls: collections.deque[dict] = collections.deque(maxlen=50)
+
+        # Whether to report stalls to the error webhook
+        try:
+            self.report_stalls = (
+                self.bot.options["loop-stall-webhook"] == "True"
+                and self.bot.options["error-webhook"] != ""
+            )
+        except KeyError:
+            self.report_stalls = False
+
+        self.last_report = 0.0
+
+        # Shared with the watchdog thread
+        self.loop_thread_id = threading.get_ident()
+        self.heartbeat = time.monotonic()
+        self.sample: dict | None = None
+        self.stopped = threading.Event()
+
+        self.watchdog_thread = threading.Thread(
+            target=self.watchdog, name="titanium-loop-watchdog", daemon=True
+        )
+        self.watchdog_thread.start()
+
+        self.monitor_task = self.bot.loop.create_task(self.monitor())
+
+    def cog_unload(self) -> None:
+        self.monitor_task.cancel()
+        self.stopped.set()
+
+    # Measure how late the loop wakes us up after sleeping
+    async def monitor(self) -> None:
+        while True:
+            start = time.perf_counter()
+            self.heartbeat = time.monotonic()
+
+            await asyncio.sleep(self.INTERVAL)
+
+            self.heartbeat = time.monotonic()
+            lag = max(0.0, time.perf_counter() - start - self.INTERVAL)
+
+            self.lag.set(lag)
+            self.lag_histogram.observe(lag)
+
+            # Watchdog caught what was running during the stall
+            sample, self.sample = self.sample, None
+
+            if lag >= self.STALL_THRESHOLD:
+                self.record_stall(lag, sample)
+
+    # Runs in a separate thread, samples the loop thread while it is stuck
+    def watchdog(self) -> None:
+        while not self.stopped.wait(self.WATCHDOG_INTERVAL):
+            if self.sample is not None:
+                continue
+
+            if time.monotonic() - self.heartbeat < self.INTERVAL + self.STALL_THRESHOLD:
+                continue
+
+            frame = sys._current_frames().get(self.loop_thread_id)
+
+            if frame is None:
+                continue
+
+            try:
+                task = asyncio.current_task(self.bot.loop)
+            except RuntimeError:
+                task = None
+
+            self.sample = {
+                "task": task.get_name() if task is not None else None,
+                "coro": task.get_coro().__qualname__
+                if task is not None and task.get_coro() is not None
+                else None,
+                "stack": "".join(traceback.format_stack(frame)),
+            }
+
+    def record_stall(self, lag: float, sample: dict | None) -> None:
+        stall = {
+            "time": datetime.datetime.now().timestamp(),
+            "duration": round(lag, 3),
+            "task": sample["task"] if sample else None,
+            "coro": sample["coro"] if sample else None,
+            "stack": sample["stack"] if sample else None,
+        }
+
+        self.stalls.append(stall)
+        self.stall_count.inc()
+
+        logging.warning(
+            f"[LOOP] Event loop stalled for {lag:.3f}s (task: {stall['task']}, coro: {stall['coro']})"
+        )
+
+        if stall["stack"] is not None:
+            logging.warning(f"[LOOP] Stack during stall:\n{stall['stack']}")
+
+        if self.report_stalls and time.monotonic() - self.last_report > (
+            self.WEBHOOK_COOLDOWN
+        ):
+            self.last_report = time.monotonic()
+            self.bot.loop.create_task(self.send_stall(stall))
+
+    # Send a stall report to the error webhook
+    async def send_stall(self, stall: dict) -> None:
+        stack = stall["stack"] or "No stack captured."
+
+        # Keep the innermost frames, where the loop was blocked
+        if len(stack) > 4000:
+            stack = "..." + stack[-3997:]
+
+        embed = discord.Embed(
+            title="Event Loop Stall",
+            description=f"```python\n{stack}\n```",
+            color=Color.orange(),
+        )
+
+        embed.timestamp = datetime.datetime.now()
+        embed.set_author(name=str(self.bot.user))
+
+        embed.add_field(name="Duration", value=f"{stall['duration']}s")
+        embed.add_field(name="Task", value=f"`{stall['task']}`")
+        embed.add_field(name="Coroutine", value=f"`{stall['coro']}`")
+
+        try:
+            webhook = discord.Webhook.from_url(
+                self.bot.options["error-webhook"], session=self.bot.session
+            )
+            await webhook.send(embed=embed)
+        except Exception as e:
+            logging.error(f"[LOOP] Failed to send stall to webhook - {e}")
+
+
+async def setup(bot: "TitaniumBot") -> None:
+    await bot.add_cog(LoopMonitor(bot))
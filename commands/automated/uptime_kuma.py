@@ -3,7 +3,6 @@ import logging
 import traceback
 from typing import TYPE_CHECKING
 
-import aiohttp
 from discord.ext import commands, tasks
 
 if TYPE_CHECKING:
@@ -43,52 +42,51 @@ class UptimeKuma(commands.Cog):
         await self.bot.wait_until_ready()
 
         # Send info to Uptime Kuma server
-        async with aiohttp.ClientSession() as session:
-            retry = 0
-
-            while retry < 3:
-                try:
-                    if retry > 0:
-                        logging.debug(f"[KUMA] Retrying ping... (retry {retry})")
-
-                    # Ok if the bot is connected or if it was disconnected less than or 3 seconds ago
-                    if self.bot.connected or (
-                        not self.bot.connected
-                        and (datetime.datetime.now() - self.bot.last_disconnect).seconds
-                        <= 3
-                    ):
-                        async with await session.get(
-                            f"{self.bot.options['uptime-kuma-push']}?status=up&msg=OK&ping={round(self.bot.latency * 1000, 2)}"
-                        ) as req:
-                            json = await req.json()
-
-                            if json["ok"]:
-                                return
-                            else:
-                                logging.debug(
-                                    f"[KUMA] Ping failed (status: {json}), trying again."
-                                )
-                                retry += 1
-                    else:
-                        async with await session.get(
-                            f"{self.bot.options['uptime-kuma-push']}?status=down&msg=DISCONNECTED"
-                        ) as req:
-                            json = await req.json()
-
-                            if json["ok"]:
-                                return
-                            else:
-                                logging.debug(
-                                    f"[KUMA] Ping failed (status: {json}), trying again."
-                                )
-                                retry += 1
-                except Exception:
-                    logging.debug("[KUMA] Ping failed. Trying again.")
-                    logging.debug(traceback.format_exc())
-                    retry += 1
-
-            logging.error("[KUMA] Ping failed 3 times, giving up this time.\n")
-            return
+        retry = 0
+
+        while retry < 3:
+            try:
+                if retry > 0:
+                    logging.debug(f"[KUMA] Retrying ping... (retry {retry})")
+
+                # Ok if the bot is connected or if it was disconnected less than or 3 seconds ago
+                if self.bot.connected or (
+                    not self.bot.connected
+                    and (datetime.datetime.now() - self.bot.last_disconnect).seconds
+                    <= 3
+                ):
+                    async with await self.bot.session.get(
+                        f"{self.bot.options['uptime-kuma-push']}?status=up&msg=OK&ping={round(self.bot.latency * 1000, 2)}"
+                    ) as req:
+                        json = await req.json()
+
+                        if json["ok"]:
+                            return
+                        else:
+                            logging.debug(
+                                f"[KUMA] Ping failed (status: {json}), trying again."
+                            )
+                            retry += 1
+                else:
+                    async with await self.bot.session.get(
+                        f"{self.bot.options['uptime-kuma-push']}?status=down&msg=DISCONNECTED"
+                    ) as req:
+                        json = await req.json()
+
+                        if json["ok"]:
+                            return
+                        else:
+                            logging.debug(
+                                f"[KUMA] Ping failed (status: {json}), trying again."
+                            )
+                            retry += 1
+            except Exception:
+                logging.debug("[KUMA] Ping failed. Trying again.")
+                logging.debug(traceback.format_exc())
+                retry += 1
+
+        logging.error("[KUMA] Ping failed 3 times, giving up this time.\n")
+        return
 
 
 async def setup(bot: "TitaniumBot") -> None:
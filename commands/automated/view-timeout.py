@@ -1,5 +1,3 @@
-import asyncio
-
 import discord
 from discord import Color
 from discord.ext import commands
@@ -9,57 +7,64 @@ class ViewTimeout(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    # Check if a component belongs to a view that is still listening.
+    # discord.py keeps live views by message ID (None for persistent views)
+    # and custom ID, and drops them when they stop or time out. It routes the
+    # interaction before on_interaction is dispatched, so this sees the same
+    # views it did.
+    def has_live_view(self, interaction: discord.Interaction) -> bool:
+        store = self.bot._connection._view_store
+        custom_id = interaction.data["custom_id"]
+        key = (interaction.data["component_type"], custom_id)
+
+        if interaction.message is not None and key in store._views.get(
+            interaction.message.id, {}
+        ):
+            return True
+
+        if key in store._views.get(None, {}):
+            return True
+
+        return any(pattern.fullmatch(custom_id) for pattern in store._dynamic_items)
+
     # Listen for Interaction
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
-        # Wait a second to give a chance to other commands
-        await asyncio.sleep(2)
+        # Only components can expire, commands and modals are always handled
+        if interaction.type != discord.InteractionType.component:
+            return
 
-        try:
-            # If this succeeds, no one has responded, it's probably timed out
-            await interaction.response.defer(ephemeral=True)
-        except (
-            discord.errors.InteractionResponded,
-            discord.errors.HTTPException,
-            discord.errors.NotFound,
-        ):
+        if self.has_live_view(interaction):
             return
 
+        embed = discord.Embed(
+            title="Error",
+            description="This view has expired. Please run the command again.",
+            color=Color.red(),
+        )
+
         try:
-            # Get original response, disable all buttons
-            response = await interaction.original_response()
-            view = discord.ui.View.from_message(response)
+            if interaction.message is not None:
+                # Disable all buttons on the expired message
+                view = discord.ui.View.from_message(interaction.message)
 
-            for item in view.children:
-                try:
-                    if item.style != discord.ButtonStyle.url:
+                for item in view.children:
+                    try:
+                        if item.style != discord.ButtonStyle.url:
+                            item.disabled = True
+                    except Exception:
                         item.disabled = True
-                except Exception:
-                    item.disabled = True
-
-            try:
-                # Edit the message
-                await response.edit(view=view)
-            except discord.errors.HTTPException:
-                pass
 
-            # Send an error
-            embed = discord.Embed(
-                title="Error",
-                description="This view has expired. Please run the command again.",
-                color=Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+                await interaction.response.edit_message(view=view)
+                await interaction.followup.send(embed=embed, ephemeral=True)
+            else:
+                await interaction.response.send_message(embed=embed, ephemeral=True)
         except (
-            discord.errors.NotFound
-        ):  # Can't find the original message, skip disabling buttons
-            # Send an error
-            embed = discord.Embed(
-                title="Error",
-                description="This view has expired. Please run the command again.",
-                color=Color.red(),
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            discord.errors.InteractionResponded,
+            discord.errors.HTTPException,
+            discord.errors.NotFound,
+        ):
+            return
 
 
 async def setup(bot):
@@ -1,4 +1,3 @@
-import os
 from io import BytesIO
 
 import aiohttp
@@ -8,6 +7,15 @@ from discord.ext import commands
 from discord.ui import View
 from PIL import Image
 
+from utils.image_assets import get_asset, get_hat, get_snow_layer
+
+# Max source image pixels for the image command, checked before decoding
+PIXEL_BUDGET = 36_000_000
+
+
+class ImageTooLargeError(Exception):
+    pass
+
 
 def invert(num: int):
     if num > 0:
@@ -18,6 +26,163 @@ def invert(num: int):
         return 0
 
 
+def _christmas_pfp(
+    image_data: bytes,
+    hat: bool,
+    snow: bool,
+    hat_size: int,
+    position: str,
+    x_offset: int,
+    y_offset: int,
+    rotation: int,
+) -> bytes:
+    output_data = BytesIO()
+
+    with Image.open(BytesIO(image_data)) as img:
+        # Resize to 256px x 256px while maintianing aspect ratio
+        width = 256
+        height = width * img.height // img.width
+
+        img.thumbnail((width, height), Image.Resampling.LANCZOS)
+
+        # Christmas hat
+        if hat:
+            # Resize the hat to fit the head - maintain aspect ratio
+            hat_asset = get_asset("hat.png")
+            new_hat_width = hat_asset.width // hat_size
+            new_hat_height = hat_asset.height // hat_size
+
+            # Get scaled and rotated hat from the asset cache
+            hat_img = get_hat((new_hat_width, new_hat_height), rotation)
+
+            # Calculate positions based on hat size
+            positions = {
+                "topleft": (0, 0),
+                "topmiddle": ((img.width - new_hat_width) // 2, 0),
+                "topright": (img.width - new_hat_width, 0),
+                "bottomleft": (0, img.height - new_hat_height),
+                "bottommiddle": (
+                    (img.width - new_hat_width) // 2,
+                    img.height - new_hat_height,
+                ),
+                "bottomright": (
+                    img.width - new_hat_width,
+                    img.height - new_hat_height,
+                ),
+            }
+
+            # Place hat at calculated position
+            base_x, base_y = positions[position]
+
+            # Adjust vertical position for large hat
+            if position.startswith("top") and hat_size == 2:
+                base_y = base_y + 80
+
+            # Get base position and apply offsets
+            base_x, base_y = positions[position]
+            final_x = base_x + x_offset
+            final_y = base_y + invert(y_offset)
+
+            img.paste(hat_img, (final_x, final_y), hat_img)
+
+        # Snow overlay
+        if snow:
+            snow_img = get_asset("snow.png")
+            img.paste(snow_img, (0, 0), snow_img)
+
+        # Save image
+        img.save(output_data, format="PNG")
+
+    return output_data.getvalue()
+
+
+def _christmas_image(
+    image_data: bytes,
+    hat: bool,
+    snow: bool,
+    hat_width: int,
+    position: str,
+    x_offset: int,
+    y_offset: int,
+    rotation: int,
+) -> bytes:
+    output_data = BytesIO()
+
+    # Reject large images from the header, before anything is decoded
+    try:
+        img = Image.open(BytesIO(image_data))
+    except Image.DecompressionBombError:
+        raise ImageTooLargeError
+
+    if img.width * img.height > PIXEL_BUDGET:
+        img.close()
+        raise ImageTooLargeError
+
+    with img:
+        # Christmas hat
+        if hat:
+            hat_asset = get_asset("hat.png")
+
+            # Set width to half of image width if not specified
+            if hat_width == 0:
+                hat_width = img.width // 2
+
+            # Resize to new size while maintianing aspect ratio
+            new_hat_width = hat_width
+            new_hat_height = new_hat_width * hat_asset.height // hat_asset.width
+
+            # Get scaled and rotated hat from the asset cache
+            hat_img = get_hat((new_hat_width, new_hat_height), rotation)
+
+            # Calculate positions based on hat size
+            positions = {
+                "topleft": (0, 0),
+                "topmiddle": ((img.width - new_hat_width) // 2, 0),
+                "topright": (img.width - new_hat_width, 0),
+                "middleleft": (0, (img.height - new_hat_height) // 2),
+                "middle": (
+                    (img.width - new_hat_width) // 2,
+                    (img.height - new_hat_height) // 2,
+                ),
+                "middleright": (
+                    img.width - new_hat_width,
+                    (img.height - new_hat_height) // 2,
+                ),
+                "bottomleft": (0, img.height - new_hat_height),
+                "bottommiddle": (
+                    (img.width - new_hat_width) // 2,
+                    img.height - new_hat_height,
+                ),
+                "bottomright": (
+                    img.width - new_hat_width,
+                    img.height - new_hat_height,
+                ),
+            }
+
+            # Place hat at calculated position
+            base_x, base_y = positions[position]
+
+            # Get base position and apply offsets
+            base_x, base_y = positions[position]
+            final_x = base_x + x_offset
+            final_y = base_y + invert(y_offset)
+
+            img.paste(hat_img, (final_x, final_y), hat_img)
+
+        # Snow overlay
+        if snow:
+            # Get snow tiled over the image from the asset cache
+            snow_layer = get_snow_layer(img.size)
+
+            # Put snow layer on top of image
+            img.paste(snow_layer, (0, 0), snow_layer)
+
+        # Save image
+        img.save(output_data, format="PNG")
+
+    return output_data.getvalue()
+
+
 class Christmas(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -121,70 +286,18 @@ class Christmas(commands.Cog):
 
                 image_data.seek(0)
 
-        output_data = BytesIO()
-
-        with Image.open(image_data) as img:
-            # Resize to 256px x 256px while maintianing aspect ratio
-            width = 256
-            height = width * img.height // img.width
-
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-
-            # Christmas hat
-            if hat:
-                with Image.open(os.path.join("content", "hat.png")) as hat_img:
-                    # Resize the hat to fit the head - maintain aspect ratio
-                    new_hat_width = hat_img.width // hat_size.value
-                    new_hat_height = hat_img.height // hat_size.value
-                    hat_img = hat_img.resize(
-                        (new_hat_width, new_hat_height), Image.Resampling.LANCZOS
-                    )
-
-                    # Rotate if needed
-                    if rotation != 0:
-                        hat_img = hat_img.rotate(
-                            rotation, expand=True, resample=Image.Resampling.BICUBIC
-                        )
-
-                    # Calculate positions based on hat size
-                    positions = {
-                        "topleft": (0, 0),
-                        "topmiddle": ((img.width - new_hat_width) // 2, 0),
-                        "topright": (img.width - new_hat_width, 0),
-                        "bottomleft": (0, img.height - new_hat_height),
-                        "bottommiddle": (
-                            (img.width - new_hat_width) // 2,
-                            img.height - new_hat_height,
-                        ),
-                        "bottomright": (
-                            img.width - new_hat_width,
-                            img.height - new_hat_height,
-                        ),
-                    }
-
-                    # Place hat at calculated position
-                    base_x, base_y = positions[position.value]
-
-                    # Adjust vertical position for large hat
-                    if position.value.startswith("top") and hat_size.value == 2:
-                        base_y = base_y + 80
-
-                    # Get base position and apply offsets
-                    base_x, base_y = positions[position.value]
-                    final_x = base_x + x_offset
-                    final_y = base_y + invert(y_offset)
-
-                    img.paste(hat_img, (final_x, final_y), hat_img)
-
-            # Snow overlay
-            if snow:
-                with Image.open(os.path.join("content", "snow.png")) as snow:
-                    img.paste(snow, (0, 0), snow)
-
-            # Save image
-            img.save(output_data, format="PNG")
-
-        output_data.seek(0)
+        output_data = await self.bot.image_pool.run(
+            interaction.user.id,
+            _christmas_pfp,
+            image_data=image_data.getvalue(),
+            hat=hat,
+            snow=snow,
+            hat_size=hat_size.value,
+            position=position.value,
+            x_offset=x_offset,
+            y_offset=y_offset,
+            rotation=rotation,
+        )
 
         # Create embed, add attachment
         embed = discord.Embed(
@@ -202,7 +315,9 @@ class Christmas(commands.Cog):
             icon_url=interaction.user.display_avatar.url,
         )
 
-        file_processed = discord.File(fp=output_data, filename="titanium_image.png")
+        file_processed = discord.File(
+            fp=BytesIO(output_data), filename="titanium_image.png"
+        )
 
         # Send Embed
         msg = await interaction.followup.send(
@@ -282,6 +397,25 @@ class Christmas(commands.Cog):
         if position is None:
             position = app_commands.Choice(name="Top Middle", value="topmiddle")
 
+        # Check image size before downloading
+        if (
+            file.width is not None
+            and file.height is not None
+            and file.width * file.height > PIXEL_BUDGET
+        ):
+            embed = discord.Embed(
+                title="Error",
+                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGET // 1000000} megapixels.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
+
         if (
             file.content_type.split("/")[0] == "image"
             and file.content_type.split("/")[1] != "gif"
@@ -297,8 +431,6 @@ class Christmas(commands.Cog):
                             image_data.write(chunk)
 
                         image_data.seek(0)
-
-                output_data = BytesIO()
             else:  # If file is too large
                 embed = discord.Embed(
                     title="Error",
@@ -326,80 +458,32 @@ class Christmas(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
             return
 
-        with Image.open(image_data) as img:
-            # Christmas hat
-            if hat:
-                with Image.open(os.path.join("content", "hat.png")) as hat_img:
-                    # Set width to half of image width if not specified
-                    if hat_width == 0:
-                        hat_width = img.width // 2
-
-                    # Resize to new size while maintianing aspect ratio
-                    new_hat_width = hat_width
-                    new_hat_height = new_hat_width * hat_img.height // hat_img.width
-                    hat_img = hat_img.resize(
-                        (new_hat_width, new_hat_height), Image.Resampling.LANCZOS
-                    )
-
-                    # Rotate if needed
-                    if rotation != 0:
-                        hat_img = hat_img.rotate(
-                            rotation, expand=True, resample=Image.Resampling.BICUBIC
-                        )
-
-                    # Calculate positions based on hat size
-                    positions = {
-                        "topleft": (0, 0),
-                        "topmiddle": ((img.width - new_hat_width) // 2, 0),
-                        "topright": (img.width - new_hat_width, 0),
-                        "middleleft": (0, (img.height - new_hat_height) // 2),
-                        "middle": (
-                            (img.width - new_hat_width) // 2,
-                            (img.height - new_hat_height) // 2,
-                        ),
-                        "middleright": (
-                            img.width - new_hat_width,
-                            (img.height - new_hat_height) // 2,
-                        ),
-                        "bottomleft": (0, img.height - new_hat_height),
-                        "bottommiddle": (
-                            (img.width - new_hat_width) // 2,
-                            img.height - new_hat_height,
-                        ),
-                        "bottomright": (
-                            img.width - new_hat_width,
-                            img.height - new_hat_height,
-                        ),
-                    }
-
-                    # Place hat at calculated position
-                    base_x, base_y = positions[position.value]
-
-                    # Get base position and apply offsets
-                    base_x, base_y = positions[position.value]
-                    final_x = base_x + x_offset
-                    final_y = base_y + invert(y_offset)
-
-                    img.paste(hat_img, (final_x, final_y), hat_img)
-
-            # Snow overlay
-            if snow:
-                with Image.open(os.path.join("content", "snow.png")) as snowImg:
-                    # Create snow layer
-                    snow_layer = Image.new("RGBA", img.size)
-
-                    # Tile snow overlay over image
-                    for x in range(0, img.width, snowImg.width):
-                        for y in range(0, img.height, snowImg.height):
-                            snow_layer.paste(snowImg, (x, y))
-
-                    # Put snow layer on top of image
-                    img.paste(snow_layer, (0, 0), snow_layer)
-
-            # Save image
-            img.save(output_data, format="PNG")
-
-        output_data.seek(0)
+        try:
+            output_data = await self.bot.image_pool.run(
+                interaction.user.id,
+                _christmas_image,
+                image_data=image_data.getvalue(),
+                hat=hat,
+                snow=snow,
+                hat_width=hat_width,
+                position=position.value,
+                x_offset=x_offset,
+                y_offset=y_offset,
+                rotation=rotation,
+            )
+        except ImageTooLargeError:
+            embed = discord.Embed(
+                title="Error",
+                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGET // 1000000} megapixels.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
 
         # Create embed, add attachment
         embed = discord.Embed(title="Christmas Image", color=Color.random())
@@ -409,7 +493,9 @@ class Christmas(commands.Cog):
             icon_url=interaction.user.display_avatar.url,
         )
 
-        file_processed = discord.File(fp=output_data, filename="titanium_image.png")
+        file_processed = discord.File(
+            fp=BytesIO(output_data), filename="titanium_image.png"
+        )
 
         # Send Embed
         msg = await interaction.followup.send(
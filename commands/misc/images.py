@@ -1,18 +1,31 @@
 import asyncio
+import functools
+import logging
 import os
 import random
 import re
 import textwrap
 from io import BytesIO
+from typing import Callable
 
 import aiohttp
 import discord
 import pillow_avif  # noqa: F401
 from discord import Color, app_commands
 from discord.ext import commands
-from PIL import Image, ImageChops, ImageEnhance, ImageFont, ImageOps
+from PIL import (
+    Image,
+    ImageChops,
+    ImageEnhance,
+    ImageFont,
+    ImageOps,
+    UnidentifiedImageError,
+)
 from pilmoji import Pilmoji
-from wand.image import Image as WandImage
+
+from utils.gif_encoder import convert_to_gif, save_gif
+from utils.image_assets import get_speech_border, get_speech_bubble
+from utils.image_pool import ImageQueueFullError, busy_embed
 
 
 class InvalidFormatError(Exception):
@@ -27,7 +40,488 @@ class OperationTooLargeError(Exception):
     pass
 
 
+class ImageTooLargeError(Exception):
+    pass
+
+
+# Max source image pixels per command, checked before decoding
+PIXEL_BUDGETS = {
+    "resize": 64_000_000,
+    "convert": 64_000_000,
+    "deepfry": 36_000_000,
+    "speechbubble": 36_000_000,
+    "caption": 36_000_000,
+}
+
+
+# Check the size Discord reports for an attachment, so it isn't downloaded
+def _over_budget(file: discord.Attachment, command: str) -> bool:
+    if file.width is None or file.height is None:
+        return False
+
+    return file.width * file.height > PIXEL_BUDGETS[command]
+
+
+# Open an image, rejecting it from the header before anything is decoded.
+# With a draft size, JPEGs decode at the smallest scale that still covers it
+def _open_image(
+    image_data: bytes, command: str, draft_size: tuple[int, int] | None = None
+) -> Image.Image:
+    try:
+        im = Image.open(BytesIO(image_data))
+    except Image.DecompressionBombError:
+        raise ImageTooLargeError
+
+    if im.width * im.height > PIXEL_BUDGETS[command]:
+        im.close()
+        raise ImageTooLargeError
+
+    if draft_size is not None and draft_size[0] > 0 and draft_size[1] > 0:
+        im.draft(None, draft_size)
+
+    return im
+
+
+# Max pixels across all frames of an animated image, bounds memory use
+MAX_ANIMATED_PIXELS = 150_000_000
+
+
+# Raise OperationTooLargeError if an animated output would use too much memory
+def _check_animated_size(im: Image.Image, width: int, height: int) -> None:
+    if width * height * getattr(im, "n_frames", 1) > MAX_ANIMATED_PIXELS:
+        raise OperationTooLargeError
+
+
+class _FrameWindow(Image.Image):
+    """Every frame of an animated image after the first, transformed lazily.
+
+    Encoders seek through append images like multi-frame files, so each seek
+    decodes and transforms one source frame in place. Only the current frame
+    is kept, rather than a list of every transformed frame.
+    """
+
+    def __init__(
+        self,
+        im: Image.Image,
+        transform: Callable[[Image.Image], Image.Image],
+        on_frame: Callable[[Image.Image], None],
+    ) -> None:
+        super().__init__()
+        self.source = im
+        self.transform = transform
+        self.on_frame = on_frame
+        self.n_frames = im.n_frames - 1
+        self.frame = -1
+
+        self.seek(0)
+
+    def seek(self, frame: int) -> None:
+        if frame == self.frame:
+            return
+
+        if not 0 <= frame < self.n_frames:
+            raise EOFError
+
+        self.source.seek(frame + 1)
+        self.on_frame(self.source)
+
+        output = self.transform(self.source)
+        self.im = output.im
+        self._mode = output.mode
+        self._size = output.size
+        self.info = output.info
+        self.frame = frame
+
+    def tell(self) -> int:
+        return self.frame
+
+
+# Save every frame of an animated image, transforming frames one at a time
+def _save_animated(
+    im: Image.Image,
+    output_data: BytesIO,
+    format: str,
+    transform: Callable[[Image.Image], Image.Image],
+) -> tuple[int, int]:
+    # Filled in as frames are read, encoders only look up a frame's
+    # timing after reading it
+    durations = []
+    disposals = []
+
+    def on_frame(frame: Image.Image) -> None:
+        durations.append(frame.info.get("duration", 100))
+        disposals.append(getattr(frame, "disposal_method", 0))
+
+    im.seek(0)
+    on_frame(im)
+    first_frame = transform(im)
+
+    first_frame.save(
+        output_data,
+        format=format,
+        save_all=True,
+        append_images=[_FrameWindow(im, transform, on_frame)]
+        if im.n_frames > 1
+        else [],
+        duration=durations,
+        loop=0,
+        **({"disposal": disposals} if format == "GIF" else {}),
+    )
+
+    return first_frame.size
+
+
+# Decoded NASA letter tiles, the set of tiles is small and fixed
+@functools.cache
+def _nasa_tile(path: str) -> Image.Image:
+    with Image.open(path) as tile:
+        return tile.convert("RGB")
+
+
+def _generate_nasa(tiles: list[str]) -> tuple[bytes, tuple[int, int]]:
+    width = (272 * len(tiles)) + (20 * len(tiles)) - 20
+    output_img = Image.new(mode="RGBA", size=[width, 676])
+
+    for i, tile in enumerate(tiles):
+        output_img.paste(_nasa_tile(tile), ((i * 272) + (20 * i), 0))
+
+    output_data = BytesIO()
+    output_img.save(output_data, format="PNG")
+
+    return output_data.getvalue(), (output_img.width, output_img.height)
+
+
+def _resize_image(
+    image_data: bytes,
+    width: int,
+    height: int,
+    format: str,
+) -> tuple[bytes, tuple[int, int]]:
+    # Open image
+    with _open_image(image_data, "resize", (int(width), int(height))) as im:
+        # Resize image, reducing by whole factors first when shrinking a lot
+        resized_image = im.resize((int(width), int(height)), reducing_gap=3.0)
+
+        resized_image_data = BytesIO()
+
+        # Save resized image
+        resized_image.save(
+            resized_image_data,
+            format=format.upper().replace("JPG", "JPEG"),
+        )
+
+        new_size = resized_image.size
+    return resized_image_data.getvalue(), new_size
+
+
+def _convert_image(
+    image_data: bytes,
+    format: str,
+) -> tuple[bytes, tuple[int, int]]:
+    output_data = BytesIO()
+
+    if format == "GIF":
+        try:
+            with _open_image(image_data, "convert") as im:
+                _check_animated_size(im, im.width, im.height)
+
+                # Convert to GIF with pillow
+                output_size = save_gif(im, output_data)
+        except UnidentifiedImageError:
+            # Pillow can't read this format, convert with wand instead
+            return convert_to_gif(image_data)
+    elif format == "AVIF*":
+        with _open_image(image_data, "convert") as im:
+            # Convert image to GIF
+            im.save(
+                output_data,
+                format="AVIF",
+                append_images=[im],
+                save_all=True,
+                duration=500,
+                loop=0,
+            )
+            output_size = im.size
+    else:
+        # Convert with pillow
+        with _open_image(image_data, "convert") as im:
+            if getattr(im, "is_animated", False) and format in ("PNG", "WEBP", "AVIF"):
+                _check_animated_size(im, im.width, im.height)
+
+                # Keep animation, converting frames as they're encoded
+                output_size = _save_animated(
+                    im, output_data, format, lambda frame: frame.convert("RGBA")
+                )
+            else:
+                im.save(output_data, format=format)
+                output_size = im.size
+    return output_data.getvalue(), output_size
+
+
+def _deepfry_image(
+    image_data: bytes,
+    intensity_scale: float,
+    red_filter: bool,
+) -> tuple[bytes, tuple[int, int]]:
+    # Open image
+    with _open_image(image_data, "deepfry") as img:
+        # Crediit: https://github.com/Ovyerus/deeppyer
+        # MIT Licence - https://github.com/Ovyerus/deeppyer/blob/master/LICENSE
+
+        # Deepfry image, the first step shrinks it so JPEGs can decode smaller
+        width, height = img.width, img.height
+        img.draft("RGB", (int(width**0.75), int(height**0.75)))
+        img = img.convert("RGB")
+        img = img.resize(
+            (int(width**0.75), int(height**0.75)),
+            resample=Image.LANCZOS,
+            reducing_gap=3.0,
+        )
+        img = img.resize((int(width**0.88), int(height**0.88)), resample=Image.BILINEAR)
+        img = img.resize((int(width**0.9), int(height**0.9)), resample=Image.BICUBIC)
+        img = img.resize((width, height), resample=Image.BICUBIC)
+        img = ImageOps.posterize(img, 4)
+
+        # Generate colour overlay
+        r = img.split()[0]
+        r = ImageEnhance.Contrast(r).enhance(
+            1.0 + intensity_scale
+        )  # Scale from 1.0 to 2.0
+        r = ImageEnhance.Brightness(r).enhance(
+            1.0 + (0.5 * intensity_scale)
+        )  # Scale from 1.0 to 1.5
+
+        if red_filter:
+            colours = ((254, 0, 2), (255, 255, 15))
+            r = ImageOps.colorize(r, colours[0], colours[1])
+        else:
+            r = img.copy()
+
+        # Blend scaled from 0 to 0.75
+        img = Image.blend(img, r, 0.75 * intensity_scale)
+
+        # Sharpness scaled from 1.0 to 100.0
+        img = ImageEnhance.Sharpness(img).enhance(1.0 + (99.0 * intensity_scale))
+
+        deepfried_data = BytesIO()
+
+        # Save image
+        img.save(deepfried_data, format="PNG")
+        output_size = img.size
+    return deepfried_data.getvalue(), output_size
+
+
+def _speech_bubble_image(
+    image_data: bytes,
+    colour: str,
+    direction: str,
+    format: str,
+) -> tuple[bytes, tuple[int, int]]:
+    output_data = BytesIO()
+
+    # Open image
+    with _open_image(image_data, "speechbubble") as im:
+        im = im.convert("RGBA")
+
+        # Get scaled speech bubble from the asset cache
+        bubble = get_speech_bubble(im.size, direction, colour)
+
+        if colour == "transparent":
+            # Subtract bubble shape from image
+            output_image = ImageChops.subtract_modulo(im, bubble)
+
+            # Add white speech bubble border
+            bubble_border = get_speech_border(im.size, direction)
+            output_image.paste(bubble_border, (0, 0), bubble_border)
+
+            if format == "AVIF":
+                # Save image to AVIF
+                output_image.save(
+                    output_data,
+                    format="AVIF",
+                    append_images=[output_image],
+                    save_all=True,
+                    duration=500,
+                    loop=0,
+                )
+                output_size = output_image.size
+            elif format == "GIF":
+                # Save image as GIF
+                output_size = save_gif(output_image, output_data)
+            else:
+                # Save image
+                output_image.save(output_data, format="PNG")
+                output_size = output_image.size
+        else:
+            with Image.new("RGBA", im.size) as output_image:
+                # Add speech bubble
+                output_image.paste(im, (0, 0))
+                output_image.paste(bubble, (0, 0), bubble.getchannel("A"))
+
+                if format == "AVIF":
+                    # Save image to AVIF
+                    output_image.save(
+                        output_data,
+                        format="AVIF",
+                        append_images=[output_image],
+                        save_all=True,
+                        duration=500,
+                        loop=0,
+                    )
+                    output_size = output_image.size
+                else:
+                    # Save image
+                    output_image.save(output_data, format=format)
+                    output_size = output_image.size
+    return output_data.getvalue(), output_size
+
+
+# Fonts are loaded once per size
+@functools.lru_cache(maxsize=64)
+def _caption_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(font_path, size)
+
+
+# Render a caption on a white banner the width of the image
+def _caption_banner(caption: str, font: str, width: int) -> Image.Image:
+    wrapped_text = textwrap.fill(caption, width=(width // 13))
+    font_path = os.path.join("content", "fonts", font)
+
+    with Pilmoji(Image.new("RGBA", (1, 1))) as pilmoji:
+
+        def text_size(size: int) -> tuple[int, int]:
+            return pilmoji.getsize(
+                wrapped_text,
+                font=_caption_font(font_path, size),
+                emoji_scale_factor=0.8,
+            )
+
+        # Find the largest font size that fits, starting from width / 11
+        low, high = 1, max(1, width // 11)
+        size = text_size(high)
+
+        if size[0] > width - 20:
+            while low < high - 1:
+                middle = (low + high) // 2
+
+                if text_size(middle)[0] <= width - 20:
+                    low = middle
+                else:
+                    high = middle
+
+            size = text_size(low)
+            font_size = low
+        else:
+            font_size = high
+
+    TEXT_WIDTH = size[0]
+    TEXT_HEIGHT = size[1]
+
+    # Scale padding based on image width for smaller images
+    if width < 500:
+        # For small images, reduce the extra padding
+        padding = max(10, int(width * 0.08))  # 8% of width, minimum 10px
+    else:
+        # Regular padding for normal sized images
+        padding = 40
+
+    banner = Image.new(
+        "RGBA", (width, 10 + TEXT_HEIGHT + padding), (255, 255, 255, 255)
+    )
+
+    with Pilmoji(banner, render_discord_emoji=False) as pilmoji:
+        # Draw the caption text
+        pilmoji.text(
+            ((width - TEXT_WIDTH) // 2, 10),
+            wrapped_text,
+            font=_caption_font(font_path, font_size),
+            fill=(0, 0, 0, 255),
+            align="center",
+            emoji_scale_factor=0.8,
+        )
+
+    return banner
+
+
+# Add a caption banner above or below a frame, mask pastes the frame onto white
+def _add_caption(
+    frame: Image.Image, banner: Image.Image, top: bool, mask: bool
+) -> Image.Image:
+    output_image = Image.new(
+        "RGBA", (frame.width, frame.height + banner.height), (255, 255, 255, 255)
+    )
+
+    if top:
+        output_image.paste(banner, (0, 0))
+        output_image.paste(frame, (0, banner.height), frame if mask else None)
+    else:
+        output_image.paste(frame, (0, 0), frame if mask else None)
+        output_image.paste(banner, (0, frame.height))
+
+    return output_image
+
+
+def _caption_image(
+    image_data: bytes, caption: str, font: str, format: str, top: bool
+) -> tuple[bytes, tuple[int, int]]:
+    output_data = BytesIO()
+
+    # Open image
+    with _open_image(image_data, "caption") as im:
+        if im.width < 100:
+            raise ImageTooSmallError
+
+        # Render caption once, then add it to every frame
+        banner = _caption_banner(caption, font, im.width)
+
+        # Check if image is animated
+        is_animated = hasattr(im, "is_animated") and im.is_animated
+
+        if is_animated:
+            if format == "PNG":
+                raise InvalidFormatError
+
+            if im.height + banner.height > 4000:
+                raise OperationTooLargeError
+
+            _check_animated_size(im, im.width, im.height + banner.height)
+
+            # Save as animated image, captioning frames as they're encoded
+            output_size = _save_animated(
+                im,
+                output_data,
+                format,
+                lambda frame: _add_caption(frame.convert("RGBA"), banner, top, True),
+            )
+        else:
+            output_image = _add_caption(im.convert("RGBA"), banner, top, False)
+
+            # Save image
+            if format == "PNG":
+                output_image.save(output_data, format="PNG")
+            elif format == "GIF":
+                output_image.save(output_data, format="GIF")
+            elif format == "AVIF":
+                output_image.save(
+                    output_data,
+                    format="AVIF",
+                    append_images=[output_image],
+                    save_all=True,
+                    duration=500,
+                    loop=0,
+                )
+
+            output_size = output_image.size
+        return output_data.getvalue(), output_size
+
+
 class Images(commands.Cog):
+    # Folder to cache NASA letter tiles in
+    NASA_CACHE_DIR = os.path.join("content", "nasa")
+
+    # Max NASA letter tiles to download at once
+    NASA_FETCH_LIMIT = 8
+
     number_of = {
         "A": [0, 1, 2, 3, 4],
         "B": [0, 1],
@@ -87,6 +581,75 @@ class Images(commands.Cog):
         self.bot.tree.add_command(self.img_gif_ctx)
         self.bot.tree.add_command(self.deepfry_ctx)
 
+        # NASA letter tiles being downloaded, so a tile is only fetched once
+        self.nasa_fetches: dict[str, asyncio.Task] = {}
+        self.nasa_semaphore = asyncio.Semaphore(self.NASA_FETCH_LIMIT)
+
+        os.makedirs(self.NASA_CACHE_DIR, exist_ok=True)
+
+        # Download every tile in the background if enabled
+        try:
+            if self.bot.options["nasa-warm-up"] == "True":
+                self.bot.loop.create_task(self.warm_nasa_tiles())
+        except KeyError:
+            pass
+
+    # Get the path to a cached NASA letter tile, downloading it if needed
+    async def get_nasa_tile(self, character: str, number: int) -> str:
+        name = f"{character.upper()}_{number}"
+        path = os.path.join(self.NASA_CACHE_DIR, f"{name}.jpg")
+
+        if os.path.exists(path):
+            return path
+
+        # Wait for the download already in progress
+        if name not in self.nasa_fetches:
+            task = asyncio.create_task(self.fetch_nasa_tile(name, path))
+            task.add_done_callback(lambda _: self.nasa_fetches.pop(name, None))
+
+            self.nasa_fetches[name] = task
+
+        # Shield so a cancelled command doesn't cancel other waiters
+        await asyncio.shield(self.nasa_fetches[name])
+
+        return path
+
+    async def fetch_nasa_tile(self, name: str, path: str) -> None:
+        async with self.nasa_semaphore:
+            async with self.bot.session.get(
+                f"https://science.nasa.gov/specials/your-name-in-landsat/images/{name.lower()}.jpg"
+            ) as request:
+                request.raise_for_status()
+                image_data = await request.read()
+
+        # Write to a temp file first so a partial tile is never used
+        temp_path = f"{path}.tmp"
+
+        with open(temp_path, "wb") as file:
+            file.write(image_data)
+
+        os.replace(temp_path, path)
+
+    # Download all NASA letter tiles
+    async def warm_nasa_tiles(self) -> None:
+        results = await asyncio.gather(
+            *(
+                self.get_nasa_tile(character, number)
+                for character, numbers in self.number_of.items()
+                for number in numbers
+            ),
+            return_exceptions=True,
+        )
+
+        failed = [result for result in results if isinstance(result, Exception)]
+
+        if failed:
+            logging.error(
+                f"[IMAGES] Failed to download {len(failed)} NASA tiles - {failed[0]}"
+            )
+        else:
+            logging.info(f"[IMAGES] Cached {len(results)} NASA tiles.")
+
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=True, private_channel=True
     )
@@ -98,22 +661,6 @@ class Images(commands.Cog):
         allowed_installs=installs,
     )
 
-    def _generate_nasa(
-        self, characters: list[BytesIO]
-    ) -> tuple[BytesIO, tuple[int, int]]:
-        width = (272 * len(characters)) + (20 * len(characters)) - 20
-        output_img = Image.new(mode="RGBA", size=[width, 676])
-
-        for i, character in enumerate(characters):
-            char_img = Image.open(character)
-            output_img.paste(char_img, ((i * 272) + (20 * i), 0))
-
-        output_data = BytesIO()
-        output_img.save(output_data, format="PNG")
-        output_data.seek(0)
-
-        return output_data, (output_img.width, output_img.height)
-
     @imageGroup.command(
         name="nasa",
         description="Create an image of characters spelt by Earth images by NASA Landsat.",
@@ -150,24 +697,19 @@ class Images(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
             return
 
-        images: list[BytesIO] = []
-        for character in word:
-            number = random.choice(self.number_of[character.upper()])
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://science.nasa.gov/specials/your-name-in-landsat/images/{character}_{number}.jpg"
-                ) as request:
-                    image_data = BytesIO()
-
-                    async for chunk in request.content.iter_chunked(8192):
-                        image_data.write(chunk)
-
-                    image_data.seek(0)
-
-            images.append(image_data)
+        # Fetch letters at the same time, most will already be cached
+        tiles = await asyncio.gather(
+            *(
+                self.get_nasa_tile(
+                    character, random.choice(self.number_of[character.upper()])
+                )
+                for character in word
+            )
+        )
 
-        output, size = self._generate_nasa(images)
+        output, size = await self.bot.image_pool.run(
+            interaction.user.id, _generate_nasa, tiles
+        )
         embed = discord.Embed(
             title="Image Generated",
             description=f"**Size: **`{size[0]}x{size[1]}`\n\nImages sourced from NASA and the U.S. Geological Survey.",
@@ -179,7 +721,7 @@ class Images(commands.Cog):
         )
 
         file_processed = discord.File(
-            fp=output,
+            fp=BytesIO(output),
             filename="titanium_nasa.png",
             spoiler=spoiler,
         )
@@ -189,31 +731,6 @@ class Images(commands.Cog):
             embed=embed, file=file_processed, ephemeral=ephemeral
         )
 
-    def _resize_image(
-        self,
-        image_data: BytesIO,
-        width: int,
-        height: int,
-        format: str,
-    ) -> tuple[BytesIO, tuple[int, int]]:
-        # Open image
-        with Image.open(image_data) as im:
-            # Resize image
-            resized_image = im.resize((int(width), int(height)))
-
-            resized_image_data = BytesIO()
-
-            # Save resized image
-            resized_image.save(
-                resized_image_data,
-                format=format.upper().replace("JPG", "JPEG"),
-            )
-
-            new_size = resized_image.size
-
-        resized_image_data.seek(0)
-        return resized_image_data, new_size
-
     # Image Resize command
     @imageGroup.command(name="resize", description="Resize an image.")
     @app_commands.describe(
@@ -238,6 +755,20 @@ class Images(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
+        # Check image size before downloading
+        if _over_budget(file, "resize"):
+            embed = discord.Embed(
+                title="Error",
+                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['resize'] // 1000000} megapixels.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            return await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+
         if (
             file.content_type.split("/")[0] == "image"
             and file.content_type.split("/")[1] != "gif"
@@ -286,13 +817,32 @@ class Images(commands.Cog):
 
                             image_data.seek(0)
 
-                        resized_image_data, new_size = await asyncio.to_thread(
-                            self._resize_image,
-                            image_data=image_data,
-                            width=target_x,
-                            height=target_y,
-                            format=os.path.splitext(file.filename)[1][1:],
-                        )
+                        try:
+                            (
+                                resized_image_data,
+                                new_size,
+                            ) = await self.bot.image_pool.run(
+                                interaction.user.id,
+                                _resize_image,
+                                image_data=image_data.getvalue(),
+                                width=target_x,
+                                height=target_y,
+                                format=os.path.splitext(file.filename)[1][1:],
+                            )
+                        except ImageTooLargeError:
+                            embed = discord.Embed(
+                                title="Error",
+                                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['resize'] // 1000000} megapixels.",
+                                color=Color.red(),
+                            )
+                            embed.set_footer(
+                                text=f"@{interaction.user.name}",
+                                icon_url=interaction.user.display_avatar.url,
+                            )
+
+                            return await interaction.followup.send(
+                                embed=embed, ephemeral=ephemeral
+                            )
 
                         if (
                             new_size[0] > 10000 or new_size[1] > 10000
@@ -337,7 +887,7 @@ class Images(commands.Cog):
                             )
 
                         file_processed = discord.File(
-                            fp=resized_image_data,
+                            fp=BytesIO(resized_image_data),
                             filename=f"titanium_{os.path.splitext(file.filename)[0] if not filename else filename}.{os.path.splitext(file.filename)[1][1:]}",
                             spoiler=spoiler,
                         )
@@ -383,48 +933,6 @@ class Images(commands.Cog):
 
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
 
-    def _convert_image(
-        self,
-        image_data: BytesIO,
-        format: str,
-    ) -> tuple[BytesIO, tuple[int, int]]:
-        output_data = BytesIO()
-
-        if format == "GIF":
-            # Convert to GIF with wand
-            with WandImage(blob=image_data.getvalue()) as wand_image:
-                # Set GIF optimization options
-                wand_image.compression_quality = 80
-                wand_image.quantum_operator = "dither"
-
-                # Convert to GIF format
-                wand_image.format = "gif"
-
-                # Write to output BytesIO
-                output_data.write(wand_image.make_blob("gif"))
-
-                output_size = (wand_image.width, wand_image.height)
-        elif format == "AVIF*":
-            with Image.open(image_data) as im:
-                # Convert image to GIF
-                im.save(
-                    output_data,
-                    format="AVIF",
-                    append_images=[im],
-                    save_all=True,
-                    duration=500,
-                    loop=0,
-                )
-                output_size = im.size
-        else:
-            # Convert with pillow
-            with Image.open(image_data) as im:
-                im.save(output_data, format=format)
-                output_size = im.size
-
-        output_data.seek(0)
-        return output_data, output_size
-
     # Image to GIF command
     @imageGroup.command(
         name="to-gif-avif",
@@ -508,6 +1016,20 @@ class Images(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
+        # Check image size before downloading
+        if _over_budget(file, "convert"):
+            embed = discord.Embed(
+                title="Error",
+                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['convert'] // 1000000} megapixels.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            return await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+
         if file.content_type.split("/")[0] == "image":  # Check if file is an image
             if file.size < 20000000:  # 20MB file limit
                 # Get image, store in memory
@@ -520,11 +1042,41 @@ class Images(commands.Cog):
 
                         image_data.seek(0)
 
-                output_data, output_size = await asyncio.to_thread(
-                    self._convert_image,
-                    image_data=image_data,
-                    format=format.value,
-                )
+                try:
+                    output_data, output_size = await self.bot.image_pool.run(
+                        interaction.user.id,
+                        _convert_image,
+                        image_data=image_data.getvalue(),
+                        format=format.value,
+                    )
+                except OperationTooLargeError:
+                    embed = discord.Embed(
+                        title="Error",
+                        description="Your animated image has too many frames to convert. Please try a shorter or smaller image.",
+                        color=Color.red(),
+                    )
+                    embed.set_footer(
+                        text=f"@{interaction.user.name}",
+                        icon_url=interaction.user.display_avatar.url,
+                    )
+
+                    return await interaction.followup.send(
+                        embed=embed, ephemeral=ephemeral
+                    )
+                except ImageTooLargeError:
+                    embed = discord.Embed(
+                        title="Error",
+                        description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['convert'] // 1000000} megapixels.",
+                        color=Color.red(),
+                    )
+                    embed.set_footer(
+                        text=f"@{interaction.user.name}",
+                        icon_url=interaction.user.display_avatar.url,
+                    )
+
+                    return await interaction.followup.send(
+                        embed=embed, ephemeral=ephemeral
+                    )
 
                 # Send resized image
                 embed = discord.Embed(
@@ -551,7 +1103,7 @@ class Images(commands.Cog):
                     )
 
                 file_processed = discord.File(
-                    fp=output_data,
+                    fp=BytesIO(output_data),
                     filename=f"titanium_{os.path.splitext(file.filename)[0] if not filename else filename}.{format.value.lower()}",
                     spoiler=spoiler,
                 )
@@ -603,9 +1155,17 @@ class Images(commands.Cog):
 
             converted = []
             fails = []
+            busy = False
 
             for file in message.attachments:
                 try:
+                    # Check image size before downloading
+                    if _over_budget(file, "convert"):
+                        fails.append(
+                            f"**{file.filename}** - too large (limit: {PIXEL_BUDGETS['convert'] // 1000000} megapixels)"
+                        )
+                        continue
+
                     if (
                         file.content_type.split("/")[0] == "image"
                         and file.content_type.split("/")[1] != "gif"
@@ -624,15 +1184,16 @@ class Images(commands.Cog):
 
                                     image_data.seek(0)
 
-                            output_data, output_size = await asyncio.to_thread(
-                                self._convert_image,
-                                image_data=image_data,
+                            output_data, output_size = await self.bot.image_pool.run(
+                                interaction.user.id,
+                                _convert_image,
+                                image_data=image_data.getvalue(),
                                 format="GIF",
                             )
 
                             # Add converted file to list
                             converted_file = discord.File(
-                                fp=output_data,
+                                fp=BytesIO(output_data),
                                 filename=f"titanium_{os.path.splitext(file.filename)[0]}.gif",
                             )
                             converted.append(converted_file)
@@ -642,9 +1203,22 @@ class Images(commands.Cog):
                             )
                     else:  # If file is not a static image
                         fails.append(f"**{file.filename}** - not a static image")
+                except ImageTooLargeError:
+                    fails.append(
+                        f"**{file.filename}** - too large (limit: {PIXEL_BUDGETS['convert'] // 1000000} megapixels)"
+                    )
+                except ImageQueueFullError:
+                    # Image pool is full, skip the remaining files
+                    busy = True
+                    break
                 except Exception:
                     fails.append(f"**{file.filename}** - error during conversion")
 
+            # Image pool is full and nothing was done
+            if busy and converted == [] and fails == []:
+                await interaction.followup.send(embed=busy_embed(interaction))
+                return
+
             # Show fail messages if present
             if fails != []:
                 embed = discord.Embed(
@@ -662,61 +1236,11 @@ class Images(commands.Cog):
             else:
                 await interaction.followup.send(files=converted)
 
-    def _deepfry_image(
-        self,
-        image_data: BytesIO,
-        intensity_scale: float,
-        red_filter: bool,
-    ) -> tuple[BytesIO, tuple[int, int]]:
-        # Open image
-        with Image.open(image_data) as img:
-            # Crediit: https://github.com/Ovyerus/deeppyer
-            # MIT Licence - https://github.com/Ovyerus/deeppyer/blob/master/LICENSE
-
-            # Deepfry image
-            img = img.convert("RGB")
-            width, height = img.width, img.height
-            img = img.resize(
-                (int(width**0.75), int(height**0.75)), resample=Image.LANCZOS
-            )
-            img = img.resize(
-                (int(width**0.88), int(height**0.88)), resample=Image.BILINEAR
-            )
-            img = img.resize(
-                (int(width**0.9), int(height**0.9)), resample=Image.BICUBIC
-            )
-            img = img.resize((width, height), resample=Image.BICUBIC)
-            img = ImageOps.posterize(img, 4)
-
-            # Generate colour overlay
-            r = img.split()[0]
-            r = ImageEnhance.Contrast(r).enhance(
-                1.0 + intensity_scale
-            )  # Scale from 1.0 to 2.0
-            r = ImageEnhance.Brightness(r).enhance(
-                1.0 + (0.5 * intensity_scale)
-            )  # Scale from 1.0 to 1.5
-
-            if red_filter:
-                colours = ((254, 0, 2), (255, 255, 15))
-                r = ImageOps.colorize(r, colours[0], colours[1])
-            else:
-                r = img.copy()
-
-            # Blend scaled from 0 to 0.75
-            img = Image.blend(img, r, 0.75 * intensity_scale)
-
-            # Sharpness scaled from 1.0 to 100.0
-            img = ImageEnhance.Sharpness(img).enhance(1.0 + (99.0 * intensity_scale))
-
-            deepfried_data = BytesIO()
-
-            # Save image
-            img.save(deepfried_data, format="PNG")
-            output_size = img.size
-
-        deepfried_data.seek(0)
-        return deepfried_data, output_size
+            # Files after the image pool filled up were skipped
+            if busy:
+                await interaction.followup.send(
+                    embed=busy_embed(interaction), ephemeral=True
+                )
 
     # Deepfry image command
     @imageGroup.command(name="deepfry", description="Deepfry an image.")
@@ -740,6 +1264,20 @@ class Images(commands.Cog):
         ephemeral: bool = False,
     ):
         await interaction.response.defer(ephemeral=ephemeral)
+
+        # Check image size before downloading
+        if _over_budget(file, "deepfry"):
+            embed = discord.Embed(
+                title="Error",
+                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['deepfry'] // 1000000} megapixels.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            return await interaction.followup.send(embed=embed, ephemeral=ephemeral)
         intensity_scale = intensity / 100.0
 
         if (
@@ -758,12 +1296,28 @@ class Images(commands.Cog):
 
                         image_data.seek(0)
 
-                deepfried_data, output_size = await asyncio.to_thread(
-                    self._deepfry_image,
-                    image_data=image_data,
-                    intensity_scale=intensity_scale,
-                    red_filter=red_filter,
-                )
+                try:
+                    deepfried_data, output_size = await self.bot.image_pool.run(
+                        interaction.user.id,
+                        _deepfry_image,
+                        image_data=image_data.getvalue(),
+                        intensity_scale=intensity_scale,
+                        red_filter=red_filter,
+                    )
+                except ImageTooLargeError:
+                    embed = discord.Embed(
+                        title="Error",
+                        description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['deepfry'] // 1000000} megapixels.",
+                        color=Color.red(),
+                    )
+                    embed.set_footer(
+                        text=f"@{interaction.user.name}",
+                        icon_url=interaction.user.display_avatar.url,
+                    )
+
+                    return await interaction.followup.send(
+                        embed=embed, ephemeral=ephemeral
+                    )
 
                 # Send resized image
                 embed = discord.Embed(
@@ -790,7 +1344,7 @@ class Images(commands.Cog):
                     )
 
                 file_processed = discord.File(
-                    fp=deepfried_data,
+                    fp=BytesIO(deepfried_data),
                     filename=f"titanium_{os.path.splitext(file.filename)[0] if not filename else filename}.png",
                     spoiler=spoiler,
                 )
@@ -843,9 +1397,17 @@ class Images(commands.Cog):
 
             converted = []
             fails = []
+            busy = False
 
             for file in message.attachments:
                 try:
+                    # Check image size before downloading
+                    if _over_budget(file, "deepfry"):
+                        fails.append(
+                            f"**{file.filename}** - too large (limit: {PIXEL_BUDGETS['deepfry'] // 1000000} megapixels)"
+                        )
+                        continue
+
                     if (
                         file.content_type.split("/")[0] == "image"
                         and file.content_type.split("/")[1] != "gif"
@@ -864,16 +1426,17 @@ class Images(commands.Cog):
 
                                     image_data.seek(0)
 
-                            deepfried_data, output_size = await asyncio.to_thread(
-                                self._deepfry_image,
-                                image_data=image_data,
+                            deepfried_data, output_size = await self.bot.image_pool.run(
+                                interaction.user.id,
+                                _deepfry_image,
+                                image_data=image_data.getvalue(),
                                 intensity_scale=1.0,
                                 red_filter=True,
                             )
 
                             # Add converted file to list
                             converted_file = discord.File(
-                                fp=deepfried_data,
+                                fp=BytesIO(deepfried_data),
                                 filename=f"titanium_{os.path.splitext(file.filename)[0]}.png",
                             )
                             converted.append(converted_file)
@@ -883,9 +1446,22 @@ class Images(commands.Cog):
                             )
                     else:  # If file is not a static image
                         fails.append(f"**{file.filename}** - not a static image")
+                except ImageTooLargeError:
+                    fails.append(
+                        f"**{file.filename}** - too large (limit: {PIXEL_BUDGETS['deepfry'] // 1000000} megapixels)"
+                    )
+                except ImageQueueFullError:
+                    # Image pool is full, skip the remaining files
+                    busy = True
+                    break
                 except Exception:
                     fails.append(f"**{file.filename}** - error during conversion")
 
+            # Image pool is full and nothing was done
+            if busy and converted == [] and fails == []:
+                await interaction.followup.send(embed=busy_embed(interaction))
+                return
+
             # Show fail messages if present
             if fails != []:
                 embed = discord.Embed(
@@ -916,122 +1492,11 @@ class Images(commands.Cog):
 
                     await interaction.followup.send(embed=embed)
 
-    def _speech_bubble_image(
-        self,
-        image_data: BytesIO,
-        colour: str,
-        direction: str,
-        format: str,
-    ) -> tuple[BytesIO, tuple[int, int]]:
-        output_data = BytesIO()
-
-        # Open image
-        with Image.open(image_data) as im:
-            im = im.convert("RGBA")
-
-            # Open speech bubble image
-            with Image.open(os.path.join("content", "speech.png")) as bubble:
-                bubble = bubble.convert("RGBA")
-                bubble = bubble.resize(im.size, Image.Resampling.LANCZOS)
-
-                if direction == "left":  # Flip bubble image if left selected
-                    bubble = bubble.transpose(Image.FLIP_LEFT_RIGHT)
-
-                if colour == "black":  # Invert if black selected
-                    bubble_a = bubble.getchannel("A")
-                    bubble = bubble.convert("RGB")  # Convert to RGB for invert
-
-                    bubble = ImageOps.invert(bubble)
-                    bubble.putalpha(bubble_a)
-
-                if colour == "transparent":
-                    # Subtract bubble shape from image
-                    output_image = ImageChops.subtract_modulo(im, bubble)
-
-                    with Image.open(
-                        os.path.join("content", "speech_border.png")
-                    ) as bubble_border:
-                        # Add speech bubble border
-                        bubble_border = bubble_border.convert("RGBA")
-                        bubble_border = bubble_border.resize(
-                            im.size, Image.Resampling.LANCZOS
-                        )
-
-                        # Make border white
-                        bubble_border_a = bubble_border.getchannel("A")
-                        bubble_border = bubble_border.convert(
-                            "RGB"
-                        )  # Convert to RGB for invert
-
-                        bubble_border = ImageOps.invert(bubble_border)
-                        bubble_border.putalpha(bubble_border_a)
-
-                        if direction == "left":
-                            bubble_border = bubble_border.transpose(
-                                Image.FLIP_LEFT_RIGHT
-                            )
-
-                        output_image.paste(bubble_border, (0, 0), bubble_border)
-
-                    if format == "AVIF":
-                        # Save image to AVIF
-                        output_image.save(
-                            output_data,
-                            format="AVIF",
-                            append_images=[output_image],
-                            save_all=True,
-                            duration=500,
-                            loop=0,
-                        )
-                        output_size = output_image.size
-                    elif format == "GIF":
-                        output_data_temp = BytesIO()
-
-                        # Save image as PNG temporarily
-                        output_image.save(output_data_temp, format="PNG")
-
-                        # Convert to GIF
-                        output_data_temp.seek(0)
-                        with WandImage(blob=output_data_temp.getvalue()) as wand_image:
-                            # Set GIF optimization options
-                            wand_image.compression_quality = 80
-                            wand_image.quantum_operator = "dither"
-
-                            # Convert to GIF format
-                            wand_image.format = "gif"
-
-                            # Write to output BytesIO
-                            output_data.write(wand_image.make_blob("gif"))
-
-                            output_size = (wand_image.width, wand_image.height)
-                    else:
-                        # Save image
-                        output_image.save(output_data, format="PNG")
-                        output_size = output_image.size
-                else:
-                    with Image.new("RGBA", im.size) as output_image:
-                        # Add speech bubble
-                        output_image.paste(im, (0, 0))
-                        output_image.paste(bubble, (0, 0), bubble.getchannel("A"))
-
-                        if format == "AVIF":
-                            # Save image to AVIF
-                            output_image.save(
-                                output_data,
-                                format="AVIF",
-                                append_images=[output_image],
-                                save_all=True,
-                                duration=500,
-                                loop=0,
-                            )
-                            output_size = output_image.size
-                        else:
-                            # Save image
-                            output_image.save(output_data, format=format)
-                            output_size = output_image.size
-
-        output_data.seek(0)
-        return output_data, output_size
+            # Files after the image pool filled up were skipped
+            if busy:
+                await interaction.followup.send(
+                    embed=busy_embed(interaction), ephemeral=True
+                )
 
     # Speech bubble command
     @imageGroup.command(
@@ -1100,6 +1565,20 @@ class Images(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
+        # Check image size before downloading
+        if _over_budget(file, "speechbubble"):
+            embed = discord.Embed(
+                title="Error",
+                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['speechbubble'] // 1000000} megapixels.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            return await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+
         if (
             file.content_type.split("/")[0] == "image"
             and file.content_type.split("/")[1] != "gif"
@@ -1116,13 +1595,29 @@ class Images(commands.Cog):
 
                         image_data.seek(0)
 
-                output_data, output_size = await asyncio.to_thread(
-                    self._speech_bubble_image,
-                    image_data=image_data,
-                    colour=colour.value,
-                    direction=direction.value,
-                    format=format.value,
-                )
+                try:
+                    output_data, output_size = await self.bot.image_pool.run(
+                        interaction.user.id,
+                        _speech_bubble_image,
+                        image_data=image_data.getvalue(),
+                        colour=colour.value,
+                        direction=direction.value,
+                        format=format.value,
+                    )
+                except ImageTooLargeError:
+                    embed = discord.Embed(
+                        title="Error",
+                        description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['speechbubble'] // 1000000} megapixels.",
+                        color=Color.red(),
+                    )
+                    embed.set_footer(
+                        text=f"@{interaction.user.name}",
+                        icon_url=interaction.user.display_avatar.url,
+                    )
+
+                    return await interaction.followup.send(
+                        embed=embed, ephemeral=ephemeral
+                    )
 
                 # Send resized image
                 embed = discord.Embed(
@@ -1149,7 +1644,7 @@ class Images(commands.Cog):
                     )
 
                 file_processed = discord.File(
-                    fp=output_data,
+                    fp=BytesIO(output_data),
                     filename=f"titanium_{os.path.splitext(file.filename)[0] if not filename else filename}.{format.value.lower()}",
                     spoiler=spoiler,
                 )
@@ -1182,156 +1677,6 @@ class Images(commands.Cog):
 
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
 
-    def _caption_image(
-        self, image_data: BytesIO, caption: str, font: str, format: str, top: bool
-    ) -> tuple[BytesIO, tuple[int, int]]:
-        output_data = BytesIO()
-
-        # Open image
-        with Image.open(image_data) as im:
-            if im.width < 100:
-                raise ImageTooSmallError
-
-            wrapped_text = textwrap.fill(caption, width=(im.width // 13))
-
-            # Load font
-            font_path = os.path.join("content", "fonts", font)
-            font = ImageFont.truetype(font_path, im.width // 11)
-
-            # Decide font size and get text size
-            with Pilmoji(im) as pilmoji:
-                while True:
-                    size = pilmoji.getsize(
-                        wrapped_text, font=font, emoji_scale_factor=0.8
-                    )
-                    if size[0] <= im.width - 20:
-                        break
-                    else:
-                        font = ImageFont.truetype(font_path, font.size - 1)
-
-            TEXT_WIDTH = size[0]
-            TEXT_HEIGHT = size[1]
-
-            # Scale padding based on image width for smaller images
-            if im.width < 500:
-                # For small images, reduce the extra padding
-                padding = max(10, int(im.width * 0.08))  # 8% of width, minimum 10px
-            else:
-                # Regular padding for normal sized images
-                padding = 40
-
-            WHITE_HEIGHT = 10 + TEXT_HEIGHT + padding
-
-            # Check if image is animated
-            is_animated = hasattr(im, "is_animated") and im.is_animated
-
-            if is_animated:
-                if format == "PNG":
-                    raise InvalidFormatError
-
-                frames = []
-
-                # Process each frame
-                for frame in range(im.n_frames):
-                    im.seek(frame)
-                    frame_image = im.copy().convert("RGBA")
-
-                    # Create a new image with white background for this frame
-                    frame_output = Image.new(
-                        "RGBA",
-                        (im.width, im.height + WHITE_HEIGHT),
-                        (255, 255, 255, 255),
-                    )
-                    frame_output.paste(
-                        frame_image, (0, (WHITE_HEIGHT if top else 0)), frame_image
-                    )
-
-                    # Calculate X position for text
-                    x = (frame_output.width - TEXT_WIDTH) // 2
-
-                    # Calculate Y position for text
-                    if top:
-                        y = 10
-                    else:
-                        y = im.height + 10
-
-                    with Pilmoji(frame_output, render_discord_emoji=False) as pilmoji:
-                        # Draw the caption text
-                        pilmoji.text(
-                            (x, y),
-                            wrapped_text,
-                            font=font,
-                            fill=(0, 0, 0, 255),
-                            align="center",
-                            emoji_scale_factor=0.8,
-                        )
-
-                    if frame_output.height > 4000:
-                        raise OperationTooLargeError
-
-                    frames.append(frame_output)
-
-                # Save as animated GIF
-                frames[0].save(
-                    output_data,
-                    format=format,
-                    save_all=True,
-                    append_images=frames[1:],
-                    duration=getattr(im, "info", {}).get("duration", 100),
-                    loop=0,
-                )
-                output_size = frames[0].size
-            else:
-                im = im.convert("RGBA")
-
-                # Create a new image with white background
-                output_image = Image.new(
-                    "RGBA",
-                    (im.width, im.height + WHITE_HEIGHT),
-                    (255, 255, 255, 255),
-                )
-                output_image.paste(im, (0, (WHITE_HEIGHT if top else 0)))
-
-                # Calculate X position for text
-                x = (output_image.width - TEXT_WIDTH) // 2
-
-                # Calculate Y position for text
-                if top:
-                    y = 10
-                else:
-                    y = im.height + 10
-
-                with Pilmoji(output_image, render_discord_emoji=False) as pilmoji:
-                    # Draw the caption text
-                    pilmoji.text(
-                        (x, y),
-                        wrapped_text,
-                        font=font,
-                        fill=(0, 0, 0, 255),
-                        align="center",
-                        emoji_scale_factor=0.8,
-                    )
-
-                # Save image
-                if format == "PNG":
-                    output_image.save(output_data, format="PNG")
-                elif format == "GIF":
-                    output_image.save(output_data, format="GIF")
-                elif format == "AVIF":
-                    output_image.save(
-                        output_data,
-                        format="AVIF",
-                        append_images=[output_image],
-                        save_all=True,
-                        duration=500,
-                        loop=0,
-                    )
-
-                output_size = output_image.size
-
-            output_data.seek(0)
-            return output_data, output_size
-
     # Convert image command
     @imageGroup.command(name="caption", description="Add a caption to an image.")
     @app_commands.checks.cooldown(1, 10)
@@ -1389,6 +1734,20 @@ class Images(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
+        # Check image size before downloading
+        if _over_budget(file, "caption"):
+            embed = discord.Embed(
+                title="Error",
+                description=f"Your image is too large. Please ensure it is smaller than {PIXEL_BUDGETS['caption'] // 1000000} megapixels.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            return await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+
         if file.content_type.split("/")[0] != "image":  # If file is not an image
             embed = discord.Embed(
                 title="Error",
@@ -1439,9 +1798,10 @@ class Images(commands.Cog):
                 image_data.seek(0)
 
         try:
-            output_data, output_size = await asyncio.to_thread(
-                self._caption_image,
-                image_data=image_data,
+            output_data, output_size = await self.bot.image_pool.run(
+                interaction.user.id,
+                _caption_image,
+                image_data=image_data.getvalue(),
                 caption=caption,
                 font=font.value,
                 format=format.value,
@@ -1470,6 +1830,18 @@ class Images(commands.Cog):
                 icon_url=interaction.user.display_avatar.url,
             )
 
+            return await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+        except (OperationTooLargeError, ImageTooLargeError):
+            embed = discord.Embed(
+                title="Error",
+                description="Your image is too large to caption. Please try a shorter or smaller image, or a shorter caption.",
+                color=Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
             return await interaction.followup.send(embed=embed, ephemeral=ephemeral)
 
         # Send resized image
@@ -1497,7 +1869,7 @@ class Images(commands.Cog):
             )
 
         file_processed = discord.File(
-            fp=output_data,
+            fp=BytesIO(output_data),
             filename=f"titanium_{os.path.splitext(file.filename)[0] if not filename else filename}.{format.value.lower()}",
             spoiler=spoiler,
         )
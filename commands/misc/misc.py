@@ -2,7 +2,6 @@ import asyncio
 import random
 from typing import Literal
 
-import aiohttp
 import discord
 from discord import Color, app_commands
 from discord.ext import commands
@@ -126,32 +125,35 @@ class Misc(commands.Cog):
         self, interaction: discord.Interaction, username: str, ephemeral: bool = False
     ):
         await interaction.response.defer(ephemeral=ephemeral)
-        #mgytr was here :3
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url="https://githubroast.mgytr.top/llama",
-                    json={"username": username, "language": "english"},
-                ) as request:
-                    embed = discord.Embed(
-                        title="AI GitHub Roast",
-                        description=(await request.json())["roast"],
-                        color=Color.random(),
-                    )
-                    embed.set_footer(
-                        text=f"@{interaction.user.name} - https://githubroast.mgytr.top",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-                    embed.set_author(name=username)
+        # mgytr was here :3
+        # Not cached, each run should give a new roast
+        _, data = await self.bot.http_cache.fetch_json(
+            "https://githubroast.mgytr.top/llama",
+            method="POST",
+            body={"username": username, "language": "english"},
+        )
 
-                    await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-        except KeyError:
+        if data is None or "roast" not in data:
             embed = discord.Embed(
                 title="Error",
                 description="No roast was generated. Does the user exist?",
                 color=Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
+
+        embed = discord.Embed(
+            title="AI GitHub Roast",
+            description=data["roast"],
+            color=Color.random(),
+        )
+        embed.set_footer(
+            text=f"@{interaction.user.name} - https://githubroast.mgytr.top",
+            icon_url=interaction.user.display_avatar.url,
+        )
+        embed.set_author(name=username)
+
+        await interaction.followup.send(embed=embed, ephemeral=ephemeral)
 
     # Dice command
     @funGroup.command(name="dice", description="Roll the dice.")
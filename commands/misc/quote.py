@@ -1,4 +1,3 @@
-import asyncio
 import html
 import os
 import re
@@ -13,19 +12,21 @@ from discord.ext import commands
 from discord.ui import View
 from PIL import Image
 from playwright.async_api import async_playwright
-from wand.image import Image as WandImage
+
+from utils.gif_encoder import save_gif
+from utils.image_pool import ImageQueueFullError, busy_embed
 
 
 def _to_gif(
-    image_data: BytesIO,
+    image_data: bytes,
     mode: str,
-) -> tuple[BytesIO, tuple[int, int]]:
+) -> tuple[bytes, tuple[int, int]]:
     output_data = BytesIO()
 
     # Open image
-    with Image.open(image_data) as im:
+    with Image.open(BytesIO(image_data)) as im:
         if mode == "quality":
-            with Image.open(image_data) as im2:
+            with Image.open(BytesIO(image_data)) as im2:
                 # Convert image to GIF
                 im.save(
                     output_data,
@@ -37,26 +38,15 @@ def _to_gif(
                 )
                 output_size = im.size
         else:
-            # Convert to GIF with wand
-            with WandImage(blob=image_data.getvalue()) as wand_image:
-                # Set GIF optimization options
-                wand_image.compression_quality = 80
-                wand_image.quantum_operator = "dither"
-
-                # Convert to GIF format
-                wand_image.format = "gif"
-
-                # Write to output BytesIO
-                output_data.write(wand_image.make_blob("gif"))
+            # Convert to GIF
+            output_size = save_gif(im, output_data)
 
-                output_size = (wand_image.width, wand_image.height)
-
-    output_data.seek(0)
-    return output_data, output_size
+    return output_data.getvalue(), output_size
 
 
 # Create quote image function
 async def create_quote_image(
+    interaction: discord.Interaction,
     user: discord.User,
     content: str,
     user_mentions: Sequence[discord.User | discord.Member],
@@ -182,17 +172,21 @@ async def create_quote_image(
 
     if output_format != "PNG":
         if output_format == "GIF":
-            image_data, output_size = await asyncio.to_thread(
+            output_data, output_size = await interaction.client.image_pool.run(
+                interaction.user.id,
                 _to_gif,
-                image_data=image_data,
+                image_data=image_data.getvalue(),
                 mode="compatibility",
             )
+            image_data = BytesIO(output_data)
         elif output_format == "AVIF":
-            image_data, output_size = await asyncio.to_thread(
+            output_data, output_size = await interaction.client.image_pool.run(
+                interaction.user.id,
                 _to_gif,
-                image_data=image_data,
+                image_data=image_data.getvalue(),
                 mode="quality",
             )
+            image_data = BytesIO(output_data)
 
     image_data.seek(0)
     return image_data, has_spoilers
@@ -270,6 +264,22 @@ class QuoteView(View):
             )
             return False
 
+    # Button errors don't reach the command error handler, show the busy
+    # error here instead
+    async def on_error(
+        self,
+        interaction: discord.Interaction,
+        error: Exception,
+        item: discord.ui.Item,
+    ) -> None:
+        if isinstance(error, ImageQueueFullError):
+            await interaction.followup.send(
+                embed=busy_embed(interaction),
+                ephemeral=True,
+            )
+        else:
+            await super().on_error(interaction, error, item)
+
     @discord.ui.button(label="", style=discord.ButtonStyle.gray, custom_id="theme")
     async def theme(self, interaction: discord.Interaction, button: discord.ui.Button):
         user = None
@@ -316,6 +326,7 @@ class QuoteView(View):
             custom_quote_user = None
 
         image_data, has_spoilers = await create_quote_image(
+            interaction=interaction,
             user=user,
             content=self.content,
             user_mentions=self.user_mentions,
@@ -438,6 +449,7 @@ class QuoteView(View):
             custom_quote_user = None
 
         image_data, has_spoilers = await create_quote_image(
+            interaction=interaction,
             user=user,
             content=self.content,
             user_mentions=self.user_mentions,
@@ -562,6 +574,7 @@ class QuoteView(View):
             custom_quote_user = None
 
         image_data, has_spoilers = await create_quote_image(
+            interaction=interaction,
             user=user,
             content=self.content,
             user_mentions=self.user_mentions,
@@ -716,6 +729,7 @@ class Quotes(commands.Cog):
             return
 
         image_data, has_spoilers = await create_quote_image(
+            interaction=interaction,
             user=message.author,
             content=message.content,
             user_mentions=message.mentions,
@@ -873,6 +887,7 @@ class Quotes(commands.Cog):
         content = re.sub(r"<(@[!&]?|#)([0-9]{15,20})>", repl, content)
 
         image_data, has_spoilers = await create_quote_image(
+            interaction=interaction,
             user=user,
             content=content,
             user_mentions=[],
@@ -1,21 +1,64 @@
 # pylint: disable=no-member
 
-import asyncio
 import os
 import tempfile
+import time
+from io import BytesIO
 from typing import TYPE_CHECKING
 
 import discord
 from discord import Color, app_commands
 from discord.ext import commands
 
+from utils.ffmpeg import FFmpegBusyError, FFmpegScheduler, FFmpegTimeoutError
+
 if TYPE_CHECKING:
     from main import TitaniumBot
 
 
 class Videos(commands.Cog):
+    # Seconds before a conversion is killed
+    TIMEOUT = 120
+
+    # Output size to aim for in size mode, under Discord's 10MB upload limit
+    TARGET_SIZE = 9_500_000
+
+    # Max length in size mode
+    MAX_SIZE_MODE_LENGTH = 30
+
+    # Rough lossy WEBP output bytes per pixel per frame, by quality
+    WEBP_BYTES_PER_PIXEL = {80: 0.16, 70: 0.12, 60: 0.09, 50: 0.07}
+
     def __init__(self, bot: "TitaniumBot") -> None:
         self.bot = bot
+        self.scheduler = FFmpegScheduler()
+
+    def cog_unload(self) -> None:
+        # Kill running conversions
+        self.scheduler.close()
+
+    # Pick the best FPS, width and quality that should fit the target size
+    def pick_size_settings(self, probe: dict) -> tuple[int, int, int, float]:
+        duration = min(
+            probe["duration"] or self.MAX_SIZE_MODE_LENGTH, self.MAX_SIZE_MODE_LENGTH
+        )
+        source_width = probe["width"] or 480
+        source_height = probe["height"] or 270
+        source_fps = probe["fps"] or 30
+
+        for quality, bytes_per_pixel in self.WEBP_BYTES_PER_PIXEL.items():
+            for width in (480, 400, 320, 240):
+                width = min(width, source_width)
+                height = width * source_height / source_width
+
+                for fps in (20, 15, 10):
+                    fps = max(1, min(fps, round(source_fps)))
+                    estimate = duration * fps * width * height * bytes_per_pixel
+
+                    if estimate <= self.TARGET_SIZE:
+                        return fps, width, quality, duration
+
+        return 10, min(240, source_width), 50, duration
 
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=True, private_channel=True
@@ -42,6 +85,10 @@ class Videos(commands.Cog):
             app_commands.Choice(
                 name="Length (.webp, 30 seconds max, 20FPS max)", value="length"
             ),
+            app_commands.Choice(
+                name="Size (.webp, 30 seconds max, fits Discord's upload limit)",
+                value="size",
+            ),
             app_commands.Choice(
                 name="Compatibility (.gif, 10 seconds max, 10FPS max) (not recommended)",
                 value="compatibility",
@@ -89,17 +136,11 @@ class Videos(commands.Cog):
 
                 await interaction.followup.send(embed=embed, ephemeral=ephemeral)
 
-                with tempfile.NamedTemporaryFile(
-                    "wb", suffix=os.path.splitext(file.filename)[1], dir="tmp"
-                ) as tmp_input:
-                    # Save file to /tmp
-                    # noinspection PyTypeChecker
-                    await file.save(tmp_input.file)
-
-                    # Send converting message
+                # Show place in queue while waiting for a free slot
+                async def on_queue(position: int) -> None:
                     embed = discord.Embed(
-                        title="Converting...",
-                        description=f"{self.bot.options['loading-emoji']} Converting your video...",
+                        title="Waiting...",
+                        description=f"{self.bot.options['loading-emoji']} Waiting for a free slot to convert your video. You are **#{position}** in the queue.",
                         color=Color.orange(),
                     )
                     embed.set_footer(
@@ -109,106 +150,196 @@ class Videos(commands.Cog):
 
                     await interaction.edit_original_response(embed=embed)
 
-                    with tempfile.NamedTemporaryFile(
-                        "wb",
-                        suffix=(".gif" if mode.value == "compatibility" else ".webp"),
-                        dir="tmp",
-                    ) as tmp_output:
-                        if mode.value == "compatibility":
-                            # Run ffmpeg to convert to GIF, cap length at 10s
-                            proc = await asyncio.create_subprocess_exec(
-                                "ffmpeg",
-                                "-t",
-                                "10",
-                                "-i",
-                                tmp_input.name,
-                                "-vf",
-                                "fps=10,scale=400:-1:flags=lanczos,split[s0][s1];[s0]palettegen[p];[s1][p]paletteuse",
-                                "-loop",
-                                "0",
-                                "-y",
-                                tmp_output.name,
-                                stdout=asyncio.subprocess.PIPE,
-                                stderr=asyncio.subprocess.PIPE,
-                            )
-                        else:
-                            # Run ffmpeg to convert to WEBP
-                            proc = await asyncio.create_subprocess_exec(
-                                "ffmpeg",
-                                "-t",
-                                "10" if mode.value == "fps" else "30",
-                                "-i",
-                                tmp_input.name,
-                                "-vcodec",
-                                "libwebp",
-                                "-vf",
-                                f"{'fps=20,' if mode.value == 'length' else ''}scale=400:-1:flags=lanczos",
-                                "-lossless",
-                                "1",
-                                "-loop",
-                                "0",
-                                "-preset",
-                                "default",
-                                "-an",
-                                "-y",
-                                tmp_output.name,
-                                stdout=asyncio.subprocess.PIPE,
-                                stderr=asyncio.subprocess.PIPE,
-                            )
+                try:
+                    async with self.scheduler.slot(interaction.user.id, on_queue):
+                        # Send converting message
+                        embed = discord.Embed(
+                            title="Converting...",
+                            description=f"{self.bot.options['loading-emoji']} Converting your video...",
+                            color=Color.orange(),
+                        )
+                        embed.set_footer(
+                            text=f"@{interaction.user.name}",
+                            icon_url=interaction.user.display_avatar.url,
+                        )
 
-                        # Wait for ffmpeg to finish
-                        stdout, stderr = await proc.communicate()
+                        await interaction.edit_original_response(embed=embed)
 
-                        if proc.returncode == 0:
-                            # Send resized image
-                            embed = discord.Embed(
-                                title="Converting...",
-                                description=f"{self.bot.options['loading-emoji']} Sending the converted file...",
-                                color=Color.orange(),
-                            )
-                            embed.set_footer(
-                                text=f"@{interaction.user.name}",
-                                icon_url=interaction.user.display_avatar.url,
-                            )
-
-                            await interaction.edit_original_response(embed=embed)
+                        start = time.perf_counter()
+                        settings = None
 
-                            # Send resized image
-                            embed = discord.Embed(
-                                title="Video Converted",
-                                color=Color.green(),
+                        # ffmpeg streams the attachment itself, seeking with
+                        # range requests if the container needs it
+                        if mode.value == "compatibility":
+                            # Convert to GIF, cap length at 10s. GIF can be
+                            # written to a pipe
+                            output_data = await self.scheduler.run(
+                                [
+                                    "-t",
+                                    "10",
+                                    "-i",
+                                    file.url,
+                                    "-vf",
+                                    "fps=10,scale=400:-1:flags=lanczos,split[s0][s1];[s0]palettegen[p];[s1][p]paletteuse",
+                                    "-loop",
+                                    "0",
+                                    "-f",
+                                    "gif",
+                                    "pipe:1",
+                                ],
+                                timeout=self.TIMEOUT,
                             )
-                            embed.set_footer(
-                                text=f"@{interaction.user.name}",
-                                icon_url=interaction.user.display_avatar.url,
+                        elif mode.value == "size":
+                            # Work out settings from the video's length and size
+                            fps, width, quality, duration = self.pick_size_settings(
+                                await self.scheduler.probe(file.url)
+                            )
+                            settings = (
+                                f"`{width}px` wide, `{fps}FPS`, quality `{quality}`"
                             )
 
-                            if ephemeral:
-                                embed.add_field(
-                                    name="Alert",
-                                    value="This message is ephemeral, so the image will expire after 1 view. To keep using the image and not lose it, please download it, then resend it.",
-                                    inline=False,
+                            # WEBP needs a seekable output to write its header
+                            with tempfile.NamedTemporaryFile(
+                                "rb", suffix=".webp", dir="tmp"
+                            ) as tmp_output:
+                                await self.scheduler.run(
+                                    [
+                                        "-t",
+                                        f"{duration:.2f}",
+                                        "-i",
+                                        file.url,
+                                        "-vcodec",
+                                        "libwebp",
+                                        "-vf",
+                                        f"fps={fps},scale={width}:-2:flags=lanczos",
+                                        "-lossless",
+                                        "0",
+                                        "-quality",
+                                        str(quality),
+                                        "-loop",
+                                        "0",
+                                        "-preset",
+                                        "default",
+                                        "-an",
+                                        "-y",
+                                        tmp_output.name,
+                                    ],
+                                    timeout=self.TIMEOUT,
                                 )
-                            else:
-                                embed.add_field(
-                                    name="Tip",
-                                    value="If the message shows `Only you can see this message` below, the image will expire after 1 view. To bypass this, please download the image, resend it, then star that. Run the command in a channel where you have permissions to avoid this.",
-                                    inline=False,
+
+                                output_data = tmp_output.read()
+                        else:
+                            # WEBP needs a seekable output to write its header
+                            with tempfile.NamedTemporaryFile(
+                                "rb", suffix=".webp", dir="tmp"
+                            ) as tmp_output:
+                                await self.scheduler.run(
+                                    [
+                                        "-t",
+                                        "10" if mode.value == "fps" else "30",
+                                        "-i",
+                                        file.url,
+                                        "-vcodec",
+                                        "libwebp",
+                                        "-vf",
+                                        f"{'fps=20,' if mode.value == 'length' else ''}scale=400:-1:flags=lanczos",
+                                        "-lossless",
+                                        "1",
+                                        "-loop",
+                                        "0",
+                                        "-preset",
+                                        "default",
+                                        "-an",
+                                        "-y",
+                                        tmp_output.name,
+                                    ],
+                                    timeout=self.TIMEOUT,
                                 )
 
-                            file_processed = discord.File(
-                                fp=tmp_output.name,
-                                filename=f"titanium_{filename if filename else os.path.splitext(file.filename)[0]}.{'gif' if mode.value == 'compatibility' else 'webp'}",
-                                spoiler=spoiler,
-                            )
+                                output_data = tmp_output.read()
 
-                            await interaction.edit_original_response(
-                                embed=embed, attachments=[file_processed]
-                            )
-                        else:
-                            raise Exception(
-                                f"ffmpeg failed with code {proc.returncode}:\n\n{stderr.decode()}"
-                            )
+                        encode_time = time.perf_counter() - start
+                except FFmpegBusyError:
+                    embed = discord.Embed(
+                        title="Error",
+                        description="You already have a video converting. Please wait for it to finish.",
+                        color=Color.red(),
+                    )
+                    embed.set_footer(
+                        text=f"@{interaction.user.name}",
+                        icon_url=interaction.user.display_avatar.url,
+                    )
+
+                    await interaction.edit_original_response(embed=embed)
+                    return
+                except FFmpegTimeoutError:
+                    embed = discord.Embed(
+                        title="Error",
+                        description=f"Your video took too long to convert (limit: {self.TIMEOUT} seconds). Please try a shorter or smaller video.",
+                        color=Color.red(),
+                    )
+                    embed.set_footer(
+                        text=f"@{interaction.user.name}",
+                        icon_url=interaction.user.display_avatar.url,
+                    )
+
+                    await interaction.edit_original_response(embed=embed)
+                    return
+
+                # Send resized image
+                embed = discord.Embed(
+                    title="Converting...",
+                    description=f"{self.bot.options['loading-emoji']} Sending the converted file...",
+                    color=Color.orange(),
+                )
+                embed.set_footer(
+                    text=f"@{interaction.user.name}",
+                    icon_url=interaction.user.display_avatar.url,
+                )
+
+                await interaction.edit_original_response(embed=embed)
+
+                # Send resized image
+                embed = discord.Embed(
+                    title="Video Converted",
+                    color=Color.green(),
+                )
+                embed.add_field(name="Encode Time", value=f"`{encode_time:.1f}s`")
+                embed.add_field(
+                    name="Size",
+                    value=f"`{len(output_data) / 1000000:.2f}MB` (`{len(output_data) / file.size * 100:.0f}%` of original)",
+                )
+
+                if settings is not None:
+                    embed.add_field(name="Settings", value=settings)
+
+                embed.set_footer(
+                    text=f"@{interaction.user.name}",
+                    icon_url=interaction.user.display_avatar.url,
+                )
+
+                if ephemeral:
+                    embed.add_field(
+                        name="Alert",
+                        value="This message is ephemeral, so the image will expire after 1 view. To keep using the image and not lose it, please download it, then resend it.",
+                        inline=False,
+                    )
+                else:
+                    embed.add_field(
+                        name="Tip",
+                        value="If the message shows `Only you can see this message` below, the image will expire after 1 view. To bypass this, please download the image, resend it, then star that. Run the command in a channel where you have permissions to avoid this.",
+                        inline=False,
+                    )
+
+                file_processed = discord.File(
+                    fp=BytesIO(output_data),
+                    filename=f"titanium_{filename if filename else os.path.splitext(file.filename)[0]}.{'gif' if mode.value == 'compatibility' else 'webp'}",
+                    spoiler=spoiler,
+                )
+
+                await interaction.edit_original_response(
+                    embed=embed, attachments=[file_processed]
+                )
             else:  # If file is too large
                 embed = discord.Embed(
                     title="Error",
@@ -1,14 +1,15 @@
+import logging
 from textwrap import shorten
-from urllib.parse import quote
 
-import aiohttp
 import discord
 import spotipy
-from discord import ButtonStyle, Color, app_commands
+from discord import Color, app_commands
 from discord.ext import commands
 from discord.ui import View
 from spotipy.oauth2 import SpotifyClientCredentials
 
+from utils.paginator import Paginator
+
 
 class SongLyricSelection(discord.ui.Select):
     def __init__(self, data: list[dict], private: bool):
@@ -27,13 +28,7 @@ class SongLyricSelection(discord.ui.Select):
         self.view.stop()
         selected_song = self.values[0]
 
-        selected_song_data = None
-        for item in self.data:
-            if str(item["id"]) == selected_song:
-                selected_song_data = item
-                break
-
-        if not selected_song_data:
+        if not any(str(item["id"]) == selected_song for item in self.data):
             embed = discord.Embed(
                 title="Error",
                 description="Selected song not found.",
@@ -42,6 +37,20 @@ class SongLyricSelection(discord.ui.Select):
             await interaction.edit_original_response(embed=embed, view=None)
             return
 
+        # Only song info is kept in the menu, load the lyrics now
+        try:
+            selected_song_data = await interaction.client.lyrics.get(int(selected_song))
+        except Exception as error:
+            logging.error(f"[LYRICS] Error while fetching lyrics: {error}")
+
+            embed = discord.Embed(
+                title="Error",
+                description="Failed to fetch lyrics. Please try again later.",
+                color=Color.red(),
+            )
+            await interaction.edit_original_response(embed=embed, view=None)
+            return
+
         raw_lyrics: str = selected_song_data["plainLyrics"]
 
         lyrics_paragraphs = raw_lyrics.split("\n\n")
@@ -70,8 +79,10 @@ class SongLyricSelection(discord.ui.Select):
             info=selected_song_data,
         )
 
-        embed = await view._create_embed(0, interaction)
-        await interaction.edit_original_response(embed=embed, view=view)
+        embeds = await view.render(interaction, 0)
+        view.message = await interaction.edit_original_response(
+            embeds=embeds, view=view
+        )
 
 
 class SongLyricsSelectionView(View):
@@ -84,7 +95,7 @@ class SongLyricsSelectionView(View):
         await self.message.delete()
 
 
-class SongLyricsView(View):
+class SongLyricsView(Paginator):
     def __init__(
         self,
         pages: list,
@@ -92,161 +103,35 @@ class SongLyricsView(View):
         creator_id: int,
         info: dict,
     ):
-        super().__init__(timeout=900)
-
-        self.pages = pages
-        self.page = 0
-        self.locked = False
-        self.info = info
-
-        self.private = private
-        self.creator_id = creator_id
-
-        for item in self.children:
-            if item.custom_id == "first" or item.custom_id == "prev":
-                item.disabled = True
-            elif (item.custom_id == "next" or item.custom_id == "last") and len(
-                self.pages
-            ) <= 1:
-                item.disabled = True
-            elif item.custom_id == "lock" and self.private:
-                self.remove_item(item)
-
-    async def _create_embed(self, page: int, interaction: discord.Interaction):
-        embed = discord.Embed(
-            title=f"{self.info['name']} - Lyrics",
-            description=self.pages[page],
-            color=Color.random(),
-        )
-
-        embed.set_footer(
-            text=f"@{interaction.user.name} • Page {page + 1}/{len(self.pages)} • lrclib.net",
-            icon_url=interaction.user.display_avatar.url,
-        )
-        embed.set_author(
-            name=f"{self.info['artistName']}",
-        )
-
-        return embed
-
-    async def interaction_check(self, interaction: discord.Interaction):
-        if interaction.user.id != self.creator_id:
-            if self.locked:
-                embed = discord.Embed(
-                    title="Error",
-                    description="This command is locked. Only the owner can control it.",
-                    color=Color.red(),
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-            else:
-                return True
-        else:
-            return True
-
-    @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-    async def first_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        self.page = 0
-
-        for item in self.children:
-            item.disabled = False
-
-            if item.custom_id == "first" or item.custom_id == "prev":
-                item.disabled = True
-
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-    async def prev_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        if self.page - 1 == 0:
-            self.page -= 1
-
-            for item in self.children:
-                item.disabled = False
+        async def get_page(page: int) -> str:
+            return pages[page]
 
-                if item.custom_id == "first" or item.custom_id == "prev":
-                    item.disabled = True
-        else:
-            self.page -= 1
-
-            for item in self.children:
-                item.disabled = False
-
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    @discord.ui.button(emoji="🔓", style=ButtonStyle.green, custom_id="lock")
-    async def lock_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        if interaction.user.id == self.creator_id:
-            self.locked = not self.locked
-
-            if self.locked:
-                button.emoji = "🔒"
-                button.style = ButtonStyle.red
-            else:
-                button.emoji = "🔓"
-                button.style = ButtonStyle.green
-
-            await interaction.response.edit_message(view=self)
-        else:
+        def make_embed(
+            interaction: discord.Interaction, lyrics: str, page: int, page_count: int
+        ) -> discord.Embed:
             embed = discord.Embed(
-                title="Error",
-                description="Only the command runner can toggle the page controls lock.",
-                color=Color.red(),
+                title=f"{info['name']} - Lyrics",
+                description=lyrics,
+                color=Color.random(),
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-    async def next_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        if (self.page + 1) == (len(self.pages) - 1):
-            self.page += 1
-
-            for item in self.children:
-                item.disabled = False
-
-                if item.custom_id == "next" or item.custom_id == "last":
-                    item.disabled = True
-        else:
-            self.page += 1
-
-            for item in self.children:
-                item.disabled = False
-
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-    async def last_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        self.page = len(self.pages) - 1
 
-        for item in self.children:
-            item.disabled = False
+            embed.set_footer(
+                text=f"@{interaction.user.name} • Page {page + 1}/{page_count} • lrclib.net",
+                icon_url=interaction.user.display_avatar.url,
+            )
+            embed.set_author(
+                name=f"{info['artistName']}",
+            )
 
-            if item.custom_id == "next" or item.custom_id == "last":
-                item.disabled = True
+            return embed
 
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
+        # Private lyrics are only visible to their owner, so there's no lock
+        super().__init__(
+            len(pages),
+            get_page,
+            make_embed,
+            user_id=None if private else creator_id,
+        )
 
 
 class Music(commands.Cog):
@@ -276,31 +161,36 @@ class Music(commands.Cog):
         await interaction.response.defer(ephemeral=ephemeral)
 
         search_link = search.lstrip().lstrip("https://").lstrip("http://").lstrip("/")
-        url = ""
+        track, artist = search, None
+
+        # Expand spotify.link URL if present
+        if "spotify.link/" in search:
+            try:
+                search_link = (
+                    await self.bot.spotify_links.resolve(search)
+                ).removeprefix("https://")
+            except Exception as error:
+                logging.error(f"[LYRICS] Error while expanding URL: {error}")
 
         if search_link.startswith("open.spotify.com/track/"):
             try:
                 item = self.sp.track(f"https://{search_link}")
-                url = f"https://lrclib.net/api/search?track_name={quote(item['name'])}&artist_name={quote(item['artists'][0]['name'])}"
+                track, artist = item["name"], item["artists"][0]["name"]
             except spotipy.exceptions.SpotifyException:
                 pass
 
-        if url == "":
-            url = f"https://lrclib.net/api/search?track_name={quote(search)}"
+        try:
+            data = await self.bot.lyrics.search(track, artist)
+        except Exception as error:
+            logging.error(f"[LYRICS] Error while searching lyrics: {error}")
 
-        headers = {"User-Agent": "Titanium Discord Bot (https://titaniumbot.me)"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    embed = discord.Embed(
-                        title="Error",
-                        description="Failed to fetch lyrics. Please try again later.",
-                        color=Color.red(),
-                    )
-                    await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-
-                data = await response.json()
+            embed = discord.Embed(
+                title="Error",
+                description="Failed to fetch lyrics. Please try again later.",
+                color=Color.red(),
+            )
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
 
         if not data or data == []:
             embed = discord.Embed(
@@ -324,18 +324,7 @@ class SongURL(commands.Cog):
             # Expand spotify.link URL if present
             if "spotify.link" in url:
                 try:
-                    # noinspection HttpUrlsUsage
-                    url = (
-                        url.replace("www.", "")
-                        .replace("http://", "")
-                        .replace("https://", "")
-                        .rstrip("/")
-                    )
-                    url = f"https://{url}"
-
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url) as request:
-                            url = str(request.url)
+                    url = await self.bot.spotify_links.resolve(url)
                 except Exception as error:
                     logging.error(f"[SPOTURL] Error while expanding URL: {error}")
 
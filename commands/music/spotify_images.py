@@ -36,18 +36,7 @@ class SpotifyImages(commands.Cog):
 
         if "spotify.link" in url:
             try:
-                # noinspection HttpUrlsUsage
-                url = (
-                    url.replace("www.", "")
-                    .replace("http://", "")
-                    .replace("https://", "")
-                    .rstrip("/")
-                )
-                url = f"https://{url}"
-
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as request:
-                        url = str(request.url)
+                url = await self.bot.spotify_links.resolve(url)
 
             except Exception as error:
                 logging.error("[SPOTIMG] Error while expanding URL.")
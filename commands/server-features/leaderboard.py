@@ -7,8 +7,13 @@ from discord import ButtonStyle, Color, app_commands
 from discord.ext import commands
 from discord.ui import View
 
+from utils.paginator import Paginator
+
 
 class Leaderboard(commands.Cog):
+    # Users shown per leaderboard page
+    PAGE_SIZE = 10
+
     def __init__(self, bot):
         self.bot = bot
         self.lb_pool: asqlite.Pool = bot.lb_pool
@@ -171,267 +176,72 @@ class Leaderboard(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
-        pages = []
-
-        i = 0
-        page_str = ""
-
         async with self.lb_pool.acquire() as sql:
-            if (
+            enabled = (
                 await sql.fetchone(
                     f"SELECT name FROM sqlite_master WHERE type='table' AND name='{str(interaction.guild.id)}';"
                 )
                 is not None
-            ):
-                vals = await sql.fetchall(
-                    f"SELECT userMention, {sort_type.value} FROM '{interaction.guild.id}' ORDER BY {sort_type.value} DESC"
-                )
-                if vals != []:
-                    for val in vals:
-                        i += 1
-
-                        if page_str == "":
-                            page_str += f"{i}. {val[0]}: {val[1]}"
-                        else:
-                            page_str += f"\n{i}. {val[0]}: {val[1]}"
-
-                        # If there's 10 items in the current page, we split it into a new page
-                        if i % 10 == 0:
-                            pages.append(page_str)
-                            page_str = ""
-
-                    if page_str != "":
-                        pages.append(page_str)
-                else:
-                    pages.append("No Data")
-
-                class Leaderboard(View):
-                    def __init__(self, pages):
-                        super().__init__(timeout=900)
-                        self.page = 0
-                        self.pages = pages
-
-                        self.locked = False
-
-                        self.user_id: int
-                        self.msg_id: int
-
-                        for item in self.children:
-                            if item.custom_id == "first" or item.custom_id == "prev":
-                                item.disabled = True
-
-                    # Timeout
-                    async def on_timeout(self) -> None:
-                        try:
-                            for item in self.children:
-                                item.disabled = True
-
-                            msg = await interaction.channel.fetch_message(self.msg_id)
-                            await msg.edit(view=self)
-                        except Exception:
-                            pass
-
-                    async def interaction_check(self, interaction: discord.Interaction):
-                        if interaction.user.id != self.user_id:
-                            if self.locked:
-                                embed = discord.Embed(
-                                    title="Error",
-                                    description="This command is locked. Only the owner can control it.",
-                                    color=Color.red(),
-                                )
-                                await interaction.response.send_message(
-                                    embed=embed, ephemeral=True
-                                )
-                            else:
-                                return True
-                        else:
-                            return True
-
-                    @discord.ui.button(
-                        emoji="⏮️", style=ButtonStyle.red, custom_id="first"
-                    )
-                    async def first_button(
-                        self,
-                        interaction: discord.Interaction,
-                        button: discord.ui.Button,
-                    ):
-                        self.page = 0
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "first" or item.custom_id == "prev":
-                                item.disabled = True
-
-                        embed = discord.Embed(
-                            title=f"Server Leaderboard - {sort_type.name}",
-                            description=self.pages[self.page],
-                            color=Color.random(),
-                        )
-                        embed.set_footer(
-                            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}",
-                            icon_url=interaction.user.display_avatar.url,
-                        )
-
-                        await interaction.response.edit_message(embed=embed, view=self)
-
-                    @discord.ui.button(
-                        emoji="⏪", style=ButtonStyle.gray, custom_id="prev"
-                    )
-                    async def prev_button(
-                        self,
-                        interaction: discord.Interaction,
-                        button: discord.ui.Button,
-                    ):
-                        if self.page - 1 == 0:
-                            self.page -= 1
-
-                            for item in self.children:
-                                item.disabled = False
-
-                                if (
-                                    item.custom_id == "first"
-                                    or item.custom_id == "prev"
-                                ):
-                                    item.disabled = True
-                        else:
-                            self.page -= 1
-
-                            for item in self.children:
-                                item.disabled = False
-
-                        embed = discord.Embed(
-                            title=f"Server Leaderboard - {sort_type.name}",
-                            description=self.pages[self.page],
-                            color=Color.random(),
-                        )
-                        embed.set_footer(
-                            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}",
-                            icon_url=interaction.user.display_avatar.url,
-                        )
-
-                        await interaction.response.edit_message(embed=embed, view=self)
-
-                    @discord.ui.button(
-                        emoji="🔓", style=ButtonStyle.green, custom_id="lock"
-                    )
-                    async def lock_button(
-                        self,
-                        interaction: discord.Interaction,
-                        button: discord.ui.Button,
-                    ):
-                        if interaction.user.id == self.user_id:
-                            self.locked = not self.locked
-
-                            if self.locked:
-                                button.emoji = "🔒"
-                                button.style = ButtonStyle.red
-                            else:
-                                button.emoji = "🔓"
-                                button.style = ButtonStyle.green
-
-                            await interaction.response.edit_message(view=self)
-                        else:
-                            embed = discord.Embed(
-                                title="Error",
-                                description="Only the command runner can toggle the page controls lock.",
-                                color=Color.red(),
-                            )
-                            await interaction.response.send_message(
-                                embed=embed, ephemeral=True
-                            )
-
-                    @discord.ui.button(
-                        emoji="⏩", style=ButtonStyle.gray, custom_id="next"
-                    )
-                    async def next_button(
-                        self,
-                        interaction: discord.Interaction,
-                        button: discord.ui.Button,
-                    ):
-                        if (self.page + 1) == (len(self.pages) - 1):
-                            self.page += 1
-
-                            for item in self.children:
-                                item.disabled = False
-
-                                if item.custom_id == "next" or item.custom_id == "last":
-                                    item.disabled = True
-                        else:
-                            self.page += 1
-
-                            for item in self.children:
-                                item.disabled = False
-
-                        embed = discord.Embed(
-                            title=f"Server Leaderboard - {sort_type.name}",
-                            description=self.pages[self.page],
-                            color=Color.red(),
-                        )
-                        embed.set_footer(
-                            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}",
-                            icon_url=interaction.user.display_avatar.url,
-                        )
-
-                        await interaction.response.edit_message(embed=embed, view=self)
-
-                    @discord.ui.button(
-                        emoji="⏭️", style=ButtonStyle.green, custom_id="last"
-                    )
-                    async def last_button(
-                        self,
-                        interaction: discord.Interaction,
-                        button: discord.ui.Button,
-                    ):
-                        self.page = len(self.pages) - 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "next" or item.custom_id == "last":
-                                item.disabled = True
+            )
 
-                        embed = discord.Embed(
-                            title=f"Server Leaderboard - {sort_type.name}",
-                            description=self.pages[self.page],
-                            color=Color.random(),
-                        )
-                        embed.set_footer(
-                            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}",
-                            icon_url=interaction.user.display_avatar.url,
-                        )
+            if enabled:
+                count = (
+                    await sql.fetchone(f"SELECT COUNT(*) FROM '{interaction.guild.id}'")
+                )[0]
 
-                        await interaction.response.edit_message(embed=embed, view=self)
+        if not enabled:
+            embed = discord.Embed(
+                title="Not Enabled",
+                description="The message leaderboard is not enabled in this server. Ask an admin to enable it first.",
+                color=Color.red(),
+            )
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
 
-                embed = discord.Embed(
-                    title=f"Server Leaderboard - {sort_type.name}",
-                    description=pages[0],
-                    color=Color.random(),
+        # Only the rows for the pages being looked at are loaded
+        async def get_page(page: int) -> list:
+            async with self.lb_pool.acquire() as sql:
+                return await sql.fetchall(
+                    f"SELECT userMention, {sort_type.value} FROM '{interaction.guild.id}' ORDER BY {sort_type.value} DESC, rowid LIMIT ? OFFSET ?",
+                    (self.PAGE_SIZE, page * self.PAGE_SIZE),
                 )
-                embed.set_footer(
-                    text=f"Controlling: @{interaction.user.name} • Page 1/{len(pages)}",
-                    icon_url=interaction.user.display_avatar.url,
+
+        def make_embed(
+            interaction: discord.Interaction, rows: list, page: int, page_count: int
+        ) -> discord.Embed:
+            embed = discord.Embed(
+                title=f"Server Leaderboard - {sort_type.name}",
+                description="\n".join(
+                    f"{page * self.PAGE_SIZE + i + 1}. {row[0]}: {row[1]}"
+                    for i, row in enumerate(rows)
                 )
+                or "No Data",
+                color=Color.random(),
+            )
+            embed.set_footer(
+                text=f"Controlling: @{interaction.user.name} • Page {page + 1}/{page_count}",
+                icon_url=interaction.user.display_avatar.url,
+            )
 
-                if len(pages) == 1:
-                    await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-                else:
-                    webhook = await interaction.followup.send(
-                        embed=embed,
-                        view=Leaderboard(pages),
-                        ephemeral=ephemeral,
-                        wait=True,
-                    )
+            return embed
 
-                    Leaderboard.user_id = interaction.user.id
-                    Leaderboard.msg_id = webhook.id
-            else:
-                embed = discord.Embed(
-                    title="Not Enabled",
-                    description="The message leaderboard is not enabled in this server. Ask an admin to enable it first.",
-                    color=Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+        view = Paginator(
+            -(-count // self.PAGE_SIZE),
+            get_page,
+            make_embed,
+            user_id=interaction.user.id,
+        )
+        embeds = await view.render(interaction, 0)
+
+        if view.page_count == 1:
+            await interaction.followup.send(embeds=embeds, ephemeral=ephemeral)
+        else:
+            view.message = await interaction.followup.send(
+                embeds=embeds,
+                view=view,
+                ephemeral=ephemeral,
+                wait=True,
+            )
 
     # Opt out command
     @lbGroup.command(
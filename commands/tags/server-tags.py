@@ -1,10 +1,10 @@
-import asqlite
 import discord
-from discord import ButtonStyle, Color, app_commands
+from discord import Color, app_commands
 from discord.ext import commands
-from discord.ui import View
 from discord.utils import escape_markdown
-from thefuzz import process
+
+from utils.paginator import Paginator
+from utils.tags import TagCache
 
 
 # Tag Create Form
@@ -62,24 +62,12 @@ class TagEditModal(discord.ui.Modal, title="Edit Selected Tag"):
 
 
 class ServerTags(commands.Cog):
+    # Tags shown per list page
+    PAGE_SIZE = 10
+
     def __init__(self, bot):
         self.bot = bot
-        self.tags_pool: asqlite.Pool = bot.tags_pool
-        self.tags: dict = {}
-
-        self.bot.loop.create_task(self.get_tag_lists())
-
-    # List refresh function
-    async def get_tag_lists(self):
-        async with self.tags_pool.acquire() as sql:
-            # Get all tags
-            tags = await sql.fetchall("SELECT * FROM tags")
-
-            for tag in tags:
-                if tag[1] not in self.tags:
-                    self.tags[tag[1]] = {}
-
-                self.tags[tag[1]][tag[2]] = tag[3]
+        self.tags: TagCache = bot.tags
 
     async def server_tag_autocomplete(
         self, interaction: discord.Interaction, current: str
@@ -92,32 +80,22 @@ class ServerTags(commands.Cog):
                 ),
             ]
         else:
-            try:
-                if self.tags[interaction.guild_id] == []:
-                    return []
-                else:
-                    if current == "":
-                        # Sort by name alphabetically, show first 25
-                        sorted = list(self.tags[interaction.guild_id].keys())[:25]
-
-                        return [
-                            app_commands.Choice(name=value, value=value)
-                            for value in sorted
-                        ]
-                    else:
-                        matches = process.extract(
-                            current.lower(),
-                            list(self.tags[interaction.guild_id].keys()),
-                            limit=10,
-                        )
+            names = await self.tags.names(interaction.guild_id)
+
+            if current == "":
+                # Sort by name alphabetically, show first 25
+                return [
+                    app_commands.Choice(name=value, value=value)
+                    for value in names.first(25)
+                ]
+            else:
+                matches = names.search(current, limit=10)
 
-                        return [
-                            app_commands.Choice(name=match[0], value=match[0])
-                            for match in matches
-                            if match[1] >= 60
-                        ]
-            except KeyError:
-                return []
+                return [
+                    app_commands.Choice(name=match[0], value=match[0])
+                    for match in matches
+                    if match[1] >= 60
+                ]
 
     # Server Tags Use command
     @app_commands.command(name="server-tag", description="Use a server tag.")
@@ -142,28 +120,21 @@ class ServerTags(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
             return
 
-        try:
-            # Check if tag name is in list
-            if tag not in list(self.tags[interaction.guild_id].keys()):
-                embed = discord.Embed(
-                    title="Error",
-                    description="That tag doesn't exist.",
-                    color=Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-            else:
-                await interaction.followup.send(
-                    self.tags[interaction.guild_id][tag],
-                    ephemeral=ephemeral,
-                    allowed_mentions=discord.AllowedMentions.none(),
-                )
-        except KeyError:
+        content = await self.tags.content(interaction.guild_id, tag)
+
+        if content is None:
             embed = discord.Embed(
                 title="Error",
                 description="That tag doesn't exist.",
                 color=Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+        else:
+            await interaction.followup.send(
+                content,
+                ephemeral=ephemeral,
+                allowed_mentions=discord.AllowedMentions.none(),
+            )
 
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=False, private_channel=False
@@ -184,199 +155,62 @@ class ServerTags(commands.Cog):
     async def tags_list(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        if interaction.guild_id not in self.tags:
-            my_tags = []
-        else:
-
-            def format_tag_content(content: str) -> str:
-                if content.startswith("https://cdn.discordapp.com/"):
-                    return "`[Attachment]`"
-                return (
-                    f"`{escape_markdown(content[:30])}...`"
-                    if len(content) > 30
-                    else f"`{escape_markdown(content)}`"
-                )
-
-            my_tags = (
-                f"{key} ({format_tag_content(self.tags[interaction.guild_id][key])})"
-                for key in self.tags[interaction.guild_id].keys()
+        def format_tag_content(content: str) -> str:
+            if content.startswith("https://cdn.discordapp.com/"):
+                return "`[Attachment]`"
+            return (
+                f"`{escape_markdown(content[:30])}...`"
+                if len(content) > 30
+                else f"`{escape_markdown(content)}`"
             )
 
-        if my_tags == []:
+        tag_count = len(await self.tags.names(interaction.guild_id))
+
+        if tag_count == 0:
             embed = discord.Embed(
                 title="Tags",
                 description="The server don't have any tags.",
                 color=Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-        else:
-            pages = []
-            page_str = ""
-            i = 0
-
-            for tag in my_tags:
-                i += 1
-
-                if page_str == "":
-                    page_str += f"{i}. {tag}"
-                else:
-                    page_str += f"\n{i}. {tag}"
-
-                # If there's 10 items in the current page, we split it into a new page
-                if i % 10 == 0:
-                    pages.append(page_str)
-                    page_str = ""
-
-            if page_str != "":
-                pages.append(page_str)
-
-            class Leaderboard(View):
-                def __init__(self, pages):
-                    super().__init__(timeout=900)
-                    self.page = 0
-                    self.pages = pages
-
-                    self.msg_id: int
-
-                    for item in self.children:
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-
-                # Timeout
-                async def on_timeout(self) -> None:
-                    try:
-                        for item in self.children:
-                            item.disabled = True
-
-                        msg = await interaction.channel.fetch_message(self.msg_id)
-                        await msg.edit(view=self)
-                    except Exception:
-                        pass
-
-                @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-                async def first_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    self.page = 0
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.random(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.response.edit_message(embed=embed, view=self)
-
-                @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-                async def prev_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    if self.page - 1 == 0:
-                        self.page -= 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "first" or item.custom_id == "prev":
-                                item.disabled = True
-                    else:
-                        self.page -= 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.random(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.response.edit_message(embed=embed, view=self)
-
-                @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-                async def next_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    if (self.page + 1) == (len(self.pages) - 1):
-                        self.page += 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "next" or item.custom_id == "last":
-                                item.disabled = True
-                    else:
-                        self.page += 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.red(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.response.edit_message(embed=embed, view=self)
-
-                @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-                async def last_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    self.page = len(self.pages) - 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "next" or item.custom_id == "last":
-                            item.disabled = True
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.random(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
+            return
 
-                    await interaction.response.edit_message(embed=embed, view=self)
+        # Only the start of each tag on the pages being looked at is loaded
+        async def get_page(page: int) -> list[tuple[str, str]]:
+            return await self.tags.previews(
+                interaction.guild_id, 31, self.PAGE_SIZE, page * self.PAGE_SIZE
+            )
 
+        def make_embed(
+            interaction: discord.Interaction,
+            tags: list[tuple[str, str]],
+            page: int,
+            page_count: int,
+        ) -> discord.Embed:
             embed = discord.Embed(
-                title="Tags", description=pages[0], color=Color.random()
+                title="Tags",
+                description="\n".join(
+                    f"{page * self.PAGE_SIZE + i + 1}. {name} ({format_tag_content(content)})"
+                    for i, (name, content) in enumerate(tags)
+                ),
+                color=Color.random(),
             )
             embed.set_footer(
-                text=f"Page 1/{len(pages)}",
+                text=f"Page {page + 1}/{page_count}",
                 icon_url=interaction.user.display_avatar.url,
             )
 
-            if len(pages) == 1:
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                webhook = await interaction.followup.send(
-                    embed=embed, view=Leaderboard(pages), ephemeral=True, wait=True
-                )
+            return embed
 
-                Leaderboard.msg_id = webhook.id
+        view = Paginator(-(-tag_count // self.PAGE_SIZE), get_page, make_embed)
+        embeds = await view.render(interaction, 0)
+
+        if view.page_count == 1:
+            await interaction.followup.send(embeds=embeds, ephemeral=True)
+        else:
+            view.message = await interaction.followup.send(
+                embeds=embeds, view=view, ephemeral=True, wait=True
+            )
 
     # Tags Create command
     @tagsGroup.command(name="create", description="Create a new tag.")
@@ -398,9 +232,7 @@ class ServerTags(commands.Cog):
         if name == "":
             return
         else:
-            if interaction.guild_id in self.tags and name in list(
-                self.tags[interaction.guild_id].keys()
-            ):
+            if name in await self.tags.names(interaction.guild_id):
                 embed = discord.Embed(
                     title="Error",
                     description="That tag already exists.",
@@ -424,34 +256,13 @@ class ServerTags(commands.Cog):
                         )
                         await interaction.followup.send(embed=embed, ephemeral=True)
                     else:
-                        if attachment is not None:
-                            async with self.tags_pool.acquire() as sql:
-                                await sql.execute(
-                                    "INSERT INTO tags (creatorID, name, content) VALUES (?, ?, ?)",
-                                    (interaction.guild_id, name, attachment.url),
-                                )
-
-                            if interaction.guild_id not in self.tags:
-                                self.tags[interaction.guild_id] = {}
-
-                            self.tags[interaction.guild_id][name] = attachment.url
-                        else:
-                            async with self.tags_pool.acquire() as sql:
-                                await sql.execute(
-                                    "INSERT INTO tags (creatorID, name, content) VALUES (?, ?, ?)",
-                                    (
-                                        interaction.guild_id,
-                                        name,
-                                        tagModal.content.value,
-                                    ),
-                                )
-
-                            if interaction.guild_id not in self.tags:
-                                self.tags[interaction.guild_id] = {}
-
-                            self.tags[interaction.guild_id][name] = (
-                                tagModal.content.value
-                            )
+                        await self.tags.create(
+                            interaction.guild_id,
+                            name,
+                            attachment.url
+                            if attachment is not None
+                            else tagModal.content.value,
+                        )
 
                         embed = discord.Embed(
                             title="Success",
@@ -476,14 +287,12 @@ class ServerTags(commands.Cog):
     ):
         tag = tag.lower()
 
-        if interaction.guild_id not in self.tags or tag not in list(
-            self.tags[interaction.guild_id].keys()
-        ):
+        if tag not in await self.tags.names(interaction.guild_id):
             embed = discord.Embed(
                 title="Error", description="That tag doesn't exist.", color=Color.red()
             )
 
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         else:
             tagModal = TagCreateModal()
@@ -514,7 +323,7 @@ class ServerTags(commands.Cog):
                         await interaction.followup.send(embed=embed, ephemeral=True)
                         return
                     else:
-                        if name in list(self.tags[interaction.guild_id].keys()):
+                        if name in await self.tags.names(interaction.guild_id):
                             embed = discord.Embed(
                                 title="Error",
                                 description="New tag name is already in use.",
@@ -535,52 +344,17 @@ class ServerTags(commands.Cog):
 
                 # Update Attachment / Content
                 if attachment is not None:  # Attachment
-                    async with self.tags_pool.acquire() as sql:
-                        await sql.execute(
-                            "UPDATE tags SET content = ? WHERE creatorID = ? AND name = ?",
-                            (
-                                attachment.url,
-                                interaction.guild_id,
-                                tag,
-                            ),
-                        )
-
-                    if interaction.guild_id not in self.tags:
-                        self.tags[interaction.guild_id] = {}
-
-                    self.tags[interaction.guild_id][tag] = attachment.url
-                else:  # Content
-                    async with self.tags_pool.acquire() as sql:
-                        await sql.execute(
-                            "UPDATE tags SET content = ? WHERE creatorID = ? AND name = ?",
-                            (
-                                tagModal.content.value,
-                                interaction.guild_id,
-                                tag,
-                            ),
-                        )
-
-                    if interaction.guild_id not in self.tags:
-                        self.tags[interaction.guild_id] = {}
-
-                    self.tags[interaction.guild_id][tag] = tagModal.content.value
+                    await self.tags.set_content(
+                        interaction.guild_id, tag, attachment.url
+                    )
+                elif tagModal.content.value != "":  # Content
+                    await self.tags.set_content(
+                        interaction.guild_id, tag, tagModal.content.value
+                    )
 
                 # Update Name
                 if name != "":
-                    async with self.tags_pool.acquire() as sql:
-                        await sql.execute(
-                            "UPDATE tags SET name = ? WHERE creatorID = ? AND name = ?",
-                            (
-                                name,
-                                interaction.guild_id,
-                                tag,
-                            ),
-                        )
-
-                    self.tags[interaction.guild_id][name] = self.tags[
-                        interaction.guild_id
-                    ][tag]
-                    del self.tags[interaction.guild_id][tag]
+                    await self.tags.rename(interaction.guild_id, tag, name)
 
                 embed = discord.Embed(
                     title="Success", description="Tag updated.", color=Color.green()
@@ -597,24 +371,13 @@ class ServerTags(commands.Cog):
 
         tag = tag.lower()
 
-        if interaction.guild_id in self.tags and tag not in list(
-            self.tags[interaction.guild_id].keys()
-        ):
+        if tag not in await self.tags.names(interaction.guild_id):
             embed = discord.Embed(
                 title="Error", description="That tag doesn't exist.", color=Color.red()
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
         else:
-            async with self.tags_pool.acquire() as sql:
-                await sql.execute(
-                    "DELETE FROM tags WHERE creatorID = ? AND name = ?",
-                    (
-                        interaction.guild_id,
-                        tag,
-                    ),
-                )
-
-            del self.tags[interaction.guild_id][tag]
+            await self.tags.delete(interaction.guild_id, tag)
 
             embed = discord.Embed(
                 title="Success", description="Tag deleted.", color=Color.green()
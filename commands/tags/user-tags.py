@@ -1,10 +1,10 @@
-import asqlite
 import discord
-from discord import ButtonStyle, Color, app_commands
+from discord import Color, app_commands
 from discord.ext import commands
-from discord.ui import View
 from discord.utils import escape_markdown
-from thefuzz import process
+
+from utils.paginator import Paginator
+from utils.tags import TagCache
 
 
 # Tag Create Form
@@ -62,53 +62,32 @@ class TagEditModal(discord.ui.Modal, title="Edit Selected Tag"):
 
 
 class UserTags(commands.Cog):
+    # Tags shown per list page
+    PAGE_SIZE = 10
+
     def __init__(self, bot):
         self.bot = bot
-        self.tags_pool: asqlite.Pool = bot.tags_pool
-        self.tags: dict = {}
-
-        self.bot.loop.create_task(self.get_tag_lists())
-
-    # List refresh function
-    async def get_tag_lists(self):
-        async with self.tags_pool.acquire() as sql:
-            # Get all tags
-            tags = await sql.fetchall("SELECT * FROM tags")
-
-            for tag in tags:
-                if tag[1] not in self.tags:
-                    self.tags[tag[1]] = {}
-
-                self.tags[tag[1]][tag[2]] = tag[3]
+        self.tags: TagCache = bot.tags
 
     async def user_tag_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        try:
-            if self.tags[interaction.user.id] == []:
-                return []
-            else:
-                if current == "":
-                    # Sort by name alphabetically, show first 25
-                    sorted = list(self.tags[interaction.user.id].keys())[:25]
-
-                    return [
-                        app_commands.Choice(name=value, value=value) for value in sorted
-                    ]
-                else:
-                    matches = process.extract(
-                        current.lower(),
-                        list(self.tags[interaction.user.id].keys()),
-                        limit=10,
-                    )
+        names = await self.tags.names(interaction.user.id)
+
+        if current == "":
+            # Sort by name alphabetically, show first 25
+            return [
+                app_commands.Choice(name=value, value=value)
+                for value in names.first(25)
+            ]
+        else:
+            matches = names.search(current, limit=10)
 
-                    return [
-                        app_commands.Choice(name=match[0], value=match[0])
-                        for match in matches
-                        if match[1] >= 60
-                    ]
-        except KeyError:
-            return []
+            return [
+                app_commands.Choice(name=match[0], value=match[0])
+                for match in matches
+                if match[1] >= 60
+            ]
 
     # User Tags Use command
     @app_commands.command(name="user-tag", description="Use a user tag.")
@@ -123,26 +102,21 @@ class UserTags(commands.Cog):
 
         tag = tag.lower()
 
-        try:
-            # Check if tag name is in list
-            if tag not in list(self.tags[interaction.user.id].keys()):
-                embed = discord.Embed(
-                    title="Error",
-                    description="That tag doesn't exist.",
-                    color=Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-            else:
-                await interaction.followup.send(
-                    self.tags[interaction.user.id][tag],
-                    ephemeral=ephemeral,
-                    allowed_mentions=discord.AllowedMentions.none(),
-                )
-        except KeyError:
+        content = await self.tags.content(interaction.user.id, tag)
+
+        if content is None:
             embed = discord.Embed(
-                title="Error", description="That tag doesn't exist.", color=Color.red()
+                title="Error",
+                description="That tag doesn't exist.",
+                color=Color.red(),
             )
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+        else:
+            await interaction.followup.send(
+                content,
+                ephemeral=ephemeral,
+                allowed_mentions=discord.AllowedMentions.none(),
+            )
 
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=True, private_channel=True
@@ -161,197 +135,60 @@ class UserTags(commands.Cog):
     async def tags_list(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        if interaction.user.id not in self.tags:
-            my_tags = []
-        else:
-
-            def format_tag_content(content: str) -> str:
-                if content.startswith("https://cdn.discordapp.com/"):
-                    return "`[Attachment]`"
-                return (
-                    f"`{escape_markdown(content[:30])}...`"
-                    if len(content) > 30
-                    else f"`{escape_markdown(content)}`"
-                )
-
-            my_tags = (
-                f"{key} ({format_tag_content(self.tags[interaction.user.id][key])})"
-                for key in self.tags[interaction.user.id].keys()
+        def format_tag_content(content: str) -> str:
+            if content.startswith("https://cdn.discordapp.com/"):
+                return "`[Attachment]`"
+            return (
+                f"`{escape_markdown(content[:30])}...`"
+                if len(content) > 30
+                else f"`{escape_markdown(content)}`"
             )
 
-        if my_tags == []:
+        tag_count = len(await self.tags.names(interaction.user.id))
+
+        if tag_count == 0:
             embed = discord.Embed(
                 title="Tags", description="You don't have any tags.", color=Color.red()
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-        else:
-            pages = []
-            page_str = ""
-            i = 0
-
-            for tag in my_tags:
-                i += 1
-
-                if page_str == "":
-                    page_str += f"{i}. {tag}"
-                else:
-                    page_str += f"\n{i}. {tag}"
-
-                # If there's 10 items in the current page, we split it into a new page
-                if i % 10 == 0:
-                    pages.append(page_str)
-                    page_str = ""
-
-            if page_str != "":
-                pages.append(page_str)
-
-            class Leaderboard(View):
-                def __init__(self, pages):
-                    super().__init__(timeout=900)
-                    self.page = 0
-                    self.pages = pages
-
-                    self.msg_id: int
-
-                    for item in self.children:
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-
-                # Timeout
-                async def on_timeout(self) -> None:
-                    try:
-                        for item in self.children:
-                            item.disabled = True
-
-                        msg = await interaction.channel.fetch_message(self.msg_id)
-                        await msg.edit(view=self)
-                    except Exception:
-                        pass
-
-                @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-                async def first_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    self.page = 0
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.random(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.response.edit_message(embed=embed, view=self)
-
-                @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-                async def prev_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    if self.page - 1 == 0:
-                        self.page -= 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "first" or item.custom_id == "prev":
-                                item.disabled = True
-                    else:
-                        self.page -= 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.random(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.response.edit_message(embed=embed, view=self)
-
-                @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-                async def next_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    if (self.page + 1) == (len(self.pages) - 1):
-                        self.page += 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "next" or item.custom_id == "last":
-                                item.disabled = True
-                    else:
-                        self.page += 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.red(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.response.edit_message(embed=embed, view=self)
-
-                @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-                async def last_button(
-                    self, interaction: discord.Interaction, button: discord.ui.Button
-                ):
-                    self.page = len(self.pages) - 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "next" or item.custom_id == "last":
-                            item.disabled = True
-
-                    embed = discord.Embed(
-                        title="Tags",
-                        description=self.pages[self.page],
-                        color=Color.random(),
-                    )
-                    embed.set_footer(
-                        text=f"Page {self.page + 1}/{len(self.pages)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
+            return
 
-                    await interaction.response.edit_message(embed=embed, view=self)
+        # Only the start of each tag on the pages being looked at is loaded
+        async def get_page(page: int) -> list[tuple[str, str]]:
+            return await self.tags.previews(
+                interaction.user.id, 31, self.PAGE_SIZE, page * self.PAGE_SIZE
+            )
 
+        def make_embed(
+            interaction: discord.Interaction,
+            tags: list[tuple[str, str]],
+            page: int,
+            page_count: int,
+        ) -> discord.Embed:
             embed = discord.Embed(
-                title="Tags", description=pages[0], color=Color.random()
+                title="Tags",
+                description="\n".join(
+                    f"{page * self.PAGE_SIZE + i + 1}. {name} ({format_tag_content(content)})"
+                    for i, (name, content) in enumerate(tags)
+                ),
+                color=Color.random(),
             )
             embed.set_footer(
-                text=f"Page 1/{len(pages)}",
+                text=f"Page {page + 1}/{page_count}",
                 icon_url=interaction.user.display_avatar.url,
             )
 
-            if len(pages) == 1:
-                await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                webhook = await interaction.followup.send(
-                    embed=embed, view=Leaderboard(pages), ephemeral=True, wait=True
-                )
+            return embed
 
-                Leaderboard.msg_id = webhook.id
+        view = Paginator(-(-tag_count // self.PAGE_SIZE), get_page, make_embed)
+        embeds = await view.render(interaction, 0)
+
+        if view.page_count == 1:
+            await interaction.followup.send(embeds=embeds, ephemeral=True)
+        else:
+            view.message = await interaction.followup.send(
+                embeds=embeds, view=view, ephemeral=True, wait=True
+            )
 
     # Tags Create command
     @tagsGroup.command(name="create", description="Create a new tag.")
@@ -373,9 +210,7 @@ class UserTags(commands.Cog):
         if name == "":
             return
         else:
-            if interaction.user.id in self.tags and name in list(
-                self.tags[interaction.user.id].keys()
-            ):
+            if name in await self.tags.names(interaction.user.id):
                 embed = discord.Embed(
                     title="Error",
                     description="That tag already exists.",
@@ -399,30 +234,13 @@ class UserTags(commands.Cog):
                         )
                         await interaction.followup.send(embed=embed, ephemeral=True)
                     else:
-                        if attachment is not None:
-                            async with self.tags_pool.acquire() as sql:
-                                await sql.execute(
-                                    "INSERT INTO tags (creatorID, name, content) VALUES (?, ?, ?)",
-                                    (interaction.user.id, name, attachment.url),
-                                )
-
-                            if interaction.user.id not in self.tags:
-                                self.tags[interaction.user.id] = {}
-
-                            self.tags[interaction.user.id][name] = attachment.url
-                        else:
-                            async with self.tags_pool.acquire() as sql:
-                                await sql.execute(
-                                    "INSERT INTO tags (creatorID, name, content) VALUES (?, ?, ?)",
-                                    (interaction.user.id, name, tagModal.content.value),
-                                )
-
-                            if interaction.user.id not in self.tags:
-                                self.tags[interaction.user.id] = {}
-
-                            self.tags[interaction.user.id][name] = (
-                                tagModal.content.value
-                            )
+                        await self.tags.create(
+                            interaction.user.id,
+                            name,
+                            attachment.url
+                            if attachment is not None
+                            else tagModal.content.value,
+                        )
 
                         embed = discord.Embed(
                             title="Success",
@@ -447,14 +265,12 @@ class UserTags(commands.Cog):
     ):
         tag = tag.lower()
 
-        if interaction.user.id not in self.tags or tag not in list(
-            self.tags[interaction.user.id].keys()
-        ):
+        if tag not in await self.tags.names(interaction.user.id):
             embed = discord.Embed(
                 title="Error", description="That tag doesn't exist.", color=Color.red()
             )
 
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         else:
             tagModal = TagCreateModal()
@@ -485,7 +301,7 @@ class UserTags(commands.Cog):
                         await interaction.followup.send(embed=embed, ephemeral=True)
                         return
                     else:
-                        if name in list(self.tags[interaction.user.id].keys()):
+                        if name in await self.tags.names(interaction.user.id):
                             embed = discord.Embed(
                                 title="Error",
                                 description="New tag name is already in use.",
@@ -506,52 +322,17 @@ class UserTags(commands.Cog):
 
                 # Update Attachment / Content
                 if attachment is not None:  # Attachment
-                    async with self.tags_pool.acquire() as sql:
-                        await sql.execute(
-                            "UPDATE tags SET content = ? WHERE creatorID = ? AND name = ?",
-                            (
-                                attachment.url,
-                                interaction.user.id,
-                                tag,
-                            ),
-                        )
-
-                    if interaction.user.id not in self.tags:
-                        self.tags[interaction.user.id] = {}
-
-                    self.tags[interaction.user.id][tag] = attachment.url
-                else:  # Content
-                    async with self.tags_pool.acquire() as sql:
-                        await sql.execute(
-                            "UPDATE tags SET content = ? WHERE creatorID = ? AND name = ?",
-                            (
-                                tagModal.content.value,
-                                interaction.user.id,
-                                tag,
-                            ),
-                        )
-
-                    if interaction.user.id not in self.tags:
-                        self.tags[interaction.user.id] = {}
-
-                    self.tags[interaction.user.id][tag] = tagModal.content.value
+                    await self.tags.set_content(
+                        interaction.user.id, tag, attachment.url
+                    )
+                elif tagModal.content.value != "":  # Content
+                    await self.tags.set_content(
+                        interaction.user.id, tag, tagModal.content.value
+                    )
 
                 # Update Name
                 if name != "":
-                    async with self.tags_pool.acquire() as sql:
-                        await sql.execute(
-                            "UPDATE tags SET name = ? WHERE creatorID = ? AND name = ?",
-                            (
-                                name,
-                                interaction.user.id,
-                                tag,
-                            ),
-                        )
-
-                    self.tags[interaction.user.id][name] = self.tags[
-                        interaction.user.id
-                    ][tag]
-                    del self.tags[interaction.user.id][tag]
+                    await self.tags.rename(interaction.user.id, tag, name)
 
                 embed = discord.Embed(
                     title="Success", description="Tag updated.", color=Color.green()
@@ -568,24 +349,13 @@ class UserTags(commands.Cog):
 
         tag = tag.lower()
 
-        if interaction.user.id in self.tags and tag not in list(
-            self.tags[interaction.user.id].keys()
-        ):
+        if tag not in await self.tags.names(interaction.user.id):
             embed = discord.Embed(
                 title="Error", description="That tag doesn't exist.", color=Color.red()
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
         else:
-            async with self.tags_pool.acquire() as sql:
-                await sql.execute(
-                    "DELETE FROM tags WHERE creatorID = ? AND name = ?",
-                    (
-                        interaction.user.id,
-                        tag,
-                    ),
-                )
-
-            del self.tags[interaction.user.id][tag]
+            await self.tags.delete(interaction.user.id, tag)
 
             embed = discord.Embed(
                 title="Success", description="Tag deleted.", color=Color.green()
@@ -8,17 +8,20 @@ from typing import TYPE_CHECKING
 import discord
 import discord.ext
 import discord.ext.commands
-from discord import ButtonStyle, Color, app_commands
+from discord import Color, app_commands
 from discord.ext import commands
-from discord.ui import View
 
 import utils.return_ctrlguild as ctrl
+from utils.paginator import Paginator
 
 if TYPE_CHECKING:
     from commands.automated.status_update import StatusUpdate
 
 
 class CogUtils(commands.Cog):
+    # Servers shown per server list page
+    SERVER_PAGE_SIZE = 20
+
     def __init__(self, bot):
         self.bot = bot
         self.bot: discord.ext.commands.Bot
@@ -370,155 +373,43 @@ class CogUtils(commands.Cog):
         name="server-list", description="Admin Only: get a list of all server guilds."
     )
     async def server_list(self, interaction: discord.Interaction):
-        page = []
-        pages = []
-
-        for i, server in enumerate(self.bot.guilds):
-            page.append(
-                f"{i + 1}. {server} ({server.id}) ({server.member_count} members)"
+        # Servers are read from the bot's own list as each page is shown
+        async def get_page(page: int) -> list[discord.Guild]:
+            return self.bot.guilds[
+                page * self.SERVER_PAGE_SIZE : (page + 1) * self.SERVER_PAGE_SIZE
+            ]
+
+        def make_embed(
+            interaction: discord.Interaction,
+            servers: list[discord.Guild],
+            page: int,
+            page_count: int,
+        ) -> discord.Embed:
+            embed = discord.Embed(
+                title="Bot Servers",
+                description="\n".join(
+                    f"{page * self.SERVER_PAGE_SIZE + i + 1}. {server} ({server.id}) ({server.member_count} members)"
+                    for i, server in enumerate(servers)
+                ),
+                color=Color.random(),
             )
+            embed.set_footer(text=f"Page {page + 1}/{page_count}")
 
-            if (i + 1) % 20 == 0:
-                pages.append(page)
-                page = []
-
-        if page != []:
-            pages.append(page)
-
-        class ServersPageView(View):
-            def __init__(self, pages):
-                super().__init__(timeout=900)
-
-                self.page = 0
-                self.pages = pages
-
-                self.msg_id: int
-
-                for item in self.children:
-                    if item.custom_id == "first" or item.custom_id == "prev":
-                        item.disabled = True
-
-            # Timeout
-            async def on_timeout(self) -> None:
-                try:
-                    for item in self.children:
-                        item.disabled = True
-
-                    msg = await interaction.channel.fetch_message(self.msg_id)
-                    await msg.edit(view=self)
-                except Exception:
-                    pass
-
-            @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-            async def first_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                self.page = 0
-
-                for item in self.children:
-                    item.disabled = False
-
-                    if item.custom_id == "first" or item.custom_id == "prev":
-                        item.disabled = True
-
-                embed = discord.Embed(
-                    title="Bot Servers",
-                    description="\n".join(self.pages[self.page]),
-                    color=Color.random(),
-                )
-                embed.set_footer(text=f"Page {self.page + 1}/{len(self.pages)}")
-
-                await interaction.response.edit_message(embed=embed, view=self)
-
-            @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-            async def prev_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if self.page - 1 == 0:
-                    self.page -= 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-                else:
-                    self.page -= 1
-
-                    for item in self.children:
-                        item.disabled = False
+            return embed
 
-                embed = discord.Embed(
-                    title="Bot Servers",
-                    description="\n".join(self.pages[self.page]),
-                    color=Color.random(),
-                )
-                embed.set_footer(text=f"Page {self.page + 1}/{len(self.pages)}")
-
-                await interaction.response.edit_message(embed=embed, view=self)
-
-            @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-            async def next_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if (self.page + 1) == (len(self.pages) - 1):
-                    self.page += 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "next" or item.custom_id == "last":
-                            item.disabled = True
-                else:
-                    self.page += 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                embed = discord.Embed(
-                    title="Bot Servers",
-                    description="\n".join(self.pages[self.page]),
-                    color=Color.random(),
-                )
-                embed.set_footer(text=f"Page {self.page + 1}/{len(self.pages)}")
-
-                await interaction.response.edit_message(embed=embed, view=self)
-
-            @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-            async def last_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                self.page = len(self.pages) - 1
-
-                for item in self.children:
-                    item.disabled = False
-
-                    if item.custom_id == "next" or item.custom_id == "last":
-                        item.disabled = True
-
-                embed = discord.Embed(
-                    title="Bot Servers",
-                    description="\n".join(self.pages[self.page]),
-                    color=Color.random(),
-                )
-                embed.set_footer(text=f"Page {self.page + 1}/{len(self.pages)}")
-
-                await interaction.response.edit_message(embed=embed, view=self)
-
-        embed = discord.Embed(
-            title="Bot Servers", description="\n".join(pages[0]), color=Color.random()
+        view = Paginator(
+            lambda: -(-len(self.bot.guilds) // self.SERVER_PAGE_SIZE),
+            get_page,
+            make_embed,
         )
-        embed.set_footer(text=f"Page 1/{len(pages)}")
+        embeds = await view.render(interaction, 0)
 
-        if len(pages) == 1:
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        if view.page_count == 1:
+            await interaction.followup.send(embeds=embeds, ephemeral=True)
         else:
-            view_instance = ServersPageView(pages)
-
-            webhook = await interaction.followup.send(
-                embed=embed, view=view_instance, wait=True, ephemeral=True
+            view.message = await interaction.followup.send(
+                embeds=embeds, view=view, wait=True, ephemeral=True
             )
-            view_instance.msg_id = webhook.id
 
     # Error Test command
     @adminGroup.command(
@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+import logging
 import platform
 import time
 from datetime import timedelta
@@ -8,7 +10,7 @@ import discord
 import psutil
 import pygit2
 from discord import Color, app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord.ui import View
 
 
@@ -16,6 +18,76 @@ class BotUtils(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+        # Cached host and version info, so commands don't block the loop
+        self.version_info: dict | None = None
+        self.cpu_info: dict | None = None
+        self.host_stats: dict | None = None
+
+        self.bot.loop.create_task(self.load_cpu_info())
+        self.version_update.start()
+        self.host_stats_update.start()
+
+    def cog_unload(self) -> None:
+        # Stop tasks on unload
+        self.version_update.cancel()
+        self.host_stats_update.cancel()
+
+    # Get CPU info once, this spawns subprocesses and can take seconds
+    async def load_cpu_info(self) -> None:
+        try:
+            self.cpu_info = await asyncio.to_thread(cpuinfo.get_cpu_info)
+        except Exception as e:
+            logging.error(f"[BOT] Failed to get CPU info - {e}")
+
+    # Fetch from remote and compare with local HEAD, runs in a thread
+    def get_version_info(self) -> dict:
+        repo = pygit2.Repository(".git")
+        remote = repo.remotes["origin"]
+
+        try:
+            remote.fetch()
+        except Exception as e:
+            # Compare with the last fetched remote instead
+            logging.debug(f"[BOT] Failed to fetch from remote - {e}")
+
+        # Get local HEAD commit
+        local_head = repo.head.target
+
+        # Get current branch name
+        branch_name = repo.head.shorthand
+
+        # Get remote HEAD for current branch
+        remote_ref = f"refs/remotes/origin/{branch_name}"
+        remote_head = repo.references[remote_ref].target
+
+        # Convert to short hashes
+        return {
+            "local": str(local_head)[:7],
+            "remote": str(remote_head)[:7],
+            "synced": local_head == remote_head,
+        }
+
+    # Version update task
+    @tasks.loop(minutes=30)
+    async def version_update(self) -> None:
+        try:
+            self.version_info = await asyncio.to_thread(self.get_version_info)
+        except Exception as e:
+            logging.error(f"[BOT] Failed to get version info - {e}")
+
+    # Host stats update task
+    @tasks.loop(seconds=30)
+    async def host_stats_update(self) -> None:
+        memory = psutil.virtual_memory()
+
+        self.host_stats = {
+            "boot_time": psutil.boot_time(),
+            "cpu_percent": psutil.cpu_percent(),
+            "memory_percent": memory.percent,
+            "memory_used": memory.used,
+            "memory_total": memory.total,
+        }
+
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=True, private_channel=True
     )
@@ -91,32 +163,16 @@ class BotUtils(commands.Cog):
         )
         embed.set_thumbnail(url=self.bot.user.display_avatar.url)
 
-        repo = pygit2.Repository(".git")
-        remote = repo.remotes["origin"]
-        remote.fetch()
-
-        # Get local HEAD commit
-        local_head = repo.head.target
-
-        # Get current branch name
-        branch_name = repo.head.shorthand
-
-        # Get remote HEAD for current branch
-        remote_ref = f"refs/remotes/origin/{branch_name}"
-        remote_head = repo.references[remote_ref].target
-
-        # Convert to short hashes
-        local_short = str(local_head)[:7]
-        remote_short = str(remote_head)[:7]
-        synced = local_head == remote_head
+        if self.version_info is None:
+            version = "Checking for updates, try again later."
+        elif self.version_info["synced"]:
+            version = f":white_check_mark: Up to date ({self.version_info['local']})"
+        else:
+            version = f":x: Out of date ({self.version_info['local']}, latest: {self.version_info['remote']})"
 
         embed.add_field(
             name="Current Version",
-            value=(
-                f":white_check_mark: Up to date ({local_short})"
-                if synced
-                else f":x: Out of date ({local_short}, latest: {remote_short})"
-            ),
+            value=version,
             inline=False,
         )
 
@@ -158,13 +214,17 @@ class BotUtils(commands.Cog):
 
         embed = discord.Embed(title="Host Info")
 
-        uptime_seconds = int(time.time() - psutil.boot_time())
+        # Stats may not be sampled yet on startup
+        host_stats = self.host_stats
+        if host_stats is None:
+            await self.host_stats_update()
+            host_stats = self.host_stats
+
+        uptime_seconds = int(time.time() - host_stats["boot_time"])
         sec = timedelta(seconds=uptime_seconds)
         d = datetime.datetime(1, 1, 1) + sec
 
-        sysinfo = cpuinfo.get_cpu_info()
-
-        embed.add_field(name="Python Version", value=f"`{sysinfo['python_version']}`")
+        embed.add_field(name="Python Version", value=f"`{platform.python_version()}`")
         embed.add_field(
             name="System Uptime",
             value=f"`{(d.day - 1):02d}:{d.hour:02d}:{d.minute:02d}:{d.second:02d}`",
@@ -172,11 +232,16 @@ class BotUtils(commands.Cog):
         embed.add_field(
             name="Operating System", value=f"`{platform.system()} {platform.release()}`"
         )
-        embed.add_field(name="CPU Name", value=f"`{sysinfo['brand_raw']}`")
-        embed.add_field(name="CPU Usage", value=f"`{psutil.cpu_percent()}%`")
+        embed.add_field(
+            name="CPU Name",
+            value=f"`{self.cpu_info['brand_raw']}`"
+            if self.cpu_info is not None
+            else "`Loading...`",
+        )
+        embed.add_field(name="CPU Usage", value=f"`{host_stats['cpu_percent']}%`")
         embed.add_field(
             name="RAM Usage",
-            value=f"`{psutil.virtual_memory().percent}%` (`{psutil.virtual_memory().used / 1000000:.2f}MB` used, `{psutil.virtual_memory().total / 1000000:.2f}MB` total)",
+            value=f"`{host_stats['memory_percent']}%` (`{host_stats['memory_used'] / 1000000:.2f}MB` used, `{host_stats['memory_total'] / 1000000:.2f}MB` total)",
         )
 
         embed.set_footer(
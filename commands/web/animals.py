@@ -1,16 +1,112 @@
+import asyncio
+import collections
+import logging
 import random
+from typing import Awaitable, Callable
 
-import aiohttp
 import discord
 from discord import Color, app_commands
 from discord.ext import commands
 
+# Sand cat API also returns videos
+IMAGE_TYPES = (".png", ".jpg", ".jpeg", ".webp", ".gif")
+
+
+class ImageBuffer:
+    """Keeps a few random image URLs from an API ready to send.
+
+    URLs are fetched in the background whenever one is taken, backing off
+    while the API is failing.
+    """
+
+    # Seconds to wait after a failed fetch, doubled for each failure in a row
+    MIN_BACKOFF = 5
+    MAX_BACKOFF = 300
+
+    def __init__(
+        self, fetch: Callable[[], Awaitable[tuple[int, str | None]]], size: int
+    ) -> None:
+        self.fetch = fetch
+        self.urls: collections.deque[str] = collections.deque(maxlen=size)
+
+        self.wanted = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self.fill())
+
+    def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+    # Take a URL, None if the buffer is empty
+    def pop(self) -> str | None:
+        self.wanted.set()
+
+        return self.urls.popleft() if self.urls else None
+
+    async def fill(self) -> None:
+        backoff = self.MIN_BACKOFF
+
+        while True:
+            while len(self.urls) < self.urls.maxlen:
+                try:
+                    status, url = await self.fetch()
+                except Exception as e:
+                    status, url = None, None
+                    logging.debug(f"[ANIMALS] Prefetch failed - {e}")
+
+                if status != 200:
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, self.MAX_BACKOFF)
+                    continue
+
+                backoff = self.MIN_BACKOFF
+
+                # Skipped results, such as sand cat videos
+                if url is not None:
+                    self.urls.append(url)
+
+            self.wanted.clear()
+            await self.wanted.wait()
+
 
 class Animals(commands.Cog):
+    # Images kept ready per animal
+    BUFFER_SIZE = 5
+
+    # API URL and how to get an image URL from its response, per animal
+    SOURCES = {
+        "cat": (
+            "https://api.thecatapi.com/v1/images/search",
+            lambda data: data[0]["url"],
+        ),
+        "dog": (
+            "https://dog.ceo/api/breeds/image/random",
+            lambda data: data["message"],
+        ),
+        "sand-cat": (
+            "https://sandcat.link/api/json/",
+            lambda data: (
+                data["url"] if str(data["filename"]).endswith(IMAGE_TYPES) else None
+            ),
+        ),
+    }
+
     # noinspection SpellCheckingInspection
     def __init__(self, bot):
         self.bot = bot
 
+        self.buffers = {
+            name: ImageBuffer(
+                lambda name=name: self.fetch_image(name), self.BUFFER_SIZE
+            )
+            for name in self.SOURCES
+        }
+
+        for buffer in self.buffers.values():
+            buffer.start()
+
         self.cat_titles = [
             "Aww!",
             "Cute cat!",
@@ -32,6 +128,20 @@ class Animals(commands.Cog):
             "Bark!",
         ]
 
+    def cog_unload(self) -> None:
+        for buffer in self.buffers.values():
+            buffer.stop()
+
+    # Get a random image URL from an animal's API, with the response status
+    async def fetch_image(self, name: str) -> tuple[int, str | None]:
+        url, get_image = self.SOURCES[name]
+        status, data = await self.bot.http_cache.fetch_json(url)
+
+        if status != 200:
+            return status, None
+
+        return status, get_image(data)
+
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=True, private_channel=True
     )
@@ -53,26 +163,32 @@ class Animals(commands.Cog):
     async def cat(self, interaction: discord.Interaction, ephemeral: bool = False):
         await interaction.response.defer(ephemeral=ephemeral)
 
-        # Fetch image
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://api.thecatapi.com/v1/images/search"
-            ) as request:
-                if request.status == 429:
-                    embed = discord.Embed(
-                        title="The service has been rate limited. Try again later.",
-                        color=Color.red(),
-                    )
-                    await interaction.followup.send(embed=embed)
-                    return
-                else:
-                    request_data = await request.json()
+        # Use a prefetched image, or fetch one if there are none left
+        image_url = self.buffers["cat"].pop()
+
+        if image_url is None:
+            status, image_url = await self.fetch_image("cat")
+
+            if status == 429:
+                embed = discord.Embed(
+                    title="The service has been rate limited. Try again later.",
+                    color=Color.red(),
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            elif image_url is None:
+                embed = discord.Embed(
+                    title="The service is unavailable. Try again later.",
+                    color=Color.red(),
+                )
+                await interaction.followup.send(embed=embed)
+                return
 
         # Create and send embed
         embed_title = random.choice(self.cat_titles)
 
         embed = discord.Embed(title=embed_title, color=Color.random())
-        embed.set_image(url=request_data[0]["url"])
+        embed.set_image(url=image_url)
         embed.set_footer(
             text=f"@{interaction.user.name}",
             icon_url=interaction.user.display_avatar.url,
@@ -90,26 +206,32 @@ class Animals(commands.Cog):
     async def dog(self, interaction: discord.Interaction, ephemeral: bool = False):
         await interaction.response.defer(ephemeral=ephemeral)
 
-        # Fetch image
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://dog.ceo/api/breeds/image/random"
-            ) as request:
-                if request.status == 429:
-                    embed = discord.Embed(
-                        title="The service has been rate limited. Try again later.",
-                        color=Color.red(),
-                    )
-                    await interaction.followup.send(embed=embed)
-                    return
-                else:
-                    request_data = await request.json()
+        # Use a prefetched image, or fetch one if there are none left
+        image_url = self.buffers["dog"].pop()
+
+        if image_url is None:
+            status, image_url = await self.fetch_image("dog")
+
+            if status == 429:
+                embed = discord.Embed(
+                    title="The service has been rate limited. Try again later.",
+                    color=Color.red(),
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            elif image_url is None:
+                embed = discord.Embed(
+                    title="The service is unavailable. Try again later.",
+                    color=Color.red(),
+                )
+                await interaction.followup.send(embed=embed)
+                return
 
         # Create and send embed
         embed_title = random.choice(self.dog_titles)
 
         embed = discord.Embed(title=embed_title, color=Color.random())
-        embed.set_image(url=request_data["message"])
+        embed.set_image(url=image_url)
         embed.set_footer(
             text=f"@{interaction.user.name}",
             icon_url=interaction.user.display_avatar.url,
@@ -127,42 +249,44 @@ class Animals(commands.Cog):
     async def sand_cat(self, interaction: discord.Interaction, ephemeral: bool = False):
         await interaction.response.defer(ephemeral=ephemeral)
 
-        request_data = {}
-        request_data["filename"] = ""
-
-        # Check if image is a valid file type
-        while not str(request_data["filename"]).endswith(
-            (".png", ".jpg", ".jpeg", ".webp", ".gif")
-        ):
-            # Fetch image
-            async with aiohttp.ClientSession() as session:
-                async with session.get("https://sandcat.link/api/json/") as request:
-                    if request.status == 429:
-                        embed = discord.Embed(
-                            title="The service has been rate limited. Try again later.",
-                            color=Color.red(),
-                        )
-                        await interaction.followup.send(embed=embed)
-                        return
-                    elif request.status == 522:
-                        embed = discord.Embed(
-                            title="The service timed out. Try again later.",
-                            color=Color.red(),
-                        )
-                        await interaction.followup.send(embed=embed)
-                        return
-                    else:
-                        request_data = await request.json()
+        # Use a prefetched image, or fetch one if there are none left
+        image_url = self.buffers["sand-cat"].pop()
+
+        # Fetch until the result is an image
+        while image_url is None:
+            status, image_url = await self.fetch_image("sand-cat")
+
+            if status == 429:
+                embed = discord.Embed(
+                    title="The service has been rate limited. Try again later.",
+                    color=Color.red(),
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            elif status == 522:
+                embed = discord.Embed(
+                    title="The service timed out. Try again later.",
+                    color=Color.red(),
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            elif status != 200:
+                embed = discord.Embed(
+                    title="The service is unavailable. Try again later.",
+                    color=Color.red(),
+                )
+                await interaction.followup.send(embed=embed)
+                return
 
         # Create and send embed
         embed_title = random.choice(self.cat_titles)
 
         embed = discord.Embed(
             title=embed_title,
-            description=f"Source: [sandcat.link]({request_data['url']})",
+            description=f"Source: [sandcat.link]({image_url})",
             color=Color.random(),
         )
-        embed.set_image(url=request_data["url"])
+        embed.set_image(url=image_url)
         embed.set_footer(
             text=f"@{interaction.user.name}",
             icon_url=interaction.user.display_avatar.url,
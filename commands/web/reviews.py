@@ -1,14 +1,203 @@
+import asyncio
+import collections
+import logging
+import time
+from typing import Callable
+
 import aiohttp
 import discord
-from discord import ButtonStyle, Color, app_commands
+from discord import Color, app_commands
 from discord.ext import commands
-from discord.ui import View
+
+from utils.paginator import Paginator
+
+
+class ReviewDBError(Exception):
+    """Raised when ReviewDB returns an unsuccessful response"""
+
+
+class ReviewList:
+    """Reviews for one user or server, fetched from ReviewDB as they are viewed.
+
+    ReviewDB returns reviews in pages. Pages are requested by offset, so any
+    page can be fetched without fetching the ones before it, and fetches of
+    the same page are shared.
+    """
+
+    API_URL = "https://manti.vendicated.dev/api/reviewdb/users"
+
+    # Most ReviewDB requests running at once for one list
+    FETCH_LIMIT = 3
+
+    def __init__(self, session: aiohttp.ClientSession, target_id: int) -> None:
+        self.session = session
+        self.target_id = target_id
+        self.created = time.monotonic()
+
+        # Fetched pages by offset
+        self.pages: dict[int, list[dict]] = {}
+        self.fetching: dict[int, asyncio.Task] = {}
+        self.semaphore = asyncio.Semaphore(self.FETCH_LIMIT)
+
+        self.first_size = 0
+        self.page_size = 0
+        self.total = 0
+
+    @property
+    def loaded(self) -> int:
+        return sum(len(page) for page in self.pages.values())
+
+    async def _request(self, offset: int) -> dict:
+        async with (
+            self.semaphore,
+            self.session.get(
+                f"{self.API_URL}/{self.target_id}/reviews?offset={offset}"
+            ) as request,
+        ):
+            response = await request.json()
+
+        if not response["success"]:
+            raise ReviewDBError(response.get("message"))
+
+        return response
+
+    # Fetch the first page, which also gives the page size and review count
+    async def load(self) -> None:
+        response = await self._request(0)
+
+        # First review is a ReviewDB notice, skip it
+        reviews = response["reviews"][1:]
+
+        self.pages[0] = reviews
+        self.first_size = len(reviews)
+        self.page_size = len(response["reviews"])
+
+        if response["hasNextPage"]:
+            self.total = max(response.get("reviewCount", 0), len(reviews) + 1)
+        else:
+            self.total = len(reviews)
+
+    # Offset of the ReviewDB page holding a review
+    def _offset(self, index: int) -> int:
+        if index < self.first_size:
+            return 0
+
+        index -= self.first_size
+        return self.first_size + index - index % self.page_size
+
+    async def _fetch_page(self, offset: int) -> None:
+        response = await self._request(offset)
+
+        self.pages[offset] = response["reviews"]
+
+        # Review count can be off, trust the end of the list instead
+        if response["hasNextPage"]:
+            self.total = max(self.total, offset + len(response["reviews"]) + 1)
+        else:
+            self.total = offset + len(response["reviews"])
+
+    def _fetch(self, offset: int) -> asyncio.Task:
+        task = self.fetching.get(offset)
+
+        if task is None:
+            task = asyncio.create_task(self._fetch_page(offset))
+            self.fetching[offset] = task
+            task.add_done_callback(lambda _: self.fetching.pop(offset, None))
+
+        return task
+
+    # Check if reviews in a range are already fetched
+    def has(self, start: int, end: int) -> bool:
+        return all(
+            self._offset(i) in self.pages for i in range(start, min(end, self.total))
+        )
+
+    # Get numbered reviews in a range, fetching missing pages at the same time
+    async def get(self, start: int, end: int) -> list[list]:
+        missing = {
+            self._offset(i)
+            for i in range(start, min(end, self.total))
+            if self._offset(i) not in self.pages
+        }
+
+        if missing:
+            await asyncio.gather(
+                *(asyncio.shield(self._fetch(offset)) for offset in missing)
+            )
+
+        reviews = []
+
+        for i in range(start, min(end, self.total)):
+            offset = self._offset(i)
+            page = self.pages[offset]
+
+            if i - offset >= len(page):
+                break
+
+            reviews.append([i + 1, page[i - offset]])
+
+        return reviews
+
+    # Start fetching a range in the background
+    def prefetch(self, start: int, end: int) -> None:
+        if not self.has(start, end):
+            task = asyncio.create_task(self.get(start, end))
+            task.add_done_callback(self._prefetch_done)
+
+    def _prefetch_done(self, task: asyncio.Task) -> None:
+        # Failed pages are fetched again when shown
+        if not task.cancelled() and task.exception() is not None:
+            logging.debug(f"[REVIEWS] Prefetch failed - {task.exception()}")
 
 
 class Reviews(commands.Cog):
+    # Reviews shown per page
+    PAGE_SIZE = 4
+
+    # Pages fetched ahead of the one being shown
+    READ_AHEAD = 2
+
+    # How long fetched reviews are reused for
+    CACHE_TTL = 300
+
+    # Most reviews kept in the cache, oldest lists are dropped first
+    MAX_CACHED_REVIEWS = 5000
+
     def __init__(self, bot):
         self.bot = bot
 
+        self.review_cache: collections.OrderedDict[int, ReviewList] = (
+            collections.OrderedDict()
+        )
+
+    # Get a user or server's reviews, reusing recent results
+    async def get_reviews(self, target_id: int) -> ReviewList:
+        reviews = self.review_cache.get(target_id)
+
+        if reviews is not None and time.monotonic() - reviews.created < self.CACHE_TTL:
+            self.review_cache.move_to_end(target_id)
+            return reviews
+
+        reviews = ReviewList(self.bot.session, target_id)
+        await reviews.load()
+
+        self.review_cache[target_id] = reviews
+        self.review_cache.move_to_end(target_id)
+
+        # Drop expired and oldest lists until under the cap
+        while len(self.review_cache) > 1:
+            oldest = next(iter(self.review_cache.values()))
+
+            if time.monotonic() - oldest.created < self.CACHE_TTL and (
+                sum(cached.loaded for cached in self.review_cache.values())
+                <= self.MAX_CACHED_REVIEWS
+            ):
+                break
+
+            self.review_cache.popitem(last=False)
+
+        return reviews
+
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=True, private_channel=True
     )
@@ -20,7 +209,7 @@ class Reviews(commands.Cog):
         allowed_installs=installs,
     )
 
-    async def generate_user_review_embed(
+    def generate_user_review_embed(
         self,
         interaction: discord.Interaction,
         user: discord.Member | discord.User,
@@ -58,7 +247,7 @@ class Reviews(commands.Cog):
 
         return embed
 
-    async def generate_server_review_embed(
+    def generate_server_review_embed(
         self,
         interaction: discord.Interaction,
         guild: discord.Guild,
@@ -95,6 +284,76 @@ class Reviews(commands.Cog):
 
         return embed
 
+    # Send the first page of a review list, with page controls if needed
+    async def send_reviews(
+        self,
+        interaction: discord.Interaction,
+        target_id: int,
+        make_embed: Callable[..., discord.Embed],
+        empty_embed: discord.Embed,
+        ephemeral: bool,
+    ) -> None:
+        try:
+            reviews = await self.get_reviews(target_id)
+        except (aiohttp.ClientError, ReviewDBError) as e:
+            logging.error(f"[REVIEWS] Failed to fetch reviews - {e}")
+
+            embed = discord.Embed(
+                title="Error",
+                description="ReviewDB has encountered an error. Titanium will not continue. Please try again later.",
+                color=Color.red(),
+            )
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
+
+        if reviews.total == 0:
+            await interaction.followup.send(embed=empty_embed, ephemeral=ephemeral)
+            return
+
+        # ReviewDB pages are bigger than ours, and are kept by the review list.
+        # The paginator only loads the next page, read further ahead than that
+        async def get_page(page: int) -> list[list]:
+            start = page * self.PAGE_SIZE
+            end = start + self.PAGE_SIZE
+
+            reviews.prefetch(end, end + self.PAGE_SIZE * self.READ_AHEAD)
+
+            return await reviews.get(start, end)
+
+        view = Paginator(
+            lambda: -(-reviews.total // self.PAGE_SIZE),
+            get_page,
+            lambda interaction, page, current_page, page_count: make_embed(
+                interaction, page, current_page, page_count, reviews.total
+            ),
+            user_id=interaction.user.id,
+            errors=(aiohttp.ClientError, ReviewDBError),
+            error_message="ReviewDB has encountered an error. Please try again later.",
+        )
+
+        try:
+            embeds = await view.render(interaction, 0)
+        except (aiohttp.ClientError, ReviewDBError) as e:
+            logging.error(f"[REVIEWS] Failed to fetch reviews - {e}")
+
+            embed = discord.Embed(
+                title="Error",
+                description="ReviewDB has encountered an error. Titanium will not continue. Please try again later.",
+                color=Color.red(),
+            )
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
+
+        if view.page_count == 1:
+            await interaction.followup.send(embeds=embeds, ephemeral=ephemeral)
+        else:
+            view.message = await interaction.followup.send(
+                embeds=embeds,
+                view=view,
+                ephemeral=ephemeral,
+                wait=True,
+            )
+
     # Review view command
     @reviewGroup.command(name="user", description="See a user's reviews on ReviewDB.")
     @app_commands.checks.cooldown(1, 10)
@@ -110,273 +369,23 @@ class Reviews(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
-        review_list = []
-
-        # Send request to ReviewDB
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://manti.vendicated.dev/api/reviewdb/users/{user.id}/reviews?offset=0"
-            ) as request:
-                review_response = await request.json()
-
-        for review in review_response["reviews"][1:]:
-            review_list.append(review)
-
-        while True:
-            if not review_response["success"]:
-                embed = discord.Embed(
-                    title="Error",
-                    description="ReviewDB has encountered an error. Titanium will not continue. Please try again later.",
-                    color=Color.red(),
-                )
-                await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-
-                return
-            else:
-                if review_response["hasNextPage"]:
-                    # Send request to ReviewDB
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            f"https://manti.vendicated.dev/api/reviewdb/users/{user.id}/reviews?offset={len(review_list)}"
-                        ) as request:
-                            review_response = await request.json()
-
-                    for review in review_response["reviews"]:
-                        review_list.append(review)
-                else:
-                    break
-
-        review_amount = len(review_list)
-        page = []
-        pages = []
-
-        # Create pages of 4 items
-        for i, review in enumerate(review_list):
-            i += 1
-
-            if len(page) == 4:
-                pages.append(page)
-                page = []
-
-            page.append([i, review])
-
-        if page != []:
-            pages.append(page)
-
-        class PageView(View):
-            def __init__(self, pages):
-                super().__init__(timeout=900)
-                self.page = 0
-                self.pages = pages
-
-                self.locked = False
-
-                self.user_id: int
-                self.msg_id: int
-
-                for item in self.children:
-                    if item.custom_id == "first" or item.custom_id == "prev":
-                        item.disabled = True
-
-            # Timeout
-            async def on_timeout(self) -> None:
-                try:
-                    for item in self.children:
-                        item.disabled = True
-
-                    msg = await interaction.channel.fetch_message(self.msg_id)
-                    await msg.edit(view=self)
-                except Exception:
-                    pass
-
-            # Page lock
-            async def interaction_check(self, interaction: discord.Interaction):
-                if interaction.user.id != self.user_id:
-                    if self.locked:
-                        embed = discord.Embed(
-                            title="Error",
-                            description="This command is locked. Only the owner can control it.",
-                            color=Color.red(),
-                        )
-                        await interaction.response.send_message(
-                            embed=embed, ephemeral=True
-                        )
-                    else:
-                        return True
-                else:
-                    return True
-
-            # First page
-            @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-            async def first_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                self.page = 0
-
-                for item in self.children:
-                    item.disabled = False
-
-                    if item.custom_id == "first" or item.custom_id == "prev":
-                        item.disabled = True
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_user_review_embed(
-                        interaction,
-                        user,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-            # Previous page
-            @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-            async def prev_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if self.page - 1 == 0:
-                    self.page -= 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-                else:
-                    self.page -= 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_user_review_embed(
-                        interaction,
-                        user,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-            # Lock / unlock toggle
-            @discord.ui.button(emoji="🔓", style=ButtonStyle.green, custom_id="lock")
-            async def lock_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if interaction.user.id == self.user_id:
-                    self.locked = not self.locked
-
-                    if self.locked:
-                        button.emoji = "🔒"
-                        button.style = ButtonStyle.red
-                    else:
-                        button.emoji = "🔓"
-                        button.style = ButtonStyle.green
-
-                    await interaction.response.edit_message(view=self)
-                else:
-                    embed = discord.Embed(
-                        title="Error",
-                        description="Only the command runner can toggle the page controls lock.",
-                        color=Color.red(),
-                    )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-
-            # Next page
-            @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-            async def next_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if (self.page + 1) == (len(self.pages) - 1):
-                    self.page += 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "next" or item.custom_id == "last":
-                            item.disabled = True
-                else:
-                    self.page += 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_user_review_embed(
-                        interaction,
-                        user,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-            # Last page button
-            @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-            async def last_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                self.page = len(self.pages) - 1
-
-                for item in self.children:
-                    item.disabled = False
-
-                    if item.custom_id == "next" or item.custom_id == "last":
-                        item.disabled = True
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_user_review_embed(
-                        interaction,
-                        user,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-        if len(pages) != 0:
-            if len(pages) == 1:
-                await interaction.followup.send(
-                    embed=await self.generate_user_review_embed(
-                        interaction, user, pages[0], 0, len(pages), review_amount
-                    ),
-                    ephemeral=ephemeral,
-                )
-            else:
-                page_view_instance = PageView(pages)
-
-                webhook = await interaction.followup.send(
-                    embed=await self.generate_user_review_embed(
-                        interaction, user, pages[0], 0, len(pages), review_amount
-                    ),
-                    view=page_view_instance,
-                    ephemeral=ephemeral,
-                    wait=True,
-                )
-
-                page_view_instance.user_id = interaction.user.id
-                page_view_instance.msg_id = webhook.id
-        else:
-            embed = discord.Embed(
-                title="ReviewDB User Reviews",
-                description="This user has no reviews!",
-                color=Color.red(),
-            )
-            embed.set_author(
-                name=user.name,
-                url=f"https://discord.com/users/{user.id}",
-                icon_url=user.display_avatar.url,
+        embed = discord.Embed(
+            title="ReviewDB User Reviews",
+            description="This user has no reviews!",
+            color=Color.red(),
+        )
+        embed.set_author(
+            name=user.name,
+            url=f"https://discord.com/users/{user.id}",
+            icon_url=user.display_avatar.url,
+        )
+
+        def make_embed(interaction, page, current_page, page_count, count):
+            return self.generate_user_review_embed(
+                interaction, user, page, current_page, page_count, count
             )
 
-            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+        await self.send_reviews(interaction, user.id, make_embed, embed, ephemeral)
 
     # Server review view command
     @reviewGroup.command(
@@ -405,272 +414,22 @@ class Reviews(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=ephemeral)
             return
 
-        review_list = []
-
-        # Send request to ReviewDB
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://manti.vendicated.dev/api/reviewdb/users/{guild.id}/reviews?offset=0"
-            ) as request:
-                review_response = await request.json()
-
-        for review in review_response["reviews"][1:]:
-            review_list.append(review)
-
-        while True:
-            if not review_response["success"]:
-                embed = discord.Embed(
-                    title="Error",
-                    description="ReviewDB has encountered an error. Titanium will not continue. Please try again later.",
-                    color=Color.red(),
-                )
-
-                await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-                return
-            else:
-                if review_response["hasNextPage"]:
-                    # Send request to ReviewDB
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            f"https://manti.vendicated.dev/api/reviewdb/users/{guild.id}/reviews?offset={len(review_list)}"
-                        ) as request:
-                            review_response = await request.json()
-
-                    for review in review_response["reviews"]:
-                        review_list.append(review)
-                else:
-                    break
-
-        review_amount = len(review_list)
-        page = []
-        pages = []
-
-        # Create pages of 4 items
-        for i, review in enumerate(review_list):
-            i += 1
-
-            if len(page) == 4:
-                pages.append(page)
-                page = []
-
-            page.append([i, review])
-
-        if page != []:
-            pages.append(page)
-
-        class PageView(View):
-            def __init__(self, pages):
-                super().__init__(timeout=900)
-                self.page = 0
-                self.pages = pages
-
-                self.locked = False
-
-                self.user_id: int
-                self.msg_id: int
-
-                for item in self.children:
-                    if item.custom_id == "first" or item.custom_id == "prev":
-                        item.disabled = True
-
-            # Timeout
-            async def on_timeout(self) -> None:
-                try:
-                    for item in self.children:
-                        item.disabled = True
-
-                    msg = await interaction.channel.fetch_message(self.msg_id)
-                    await msg.edit(view=self)
-                except Exception:
-                    pass
-
-            # Page lock
-            async def interaction_check(self, interaction: discord.Interaction):
-                if interaction.user.id != self.user_id:
-                    if self.locked:
-                        embed = discord.Embed(
-                            title="Error",
-                            description="This command is locked. Only the owner can control it.",
-                            color=Color.red(),
-                        )
-                        await interaction.response.send_message(
-                            embed=embed, ephemeral=True
-                        )
-                    else:
-                        return True
-                else:
-                    return True
-
-            # First page
-            @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-            async def first_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                self.page = 0
-
-                for item in self.children:
-                    item.disabled = False
-
-                    if item.custom_id == "first" or item.custom_id == "prev":
-                        item.disabled = True
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_server_review_embed(
-                        interaction,
-                        guild,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-            # Previous page
-            @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-            async def prev_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if self.page - 1 == 0:
-                    self.page -= 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-                else:
-                    self.page -= 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_server_review_embed(
-                        interaction,
-                        guild,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-            # Lock / unlock toggle
-            @discord.ui.button(emoji="🔓", style=ButtonStyle.green, custom_id="lock")
-            async def lock_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if interaction.user.id == self.user_id:
-                    self.locked = not self.locked
-
-                    if self.locked:
-                        button.emoji = "🔒"
-                        button.style = ButtonStyle.red
-                    else:
-                        button.emoji = "🔓"
-                        button.style = ButtonStyle.green
-
-                    await interaction.response.edit_message(view=self)
-                else:
-                    embed = discord.Embed(
-                        title="Error",
-                        description="Only the command runner can toggle the page controls lock.",
-                        color=Color.red(),
-                    )
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-
-            # Next page
-            @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-            async def next_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                if (self.page + 1) == (len(self.pages) - 1):
-                    self.page += 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "next" or item.custom_id == "last":
-                            item.disabled = True
-                else:
-                    self.page += 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_server_review_embed(
-                        interaction,
-                        guild,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-            # Last page button
-            @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-            async def last_button(
-                self, interaction: discord.Interaction, button: discord.ui.Button
-            ):
-                self.page = len(self.pages) - 1
-
-                for item in self.children:
-                    item.disabled = False
-
-                    if item.custom_id == "next" or item.custom_id == "last":
-                        item.disabled = True
-
-                await interaction.response.edit_message(
-                    embed=await self.generate_server_review_embed(
-                        interaction,
-                        guild,
-                        self.pages[self.page],
-                        self.page,
-                        len(self.pages),
-                        review_amount,
-                    ),
-                    view=self,
-                )
-
-        if len(pages) != 0:
-            if len(pages) == 1:
-                await interaction.followup.send(
-                    embed=await self.generate_server_review_embed(
-                        interaction, guild, pages[0], 0, len(pages), review_amount
-                    ),
-                    ephemeral=ephemeral,
-                )
-            else:
-                page_view_instance = PageView(pages)
-
-                webhook = await interaction.followup.send(
-                    embed=await self.generate_server_review_embed(
-                        interaction, guild, pages[0], 0, len(pages), review_amount
-                    ),
-                    view=page_view_instance,
-                    ephemeral=ephemeral,
-                    wait=True,
-                )
-
-                page_view_instance.user_id = interaction.user.id
-                page_view_instance.msg_id = webhook.id
-        else:
-            embed = discord.Embed(
-                title="ReviewDB Server Reviews",
-                description="This user has no reviews!",
-                color=Color.red(),
-            )
-            embed.set_author(
-                name=guild.name,
-                icon_url=(guild.icon.url if guild.icon is not None else None),
+        embed = discord.Embed(
+            title="ReviewDB Server Reviews",
+            description="This user has no reviews!",
+            color=Color.red(),
+        )
+        embed.set_author(
+            name=guild.name,
+            icon_url=(guild.icon.url if guild.icon is not None else None),
+        )
+
+        def make_embed(interaction, page, current_page, page_count, count):
+            return self.generate_server_review_embed(
+                interaction, guild, page, current_page, page_count, count
             )
 
-            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+        await self.send_reviews(interaction, guild.id, make_embed, embed, ephemeral)
 
 
 async def setup(bot):
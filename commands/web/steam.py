@@ -2,18 +2,50 @@ import html
 from textwrap import shorten
 from urllib.parse import quote
 
-import aiohttp
 import discord
 import discord.ext
 from discord import app_commands
 from discord.ext import commands
 from discord.ui import View
 
+from utils.ttl_cache import TTLCache
+
 
 class SteamCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+        # Store responses change slowly, serve stale results while refreshing
+        self.search_cache = TTLCache(ttl=600, stale_ttl=3600, max_size=512)
+        self.details_cache = TTLCache(ttl=3600, stale_ttl=86400, max_size=512)
+
+    # Search the store, cached by search term and currency
+    async def store_search(self, term: str, cc: str) -> dict:
+        term = " ".join(term.lower().split())
+
+        async def fetch() -> dict:
+            async with self.bot.session.get(
+                f"https://store.steampowered.com/api/storesearch/?term={quote(term)}&l=english&cc={cc}"
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        return await self.search_cache.get((term, cc), fetch)
+
+    # Get a game's store page info, cached by app ID and currency
+    async def app_details(self, appid: int, cc: str) -> dict:
+        async def fetch() -> dict:
+            async with self.bot.session.get(
+                f"https://store.steampowered.com/api/appdetails?appids={appid}&cc={cc}&l=english"
+            ) as response:
+                response.raise_for_status()
+                game_data = await response.json()
+
+            # Not cached if Steam has no data for the app
+            return game_data[str(appid)]["data"]
+
+        return await self.details_cache.get((appid, cc), fetch)
+
     context = discord.app_commands.AppCommandContext(
         guild=True, dm_channel=True, private_channel=True
     )
@@ -83,25 +115,23 @@ class SteamCommands(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
-        url = f"https://store.steampowered.com/api/storesearch/?term={quote(game)}&l=english&cc={currency.value}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                jr = await response.json()
-                total_items = int(jr["total"])
-                if total_items == 0:
-                    embed = discord.Embed(
-                        title="No Results Found",
-                        description=f'No results found for "{game}". Please try a different search term.',
-                        color=discord.Color.red(),
-                    )
-                    embed.set_footer(
-                        text=f"@{interaction.user.name}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-                    await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-                    return
-                else:
-                    all_items = jr["items"]
+        jr = await self.store_search(game, currency.value)
+        total_items = int(jr["total"])
+
+        if total_items == 0:
+            embed = discord.Embed(
+                title="No Results Found",
+                description=f'No results found for "{game}". Please try a different search term.',
+                color=discord.Color.red(),
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
+        else:
+            all_items = jr["items"]
 
         embed = discord.Embed(
             title="Select Game",
@@ -151,6 +181,8 @@ class SteamCommands(commands.Cog):
 
             id_list.append(appid)
 
+        cog = self
+
         class GameSelectView(View):
             def __init__(self, options: list):
                 super().__init__(timeout=120)  # 2 minute timeout
@@ -193,13 +225,7 @@ class SteamCommands(commands.Cog):
                 list_place = id_list.index(int(self.values[0]))
 
                 id = all_items[list_place]["id"]
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"https://store.steampowered.com/api/appdetails?appids={id}&cc={currency.value}&l=english"
-                    ) as response:
-                        response.raise_for_status()
-                        game_data = await response.json()
-                        game_info = game_data[str(id)]["data"]
+                game_info = await cog.app_details(id, currency.value)
 
                 price_info = game_info.get("price_overview")
                 score = game_info.get("metacritic", {}).get("score", 0)
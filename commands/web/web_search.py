@@ -1,13 +1,20 @@
 import urllib.parse
 
-import aiohttp
 import discord
-from discord import ButtonStyle, Color, app_commands
+from discord import Color, app_commands
 from discord.ext import commands
 from discord.ui import View
 
+from utils.http_cache import CachePolicy
+from utils.paginator import Paginator
+
 
 class WebSearch(commands.Cog):
+    # Definitions and articles change slowly, keep them across restarts
+    URBAN_POLICY = CachePolicy(ttl=3600, stale_ttl=86400, persist=True)
+    WIKI_SEARCH_POLICY = CachePolicy(ttl=3600, stale_ttl=86400, persist=True)
+    WIKI_SUMMARY_POLICY = CachePolicy(ttl=3600, stale_ttl=86400, persist=True)
+
     def __init__(self, bot):
         self.bot = bot
 
@@ -41,310 +48,61 @@ class WebSearch(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=ephemeral)
 
-        embed_list = []
-
         query = query.replace(" ", "%20")
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://api.urbandictionary.com/v0/define?term={query}"
-            ) as request:
-                request_data = await request.json()
-
-        item_list = []
-
-        if len(request_data["list"]) != 0:
-            page = max(1, min(len(request_data["list"]), page))
-
-            for item in request_data["list"]:
-                item_list.append(item)
-
-            class UrbanDictPageView(View):
-                def __init__(self, pages, start_page):
-                    super().__init__(timeout=900)
-
-                    self.page = start_page - 1
-                    self.pages: list = pages
-
-                    self.locked = False
-
-                    self.user_id: int
-                    self.msg_id: int
-
-                    if page == 1:
-                        for item in self.children:
-                            if item.custom_id == "first" or item.custom_id == "prev":
-                                item.disabled = True
-                    elif page + 1 >= len(item_list):
-                        for item in self.children:
-                            if item.custom_id == "next" or item.custom_id == "last":
-                                item.disabled = True
-
-                # Timeout
-                async def on_timeout(self) -> None:
-                    try:
-                        for item in self.children:
-                            item.disabled = True
-
-                        msg = await interaction.channel.fetch_message(self.msg_id)
-                        await msg.edit(view=self)
-                    except Exception:
-                        pass
-
-                async def interaction_check(self, interaction: discord.Interaction):
-                    if interaction.user.id != self.user_id:
-                        if self.locked:
-                            embed = discord.Embed(
-                                title="Error",
-                                description="This command is locked. Only the owner can control it.",
-                                color=Color.red(),
-                            )
-                            await interaction.response.send_message(
-                                embed=embed, ephemeral=True
-                            )
-                        else:
-                            return True
-                    else:
-                        return True
-
-                @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-                async def first_button(
-                    self,
-                    interaction: discord.Interaction,
-                    button: discord.ui.Button,
-                ):
-                    embed_list.pop()
-
-                    self.page = 0
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "first" or item.custom_id == "prev":
-                            item.disabled = True
-
-                    embed = discord.Embed(
-                        title=f"{self.pages[self.page]['word']}",
-                        description=f"**Author: {self.pages[self.page]['author']}**\n\n||{(self.pages[self.page]['definition'].replace('[', '')).replace(']', '')}||",
-                        url=self.pages[self.page]["permalink"],
-                        color=Color.random(),
-                    )
-                    embed.set_author(
-                        name="Urban Dictionary",
-                        icon_url="https://media.licdn.com/dms/image/v2/D560BAQGlykJwWd7v-g/company-logo_200_200/company-logo_200_200/0/1718946315384/urbandictionary_logo?e=2147483647&v=beta&t=jnPuu32SKBWZsFOfOHz7KugJq0S2UARN8CL0wOAyyro",
-                    )
-
-                    embed.set_footer(
-                        text=f"@{interaction.user.name} • Page {self.page + 1}/{len(item_list)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-                    embed_list.append(embed)
-
-                    await interaction.response.edit_message(
-                        embeds=embed_list, view=self
-                    )
-
-                @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-                async def prev_button(
-                    self,
-                    interaction: discord.Interaction,
-                    button: discord.ui.Button,
-                ):
-                    embed_list.pop()
-
-                    if self.page - 1 == 0:
-                        self.page -= 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "first" or item.custom_id == "prev":
-                                item.disabled = True
-                    else:
-                        self.page -= 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                    embed = discord.Embed(
-                        title=f"{self.pages[self.page]['word']}",
-                        description=f"**Author: {self.pages[self.page]['author']}**\n\n||{(self.pages[self.page]['definition'].replace('[', '')).replace(']', '')}||",
-                        url=self.pages[self.page]["permalink"],
-                        color=Color.random(),
-                    )
-                    embed.set_author(
-                        name="Urban Dictionary",
-                        icon_url="https://media.licdn.com/dms/image/v2/D560BAQGlykJwWd7v-g/company-logo_200_200/company-logo_200_200/0/1718946315384/urbandictionary_logo?e=2147483647&v=beta&t=jnPuu32SKBWZsFOfOHz7KugJq0S2UARN8CL0wOAyyro",
-                    )
-
-                    embed.set_footer(
-                        text=f"@{interaction.user.name} • Page {self.page + 1}/{len(item_list)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-                    embed_list.append(embed)
-
-                    await interaction.response.edit_message(
-                        embeds=embed_list, view=self
-                    )
-
-                @discord.ui.button(
-                    emoji="🔓", style=ButtonStyle.green, custom_id="lock"
-                )
-                async def lock_button(
-                    self,
-                    interaction: discord.Interaction,
-                    button: discord.ui.Button,
-                ):
-                    if interaction.user.id == self.user_id:
-                        self.locked = not self.locked
-
-                        if self.locked:
-                            button.emoji = "🔒"
-                            button.style = ButtonStyle.red
-                        else:
-                            button.emoji = "🔓"
-                            button.style = ButtonStyle.green
-
-                        await interaction.response.edit_message(view=self)
-                    else:
-                        embed = discord.Embed(
-                            title="Error",
-                            description="Only the command runner can toggle the page controls lock.",
-                            color=Color.red(),
-                        )
-                        await interaction.response.send_message(
-                            embed=embed, ephemeral=True
-                        )
-
-                @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-                async def next_button(
-                    self,
-                    interaction: discord.Interaction,
-                    button: discord.ui.Button,
-                ):
-                    embed_list.pop()
-
-                    if (self.page + 1) == (len(self.pages) - 1):
-                        self.page += 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                            if item.custom_id == "next" or item.custom_id == "last":
-                                item.disabled = True
-                    else:
-                        self.page += 1
-
-                        for item in self.children:
-                            item.disabled = False
-
-                    embed = discord.Embed(
-                        title=f"{self.pages[self.page]['word']}",
-                        description=f"**Author: {self.pages[self.page]['author']}**\n\n||{(self.pages[self.page]['definition'].replace('[', '')).replace(']', '')}||",
-                        url=self.pages[self.page]["permalink"],
-                        color=Color.random(),
-                    )
-                    embed.set_author(
-                        name="Urban Dictionary",
-                        icon_url="https://media.licdn.com/dms/image/v2/D560BAQGlykJwWd7v-g/company-logo_200_200/company-logo_200_200/0/1718946315384/urbandictionary_logo?e=2147483647&v=beta&t=jnPuu32SKBWZsFOfOHz7KugJq0S2UARN8CL0wOAyyro",
-                    )
-
-                    embed.set_footer(
-                        text=f"@{interaction.user.name} • Page {self.page + 1}/{len(item_list)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-                    embed_list.append(embed)
-
-                    await interaction.response.edit_message(
-                        embeds=embed_list, view=self
-                    )
-
-                @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-                async def last_button(
-                    self,
-                    interaction: discord.Interaction,
-                    button: discord.ui.Button,
-                ):
-                    embed_list.pop()
-
-                    self.page = len(self.pages) - 1
-
-                    for item in self.children:
-                        item.disabled = False
-
-                        if item.custom_id == "next" or item.custom_id == "last":
-                            item.disabled = True
-
-                    embed = discord.Embed(
-                        title=f"{self.pages[self.page]['word']}",
-                        description=f"**Author: {self.pages[self.page]['author']}**\n\n||{(self.pages[self.page]['definition'].replace('[', '')).replace(']', '')}||",
-                        url=self.pages[self.page]["permalink"],
-                        color=Color.random(),
-                    )
-                    embed.set_author(
-                        name="Urban Dictionary",
-                        icon_url="https://media.licdn.com/dms/image/v2/D560BAQGlykJwWd7v-g/company-logo_200_200/company-logo_200_200/0/1718946315384/urbandictionary_logo?e=2147483647&v=beta&t=jnPuu32SKBWZsFOfOHz7KugJq0S2UARN8CL0wOAyyro",
-                    )
-
-                    embed.set_footer(
-                        text=f"@{interaction.user.name} • Page {self.page + 1}/{len(item_list)}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-                    embed_list.append(embed)
-
-                    await interaction.response.edit_message(
-                        embeds=embed_list, view=self
-                    )
-
-            embed = discord.Embed(
+        _, request_data = await self.bot.http_cache.fetch_json(
+            f"https://api.urbandictionary.com/v0/define?term={query}",
+            self.URBAN_POLICY,
+        )
+
+        item_list = request_data["list"]
+
+        if len(item_list) != 0:
+            warning = discord.Embed(
                 title="Content Warning",
                 description="Urban Dictionary has very little moderation and content may be inappropriate! View at your own risk.",
                 color=Color.orange(),
             )
-            embed_list.append(embed)
 
-            try:
+            async def get_page(page: int) -> dict:
+                return item_list[page]
+
+            def make_embed(
+                interaction: discord.Interaction, item: dict, page: int, page_count: int
+            ) -> list[discord.Embed]:
                 embed = discord.Embed(
-                    title=f"{item_list[page - 1]['word']}",
-                    description=f"**Author: {item_list[page - 1]['author']}**\n\n||{(item_list[page - 1]['definition'].replace('[', '')).replace(']', '')}||",
-                    url=item_list[page - 1]["permalink"],
+                    title=f"{item['word']}",
+                    description=f"**Author: {item['author']}**\n\n||{(item['definition'].replace('[', '')).replace(']', '')}||",
+                    url=item["permalink"],
                     color=Color.random(),
                 )
                 embed.set_author(
                     name="Urban Dictionary",
                     icon_url="https://media.licdn.com/dms/image/v2/D560BAQGlykJwWd7v-g/company-logo_200_200/company-logo_200_200/0/1718946315384/urbandictionary_logo?e=2147483647&v=beta&t=jnPuu32SKBWZsFOfOHz7KugJq0S2UARN8CL0wOAyyro",
                 )
-
                 embed.set_footer(
-                    text=f"@{interaction.user.name} • Page {page}/{len(item_list)}",
-                    icon_url=interaction.user.display_avatar.url,
-                )
-                embed_list.append(embed)
-            except IndexError:
-                embed = discord.Embed(
-                    title="Error",
-                    description=f"**Page {page}** does not exist! Try another page.",
-                    color=Color.red(),
-                )
-                embed.set_footer(
-                    text=f"@{interaction.user.name} • Page 1/{len(item_list)}",
+                    text=f"@{interaction.user.name} • Page {page + 1}/{page_count}",
                     icon_url=interaction.user.display_avatar.url,
                 )
 
-                await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-                return
+                return [warning, embed]
+
+            view = Paginator(
+                len(item_list),
+                get_page,
+                make_embed,
+                user_id=interaction.user.id,
+            )
+            embeds = await view.render(interaction, page - 1)
 
-            if len(item_list) == 1:
-                await interaction.followup.send(embeds=embed_list, ephemeral=ephemeral)
+            if view.page_count == 1:
+                await interaction.followup.send(embeds=embeds, ephemeral=ephemeral)
             else:
-                webhook = await interaction.followup.send(
-                    embeds=embed_list,
-                    view=UrbanDictPageView(item_list, page),
+                view.message = await interaction.followup.send(
+                    embeds=embeds,
+                    view=view,
                     ephemeral=ephemeral,
                     wait=True,
                 )
-
-                UrbanDictPageView.user_id = interaction.user.id
-                UrbanDictPageView.msg_id = webhook.id
         else:
             embed = discord.Embed(title="No results found.", color=Color.red())
             embed.set_footer(
@@ -369,26 +127,25 @@ class WebSearch(commands.Cog):
 
         headers = {"User-Agent": self.bot.tokens["wikipedia-user-agent"]}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://api.wikimedia.org/core/v1/wikipedia/en/search/title?q={urllib.parse.quote(search)}&limit=1",
-                headers=headers,
-            ) as request:
-                if request.status != 200:
-                    embed = discord.Embed(title="No results found.", color=Color.red())
-                    embed.set_author(
-                        name="Wikipedia",
-                        icon_url="https://upload.wikimedia.org/wikipedia/en/thumb/8/80/Wikipedia-logo-v2.svg/1200px-Wikipedia-logo-v2.svg.png",
-                    )
-                    embed.set_footer(
-                        text=f"@{interaction.user.name}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-                    return
-
-                page_data = await request.json()
+        status, page_data = await self.bot.http_cache.fetch_json(
+            f"https://api.wikimedia.org/core/v1/wikipedia/en/search/title?q={urllib.parse.quote(search)}&limit=1",
+            self.WIKI_SEARCH_POLICY,
+            headers=headers,
+        )
+
+        if status != 200:
+            embed = discord.Embed(title="No results found.", color=Color.red())
+            embed.set_author(
+                name="Wikipedia",
+                icon_url="https://upload.wikimedia.org/wikipedia/en/thumb/8/80/Wikipedia-logo-v2.svg/1200px-Wikipedia-logo-v2.svg.png",
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
 
         if not page_data.get("pages") or len(page_data["pages"]) == 0:
             embed = discord.Embed(title="No results found.", color=Color.red())
@@ -405,26 +162,25 @@ class WebSearch(commands.Cog):
 
         target_page = page_data["pages"][0]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://en.wikipedia.org/api/rest_v1/page/summary/{target_page['key']}",
-                headers=headers,
-            ) as request:
-                if request.status != 200:
-                    embed = discord.Embed(title="No results found.", color=Color.red())
-                    embed.set_author(
-                        name="Wikipedia",
-                        icon_url="https://upload.wikimedia.org/wikipedia/en/thumb/8/80/Wikipedia-logo-v2.svg/1200px-Wikipedia-logo-v2.svg.png",
-                    )
-                    embed.set_footer(
-                        text=f"@{interaction.user.name}",
-                        icon_url=interaction.user.display_avatar.url,
-                    )
-
-                    await interaction.followup.send(embed=embed, ephemeral=ephemeral)
-                    return
-
-                page = await request.json()
+        status, page = await self.bot.http_cache.fetch_json(
+            f"https://en.wikipedia.org/api/rest_v1/page/summary/{target_page['key']}",
+            self.WIKI_SUMMARY_POLICY,
+            headers=headers,
+        )
+
+        if status != 200:
+            embed = discord.Embed(title="No results found.", color=Color.red())
+            embed.set_author(
+                name="Wikipedia",
+                icon_url="https://upload.wikimedia.org/wikipedia/en/thumb/8/80/Wikipedia-logo-v2.svg/1200px-Wikipedia-logo-v2.svg.png",
+            )
+            embed.set_footer(
+                text=f"@{interaction.user.name}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            await interaction.followup.send(embed=embed, ephemeral=ephemeral)
+            return
 
         embed = discord.Embed(
             title=page["title"],
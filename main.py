@@ -9,6 +9,7 @@ import logging
 import logging.handlers
 import os
 import random
+import time
 import traceback
 from glob import glob
 from textwrap import shorten
@@ -19,67 +20,81 @@ import discord
 from discord import Color
 from discord.ext import commands
 
+from utils.http_cache import CachedHTTP
+from utils.image_assets import preload_assets
+from utils.image_pool import ImagePool, ImageQueueFullError, busy_embed
+from utils.lyrics import LyricsCache
+from utils.metrics import RateLimitHandler, Registry, TimedPool, http_trace_config
+from utils.spotify_links import SpotifyLinkResolver
+from utils.tags import TagCache
+
 # Current Running Path
 path = os.getcwd()
 
-# Create Root Logger
-dt_fmt = "%Y-%m-%d %H:%M:%S"
-logging.basicConfig(
-    level=logging.INFO,
-    format="[{asctime}] [{levelname:<8}] {name}: {message}",
-    datefmt=dt_fmt,
-    style="{",
-)
-
-# Get loggers
-rootLogger = logging.getLogger()
-
-discordLogger = logging.getLogger("discord")
-discordLogger.setLevel(logging.INFO)
-
-# Make file handler
-(os.mkdir("logs") if not os.path.exists("logs") else None)
-handler = logging.handlers.RotatingFileHandler(
-    filename="logs/titanium.log",
-    encoding="utf-8",
-    maxBytes=20 * 1024 * 1024,  # 20 MiB
-    backupCount=5,  # Rotate through 5 files
-)
-
-# Set formatter, apply to file and console handlers
-formatter = logging.Formatter(
-    "[{asctime}] [{levelname:<8}] {name}: {message}", dt_fmt, style="{"
-)
-handler.setFormatter(formatter)
-rootLogger.handlers[0].setFormatter(formatter)
-
-# Add loggers to file handler
-rootLogger.addHandler(handler)
-discordLogger.addHandler(handler)
-
-logging.info("Welcome to Titanium.")
-logging.info("https://github.com/restartb/titanium\n")
-
 # Config Parser
 config = configparser.RawConfigParser()
 
-# SQL path check
-logging.info("[INIT] Checking SQL path...")
-basedir = os.path.dirname("content/sql/")
 
-if not os.path.exists(basedir):
-    logging.info("[INIT] Path not present. Creating path...")
-    os.makedirs(basedir)
+# ------ Logging ------
+def setup_logging() -> None:
+    # Create Root Logger
+    dt_fmt = "%Y-%m-%d %H:%M:%S"
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[{asctime}] [{levelname:<8}] {name}: {message}",
+        datefmt=dt_fmt,
+        style="{",
+    )
+
+    # Get loggers
+    rootLogger = logging.getLogger()
+
+    discordLogger = logging.getLogger("discord")
+    discordLogger.setLevel(logging.INFO)
+
+    # Make file handler
+    (os.mkdir("logs") if not os.path.exists("logs") else None)
+    handler = logging.handlers.RotatingFileHandler(
+        filename="logs/titanium.log",
+        encoding="utf-8",
+        maxBytes=20 * 1024 * 1024,  # 20 MiB
+        backupCount=5,  # Rotate through 5 files
+    )
 
-# SQL path check
-logging.info("[INIT] Checking temp path...")
-basedir = os.path.dirname("tmp/")
+    # Set formatter, apply to file and console handlers
+    formatter = logging.Formatter(
+        "[{asctime}] [{levelname:<8}] {name}: {message}", dt_fmt, style="{"
+    )
+    handler.setFormatter(formatter)
+    rootLogger.handlers[0].setFormatter(formatter)
 
-if not os.path.exists(basedir):
-    logging.info("[INIT] Path not present. Creating path...")
-    os.makedirs(basedir)
+    # Add loggers to file handler
+    rootLogger.addHandler(handler)
+    discordLogger.addHandler(handler)
 
-logging.info("[INIT] Path check complete.\n")
+    logging.info("Welcome to Titanium.")
+    logging.info("https://github.com/restartb/titanium\n")
+
+
+# ------ Path Check ------
+def check_paths() -> None:
+    # SQL path check
+    logging.info("[INIT] Checking SQL path...")
+    basedir = os.path.dirname("content/sql/")
+
+    if not os.path.exists(basedir):
+        logging.info("[INIT] Path not present. Creating path...")
+        os.makedirs(basedir)
+
+    # SQL path check
+    logging.info("[INIT] Checking temp path...")
+    basedir = os.path.dirname("tmp/")
+
+    if not os.path.exists(basedir):
+        logging.info("[INIT] Path not present. Creating path...")
+        os.makedirs(basedir)
+
+    logging.info("[INIT] Path check complete.\n")
 
 
 # ------ Config File Reader ------
@@ -123,6 +138,20 @@ class TitaniumBot(commands.Bot):
 
     connect_time: datetime.datetime
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Metrics registry, exported by the API cog
+        self.metrics = Registry()
+        self.event_duration = self.metrics.histogram(
+            "titanium_event_handler_duration_seconds",
+            "Time taken by event handlers.",
+            ("cog", "event"),
+        )
+
+        # Count Discord rate limits
+        logging.getLogger("discord.http").addHandler(RateLimitHandler(self.metrics))
+
     async def setup_hook(self):
         logging.info("[INIT] Reading config files.")
 
@@ -192,15 +221,60 @@ class TitaniumBot(commands.Bot):
             os.path.join("content", "sql", "server-counts.db")
         )
 
-        async with self.tags_pool.acquire() as sql:
-            # Create table if it doesn't exist
-            await sql.execute(
-                "CREATE TABLE IF NOT EXISTS tags (id INTEGER PRIMARY KEY, creatorID INTEGER, name TEXT, content TEXT)"
+        # Metrics Pool
+        open(os.path.join("content", "sql", "metrics.db"), "a").close()
+        self.metrics_pool = await asqlite.create_pool(
+            os.path.join("content", "sql", "metrics.db")
+        )
+
+        # Record pool wait times
+        for name in (
+            "cache",
+            "fireboard",
+            "lb",
+            "economy",
+            "tags",
+            "server_counts",
+            "metrics",
+        ):
+            setattr(
+                self,
+                f"{name}_pool",
+                TimedPool(getattr(self, f"{name}_pool"), name, self.metrics),
             )
-            await sql.commit()
+
+        # Tags, shared by the server and user tag cogs
+        self.tags = TagCache(self.tags_pool)
+        await self.tags.setup()
 
         logging.info("[INIT] SQL pools created.\n")
 
+        # Shared HTTP session
+        self.session = aiohttp.ClientSession(
+            trace_configs=[http_trace_config(self.metrics)]
+        )
+
+        # Shared JSON client, cogs opt in to caching per request
+        self.http_cache = CachedHTTP(self.session, self.cache_pool, self.metrics)
+        await self.http_cache.setup()
+
+        # Shared spotify.link resolver, results are kept in cache.db
+        self.spotify_links = SpotifyLinkResolver(self.session, self.cache_pool)
+        await self.spotify_links.setup()
+
+        # Shared lrclib lookups, results are kept in cache.db
+        self.lyrics = LyricsCache(self.session, self.cache_pool)
+        await self.lyrics.setup()
+
+        # Image processing worker pool, workers load overlay assets on startup
+        self.image_pool = ImagePool(initializer=preload_assets)
+        self.image_queue_depth = self.metrics.gauge(
+            "titanium_queue_depth", "Events waiting in background queues.", ("queue",)
+        )
+        self.metrics.add_collector(
+            lambda: self.image_queue_depth.set(self.image_pool.queued, queue="image")
+        )
+
         logging.info("[INIT] Loading cogs...")
         # Find all cogs in command dir
         for filename in glob(
@@ -212,7 +286,7 @@ class TitaniumBot(commands.Bot):
                     filename = filename.replace("\\", "/").replace("/", ".")[:-3]
 
                     logging.debug(f"[INIT] Loading normal cog: {filename}...")
-                    await bot.load_extension(filename)
+                    await self.load_extension(filename)
                     logging.debug(f"[INIT] Loaded normal cog: {filename}")
 
         logging.info("[INIT] Loaded normal cogs.\n")
@@ -225,7 +299,7 @@ class TitaniumBot(commands.Bot):
                 # Determine if file is a python file
                 if filename.endswith(".py") and not filename.startswith("."):
                     logging.debug(f"[INIT] Loading private cog: {filename}...")
-                    await bot.load_extension(f"commands_private.{filename[:-3]}")
+                    await self.load_extension(f"commands_private.{filename[:-3]}")
                     logging.debug(f"[INIT] Loaded private cog: {filename}")
 
             logging.info("[INIT] Loaded private cogs.\n")
@@ -233,14 +307,35 @@ class TitaniumBot(commands.Bot):
             logging.info("[INIT] Skipping private cogs.\n")
 
     async def close(self):
+        # Unload cogs first, so they can write to pools while shutting down
+        await super().close()
+
         await self.cache_pool.close()
         await self.fireboard_pool.close()
         await self.lb_pool.close()
         await self.economy_pool.close()
         await self.tags_pool.close()
         await self.server_counts_pool.close()
+        await self.metrics_pool.close()
 
-        await super().close()
+        await self.session.close()
+
+        self.image_pool.close()
+
+    # Time every event handler, including cog listeners
+    async def _run_event(self, coro, event_name, *args, **kwargs):
+        start = time.perf_counter()
+
+        try:
+            await super()._run_event(coro, event_name, *args, **kwargs)
+        finally:
+            cog = getattr(coro, "__self__", None)
+
+            self.event_duration.observe(
+                time.perf_counter() - start,
+                cog=cog.qualified_name if isinstance(cog, commands.Cog) else "Bot",
+                event=event_name,
+            )
 
     async def on_connect(self):
         self.connected = True
@@ -255,11 +350,11 @@ class TitaniumBot(commands.Bot):
             self.last_disconnect = datetime.datetime.now()
 
 
-bot = TitaniumBot(intents=intents, command_prefix="", help_command=None)
+# Created in main(), image pool workers import this file without running the bot
+bot: TitaniumBot
 
 
 # Sync bot cogs when started
-@bot.event
 async def on_ready():
     # Sync tree if sync on start is enabled
     if bot.options["sync-on-start"]:
@@ -287,16 +382,17 @@ async def on_ready():
 
 
 # Ignore normal user messages
-@bot.event
 async def on_message(message):
     pass
 
 
 # Cooldown / No Permissions / Error Handler
-@bot.tree.error
 async def on_app_command_error(
     interaction: discord.Interaction, error: discord.app_commands.AppCommandError
 ) -> None:
+    # Let cogs know about the error
+    bot.dispatch("app_command_error", interaction, error)
+
     # Unexpected Error
     if isinstance(error, discord.app_commands.errors.CommandInvokeError):
         if isinstance(error.original, discord.errors.HTTPException):
@@ -311,6 +407,10 @@ async def on_app_command_error(
                     icon_url=interaction.user.display_avatar.url,
                 )
                 await interaction.followup.send(embed=embed, ephemeral=True)
+        elif isinstance(error.original, ImageQueueFullError):
+            await interaction.followup.send(
+                embed=busy_embed(interaction), ephemeral=True
+            )
         else:
             # Generate error ID
             error_id = "-".join(
@@ -357,49 +457,48 @@ async def on_app_command_error(
 
                 await interaction.edit_original_response(embed=embed, view=None)
 
-                async with aiohttp.ClientSession() as session:
-                    logging.info("Sending error to webhook.")
-                    embed = discord.Embed(
-                        title="Error",
-                        description=f"```python\n{shorten(traceback.format_exc(), width=4085, placeholder='```')}{'```' if len(traceback.format_exc()) < 4085 else ''}",
-                        color=Color.red(),
-                    )
+                logging.info("Sending error to webhook.")
+                embed = discord.Embed(
+                    title="Error",
+                    description=f"```python\n{shorten(traceback.format_exc(), width=4085, placeholder='```')}{'```' if len(traceback.format_exc()) < 4085 else ''}",
+                    color=Color.red(),
+                )
+
+                embed.timestamp = datetime.datetime.now()
+                embed.set_author(name=str(bot.user))
 
-                    embed.timestamp = datetime.datetime.now()
-                    embed.set_author(name=str(bot.user))
+                embed.add_field(name="Error ID", value=f"`{error_id}`")
+                embed.add_field(name="User", value=f"{interaction.user.mention}")
+                embed.add_field(name="Channel", value=interaction.channel.jump_url)
+                embed.add_field(
+                    name="Time",
+                    value=interaction.created_at.strftime("%d/%m/%Y, %H:%M:%S"),
+                )
 
-                    embed.add_field(name="Error ID", value=f"`{error_id}`")
-                    embed.add_field(name="User", value=f"{interaction.user.mention}")
-                    embed.add_field(name="Channel", value=interaction.channel.jump_url)
-                    embed.add_field(
-                        name="Time",
-                        value=interaction.created_at.strftime("%d/%m/%Y, %H:%M:%S"),
+                embed.add_field(name="Command", value=interaction.command.name)
+
+                # Safely get parameters if they exist
+                try:
+                    params = []
+                    for param in interaction.command.parameters:
+                        if param.name in interaction.namespace:
+                            params.append(
+                                f"{param.name}: {interaction.namespace[param.name]}"
+                            )
+                    if params:
+                        embed.add_field(name="Parameters", value=", ".join(params))
+                except Exception:
+                    pass
+
+                try:
+                    webhook = discord.Webhook.from_url(
+                        str(bot.options["error-webhook"]), session=bot.session
                     )
+                    await webhook.send(embed=embed)
 
-                    embed.add_field(name="Command", value=interaction.command.name)
-
-                    # Safely get parameters if they exist
-                    try:
-                        params = []
-                        for param in interaction.command.parameters:
-                            if param.name in interaction.namespace:
-                                params.append(
-                                    f"{param.name}: {interaction.namespace[param.name]}"
-                                )
-                        if params:
-                            embed.add_field(name="Parameters", value=", ".join(params))
-                    except Exception:
-                        pass
-
-                    try:
-                        webhook = discord.Webhook.from_url(
-                            str(bot.options["error-webhook"]), session=session
-                        )
-                        await webhook.send(embed=embed)
-
-                        logging.info("Error sent to webhook.\n")
-                    except Exception as webhookException:
-                        logging.error(f"Error sending to webhook: {webhookException}\n")
+                    logging.info("Error sent to webhook.\n")
+                except Exception as webhookException:
+                    logging.error(f"Error sending to webhook: {webhookException}\n")
     # Cooldown
     elif isinstance(error, discord.app_commands.errors.CommandOnCooldown):
         await interaction.response.defer(ephemeral=True)
@@ -429,18 +528,34 @@ async def on_app_command_error(
         await msg.delete()
 
 
-try:
-    config.read("config.cfg")
-    bot_token = dict(config.items("TOKENS"))["discord-bot-token"]
+def main() -> None:
+    global bot
 
-    bot.connect_time = datetime.datetime.now()
-    bot.last_disconnect = None
-    bot.last_resume = None
+    setup_logging()
+    check_paths()
 
-    # Run bot with token
-    bot.run(bot_token, log_handler=None)
-except discord.errors.PrivilegedIntentsRequired:
-    logging.critical(
-        "[FATAL] Bot is missing a Privileged Intent! Please ensure they are enabled in the Discord Developers web portal. Exiting..."
-    )
-    exit(1)
+    bot = TitaniumBot(intents=intents, command_prefix="", help_command=None)
+    bot.event(on_ready)
+    bot.event(on_message)
+    bot.tree.error(on_app_command_error)
+
+    try:
+        config.read("config.cfg")
+        bot_token = dict(config.items("TOKENS"))["discord-bot-token"]
+
+        bot.connect_time = datetime.datetime.now()
+        bot.last_disconnect = None
+        bot.last_resume = None
+
+        # Run bot with token
+        bot.run(bot_token, log_handler=None)
+    except discord.errors.PrivilegedIntentsRequired:
+        logging.critical(
+            "[FATAL] Bot is missing a Privileged Intent! Please ensure they are enabled in the Discord Developers web portal. Exiting..."
+        )
+        exit(1)
+
+
+# Only run the bot from the main process, image pool workers import this file
+if __name__ == "__main__":
+    main()
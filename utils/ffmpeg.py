@@ -0,0 +1,181 @@
+import asyncio
+import collections
+import contextlib
+import json
+import os
+from typing import AsyncIterator, Awaitable, Callable
+
+
+class FFmpegBusyError(Exception):
+    """Raised when a user already has as many ffmpeg jobs as they are allowed"""
+
+
+class FFmpegTimeoutError(Exception):
+    """Raised when an ffmpeg process runs for too long and is killed"""
+
+
+class FFmpegError(Exception):
+    """Raised when an ffmpeg process exits with an error"""
+
+
+class FFmpegScheduler:
+    """Limits how many ffmpeg processes run at once.
+
+    Jobs wait for one of a fixed number of slots in first come first served
+    order, and each user can only have a few jobs waiting or running. Running
+    processes are killed if they go over their timeout.
+    """
+
+    def __init__(self, slots: int | None = None, max_per_user: int = 1) -> None:
+        # ffmpeg filters use more than one thread, leave room for the bot
+        self.slots = slots or max(1, (os.cpu_count() or 2) // 2)
+        self.max_per_user = max_per_user
+
+        self.running = 0
+        self.waiting: collections.deque[object] = collections.deque()
+        self.user_jobs: dict[int, int] = {}
+        self.processes: set[asyncio.subprocess.Process] = set()
+
+        # Replaced every time the queue moves, so waiters can wait for changes
+        self.changed = asyncio.Event()
+
+    def _notify(self) -> None:
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    # Wait for a free slot, on_queue is called with the queue position
+    # whenever it changes while waiting
+    @contextlib.asynccontextmanager
+    async def slot(
+        self,
+        user_id: int,
+        on_queue: Callable[[int], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[None]:
+        if self.user_jobs.get(user_id, 0) >= self.max_per_user:
+            raise FFmpegBusyError
+
+        self.user_jobs[user_id] = self.user_jobs.get(user_id, 0) + 1
+
+        try:
+            await self._wait_for_slot(on_queue)
+
+            try:
+                yield
+            finally:
+                self.running -= 1
+                self._notify()
+        finally:
+            self.user_jobs[user_id] -= 1
+
+            if self.user_jobs[user_id] == 0:
+                del self.user_jobs[user_id]
+
+    async def _wait_for_slot(
+        self, on_queue: Callable[[int], Awaitable[None]] | None
+    ) -> None:
+        ticket = object()
+        self.waiting.append(ticket)
+
+        try:
+            last_position = 0
+
+            while self.running >= self.slots or self.waiting[0] is not ticket:
+                changed = self.changed
+                position = self.waiting.index(ticket) + 1
+
+                if on_queue is not None and position != last_position:
+                    last_position = position
+                    await on_queue(position)
+
+                    # Queue may have moved while updating
+                    continue
+
+                await changed.wait()
+        finally:
+            self.waiting.remove(ticket)
+            self._notify()
+
+        self.running += 1
+
+    # Run a program, returning stdout. Kills the process if it runs too long
+    async def _exec(self, program: str, args: list[str], timeout: float) -> bytes:
+        proc = await asyncio.create_subprocess_exec(
+            program,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self.processes.add(proc)
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            proc.kill()
+            await proc.wait()
+
+            if isinstance(e, asyncio.TimeoutError):
+                raise FFmpegTimeoutError from e
+
+            raise
+        finally:
+            self.processes.discard(proc)
+
+        if proc.returncode != 0:
+            raise FFmpegError(
+                f"{program} failed with code {proc.returncode}:\n\n{stderr.decode(errors='replace')}"
+            )
+
+        return stdout
+
+    # Run ffmpeg, returning stdout
+    async def run(self, args: list[str], timeout: float) -> bytes:
+        return await self._exec("ffmpeg", args, timeout)
+
+    # Get the duration, size and frame rate of a video's first video stream
+    async def probe(self, input: str, timeout: float = 30) -> dict:
+        output = await self._exec(
+            "ffprobe",
+            [
+                "-select_streams",
+                "v:0",
+                "-show_entries",
+                "stream=width,height,avg_frame_rate:format=duration",
+                "-of",
+                "json",
+                input,
+            ],
+            timeout,
+        )
+
+        data = json.loads(output)
+        stream = data["streams"][0] if data.get("streams") else {}
+
+        try:
+            numerator, denominator = stream.get("avg_frame_rate", "0/0").split("/")
+            fps = int(numerator) / int(denominator)
+        except (ValueError, ZeroDivisionError):
+            fps = None
+
+        try:
+            duration = float(data.get("format", {})["duration"])
+        except (KeyError, ValueError):
+            duration = None
+
+        return {
+            "width": stream.get("width"),
+            "height": stream.get("height"),
+            "fps": fps,
+            "duration": duration,
+        }
+
+    # Kill all running processes, used on unload
+    def close(self) -> None:
+        for proc in self.processes:
+            if proc.returncode is None:
+                proc.kill()
+
+        self.processes.clear()
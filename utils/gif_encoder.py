@@ -0,0 +1,114 @@
+from io import BytesIO
+from typing import Iterator
+
+from PIL import Image, ImageSequence
+
+# Alpha below this is written as transparent, GIF only has on/off transparency
+ALPHA_THRESHOLD = 128
+
+
+# Reduce a frame to an adaptive 256 colour palette, keeping transparency
+def to_palette(frame: Image.Image, dither: bool = True) -> Image.Image:
+    frame = frame.convert("RGBA")
+    alpha = frame.getchannel("A")
+    transparent = alpha.getextrema()[0] < ALPHA_THRESHOLD
+
+    # Leave a palette slot free for transparency if needed
+    rgb = frame.convert("RGB")
+    max_colours = 255 if transparent else 256
+    exact_colours = rgb.getcolors(max_colours)
+
+    if exact_colours is not None:
+        # Already fits in a palette, e.g. frames from another GIF
+        palette = Image.new("P", (1, 1))
+        palette.putpalette([value for _, colour in exact_colours for value in colour])
+
+        output = rgb.quantize(palette=palette, dither=Image.Dither.NONE)
+    else:
+        output = rgb.quantize(max_colours, method=Image.Quantize.MEDIANCUT)
+
+        if dither:
+            output = rgb.quantize(palette=output, dither=Image.Dither.FLOYDSTEINBERG)
+
+    if transparent:
+        # Pad palette to 256 colours, the last one is transparent
+        colours = output.getpalette()
+        output.putpalette(colours + [0] * (768 - len(colours)))
+
+        output.paste(255, mask=alpha.point(lambda a: 255 if a < ALPHA_THRESHOLD else 0))
+        output.info["transparency"] = 255
+
+    return output
+
+
+# Save an image as a GIF with Pillow, streaming frames of animated images
+def save_gif(
+    im: Image.Image, output_data: BytesIO, dither: bool = True
+) -> tuple[int, int]:
+    if not getattr(im, "is_animated", False):
+        to_palette(im, dither).save(output_data, format="GIF", optimize=True)
+        return im.size
+
+    # Filled in as frames are read, the encoder only looks up a frame's
+    # timing after reading it
+    durations = []
+
+    def frames() -> Iterator[Image.Image]:
+        for frame in ImageSequence.Iterator(im):
+            durations.append(frame.info.get("duration", 100))
+
+            yield to_palette(frame, dither)
+
+    frame_iter = frames()
+    first_frame = next(frame_iter)
+
+    # Frames are full images, clear the last one first only if it could
+    # show through transparent pixels
+    transparent = im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info
+
+    first_frame.save(
+        output_data,
+        format="GIF",
+        save_all=True,
+        append_images=frame_iter,
+        duration=durations,
+        disposal=2 if transparent else 1,
+        loop=im.info.get("loop", 0),
+        optimize=True,
+    )
+
+    return first_frame.size
+
+
+# Convert image data to a GIF, using wand for anything Pillow can't handle
+def convert_to_gif(
+    image_data: bytes, dither: bool = True
+) -> tuple[bytes, tuple[int, int]]:
+    try:
+        with Image.open(BytesIO(image_data)) as im:
+            output_data = BytesIO()
+            output_size = save_gif(im, output_data, dither)
+
+            return output_data.getvalue(), output_size
+    except (OSError, ValueError):
+        # Pillow can't read this format
+        output_data = BytesIO()
+
+    # Only needed as a fallback, so ImageMagick is only loaded here
+    from wand.image import Image as WandImage
+
+    # Convert to GIF with wand
+    with WandImage(blob=image_data) as wand_image:
+        # Set GIF optimization options
+        wand_image.compression_quality = 80
+        wand_image.quantum_operator = "dither"
+
+        # Convert to GIF format
+        wand_image.format = "gif"
+
+        # Write to output BytesIO
+        output_data.write(wand_image.make_blob("gif"))
+
+        output_size = (wand_image.width, wand_image.height)
+
+    return output_data.getvalue(), output_size
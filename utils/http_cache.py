@@ -0,0 +1,244 @@
+import asyncio
+import collections
+import json
+import logging
+import time
+from typing import Any, Mapping, NamedTuple
+from urllib.parse import urlparse
+
+import aiohttp
+import asqlite
+
+from utils.metrics import Registry
+
+
+class CachePolicy(NamedTuple):
+    """How long responses from an endpoint are reused for."""
+
+    # Seconds a response is used without asking upstream
+    ttl: float
+
+    # Seconds after that the old response is still used while refreshing
+    stale_ttl: float = 0
+
+    # Keep responses in cache.db, so they survive restarts
+    persist: bool = False
+
+
+class _Entry:
+    def __init__(
+        self, data: Any, etag: str | None, last_modified: str | None, fetched: float
+    ) -> None:
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched = fetched
+
+
+class CachedHTTP:
+    """Shared JSON HTTP client with an opt in response cache.
+
+    Calls without a policy go straight upstream. Calls with one are cached in
+    memory, and in cache.db if the policy persists. Expired responses with an
+    ETag or Last-Modified header are revalidated with a conditional request,
+    and concurrent requests for the same thing share one upstream request.
+    Only successful responses are cached.
+    """
+
+    # Most responses kept in memory
+    MAX_ENTRIES = 512
+
+    # Stored responses older than this are deleted on startup
+    MAX_STORED_AGE = 604800  # 7 days
+
+    def __init__(
+        self, session: aiohttp.ClientSession, pool: asqlite.Pool, metrics: Registry
+    ) -> None:
+        self.session = session
+        self.pool = pool
+
+        self.entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self.fetching: dict[str, asyncio.Task] = {}
+
+        self.lookups = metrics.counter(
+            "titanium_http_cache_total",
+            "HTTP cache lookups by result.",
+            ("host", "result"),
+        )
+
+    async def setup(self) -> None:
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "CREATE TABLE IF NOT EXISTS httpCache (key text PRIMARY KEY, data text, etag text, lastModified text, fetched real)"
+            )
+            await sql.execute(
+                "DELETE FROM httpCache WHERE fetched < ?",
+                (time.time() - self.MAX_STORED_AGE,),
+            )
+            await sql.commit()
+
+    # Request JSON, returning the status and data. Data is None if the
+    # response wasn't JSON
+    async def fetch_json(
+        self,
+        url: str,
+        policy: CachePolicy | None = None,
+        *,
+        method: str = "GET",
+        headers: dict | None = None,
+        body: Any = None,
+    ) -> tuple[int, Any]:
+        if policy is None:
+            status, data, _ = await self._request(method, url, headers, body, None)
+            return status, data
+
+        key = f"{method} {url}"
+
+        if body is not None:
+            key += f" {json.dumps(body, sort_keys=True)}"
+
+        host = urlparse(url).hostname or ""
+        entry = await self._lookup(key, policy)
+
+        if entry is not None:
+            age = time.time() - entry.fetched
+
+            if age < policy.ttl:
+                self.lookups.inc(host=host, result="hit")
+                return 200, entry.data
+
+            if age < policy.ttl + policy.stale_ttl:
+                self.lookups.inc(host=host, result="stale")
+                self._refresh(key, method, url, headers, body, policy, entry)
+                return 200, entry.data
+
+        self.lookups.inc(host=host, result="miss")
+
+        # Shield, so one caller giving up doesn't cancel it for the others
+        return await asyncio.shield(
+            self._refresh(key, method, url, headers, body, policy, entry)
+        )
+
+    async def _lookup(self, key: str, policy: CachePolicy) -> _Entry | None:
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry
+
+        if not policy.persist:
+            return None
+
+        async with self.pool.acquire() as sql:
+            row = await sql.fetchone(
+                "SELECT data, etag, lastModified, fetched FROM httpCache WHERE key = ?",
+                (key,),
+            )
+
+        if row is None:
+            return None
+
+        entry = _Entry(json.loads(row[0]), row[1], row[2], row[3])
+        self._remember(key, entry)
+
+        return entry
+
+    def _remember(self, key: str, entry: _Entry) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.MAX_ENTRIES:
+            self.entries.popitem(last=False)
+
+    def _refresh(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        headers: dict | None,
+        body: Any,
+        policy: CachePolicy,
+        entry: _Entry | None,
+    ) -> asyncio.Task:
+        task = self.fetching.get(key)
+
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch(key, method, url, headers, body, policy, entry)
+            )
+            self.fetching[key] = task
+            task.add_done_callback(lambda t: self._fetch_done(key, t))
+
+        return task
+
+    async def _fetch(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        headers: dict | None,
+        body: Any,
+        policy: CachePolicy,
+        entry: _Entry | None,
+    ) -> tuple[int, Any]:
+        status, data, response_headers = await self._request(
+            method, url, headers, body, entry
+        )
+
+        if status == 304 and entry is not None:
+            # Unchanged, keep the old data
+            self.lookups.inc(host=urlparse(url).hostname or "", result="revalidated")
+
+            status, data = 200, entry.data
+            etag, last_modified = entry.etag, entry.last_modified
+        elif status == 200 and data is not None:
+            etag = response_headers.get("ETag")
+            last_modified = response_headers.get("Last-Modified")
+        else:
+            return status, data
+
+        entry = _Entry(data, etag, last_modified, time.time())
+        self._remember(key, entry)
+
+        if policy.persist:
+            async with self.pool.acquire() as sql:
+                await sql.execute(
+                    "INSERT OR REPLACE INTO httpCache (key, data, etag, lastModified, fetched) VALUES (?, ?, ?, ?, ?)",
+                    (key, json.dumps(data), etag, last_modified, entry.fetched),
+                )
+                await sql.commit()
+
+        return status, data
+
+    def _fetch_done(self, key: str, task: asyncio.Task) -> None:
+        self.fetching.pop(key, None)
+
+        # Background refreshes have nobody waiting, the stale response is kept
+        if not task.cancelled() and task.exception() is not None:
+            logging.debug(f"[HTTP] Failed to refresh {key} - {task.exception()}")
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict | None,
+        body: Any,
+        entry: _Entry | None,
+    ) -> tuple[int, Any, Mapping[str, str]]:
+        headers = dict(headers or {})
+
+        if entry is not None and method == "GET":
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        async with self.session.request(
+            method, url, headers=headers, json=body
+        ) as response:
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = None
+
+            return response.status, data, response.headers.copy()
@@ -0,0 +1,133 @@
+import collections
+import functools
+import logging
+import os
+
+from PIL import Image, ImageOps
+
+# Overlay images in the content folder
+ASSETS = ("speech.png", "speech_border.png", "hat.png", "snow.png")
+
+# Max memory used by processed variants, per overlay
+VARIANT_CACHE_BYTES = 32 * 1024 * 1024
+
+# Larger variants are made every time, as upload sizes rarely repeat and
+# keeping them would hold on to hundreds of MB
+MAX_CACHED_VARIANT_BYTES = 8 * 1024 * 1024  # about 2 megapixels
+
+
+# Load an overlay from disk once, callers must not modify the result
+@functools.cache
+def get_asset(name: str) -> Image.Image:
+    with Image.open(os.path.join("content", name)) as img:
+        return img.convert("RGBA")
+
+
+# Load all overlays, run in each image worker on startup
+def preload_assets() -> None:
+    for name in ASSETS:
+        try:
+            get_asset(name)
+        except Exception as e:
+            logging.error(f"[ASSETS] Failed to load {name} - {e}")
+
+
+# Memory used by an image's pixels
+def _image_bytes(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+# Cache an overlay's processed variants, bounded by their total size.
+# Callers must not modify the result
+def _variant_cache(func):
+    cache: collections.OrderedDict[tuple, Image.Image] = collections.OrderedDict()
+    used = 0
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        nonlocal used
+
+        if args in cache:
+            cache.move_to_end(args)
+            return cache[args]
+
+        img = func(*args)
+        size = _image_bytes(img)
+
+        if size > MAX_CACHED_VARIANT_BYTES:
+            return img
+
+        cache[args] = img
+        used += size
+
+        # Drop least recently used variants until back under the limit
+        while used > VARIANT_CACHE_BYTES:
+            _, old = cache.popitem(last=False)
+            used -= _image_bytes(old)
+
+        return img
+
+    return wrapper
+
+
+# Invert colour channels, keeping alpha
+def _invert(img: Image.Image) -> Image.Image:
+    alpha = img.getchannel("A")
+
+    img = ImageOps.invert(img.convert("RGB"))
+    img.putalpha(alpha)
+
+    return img
+
+
+# Speech bubble scaled to an image, black bubbles are inverted
+@_variant_cache
+def get_speech_bubble(
+    size: tuple[int, int], direction: str, colour: str
+) -> Image.Image:
+    bubble = get_asset("speech.png").resize(size, Image.Resampling.LANCZOS)
+
+    if direction == "left":
+        bubble = bubble.transpose(Image.FLIP_LEFT_RIGHT)
+
+    if colour == "black":
+        bubble = _invert(bubble)
+
+    return bubble
+
+
+# White speech bubble border scaled to an image
+@_variant_cache
+def get_speech_border(size: tuple[int, int], direction: str) -> Image.Image:
+    border = _invert(
+        get_asset("speech_border.png").resize(size, Image.Resampling.LANCZOS)
+    )
+
+    if direction == "left":
+        border = border.transpose(Image.FLIP_LEFT_RIGHT)
+
+    return border
+
+
+# Christmas hat scaled to a size, then rotated
+@_variant_cache
+def get_hat(size: tuple[int, int], rotation: int) -> Image.Image:
+    hat = get_asset("hat.png").resize(size, Image.Resampling.LANCZOS)
+
+    if rotation != 0:
+        hat = hat.rotate(rotation, expand=True, resample=Image.Resampling.BICUBIC)
+
+    return hat
+
+
+# Snow overlay tiled over an image
+@_variant_cache
+def get_snow_layer(size: tuple[int, int]) -> Image.Image:
+    snow = get_asset("snow.png")
+    layer = Image.new("RGBA", size)
+
+    for x in range(0, size[0], snow.width):
+        for y in range(0, size[1], snow.height):
+            layer.paste(snow, (x, y))
+
+    return layer
@@ -0,0 +1,170 @@
+import asyncio
+import collections
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+import discord
+from discord import Color
+
+
+class ImageQueueFullError(Exception):
+    """Raised when the image pool queue, or a user's share of it, is full"""
+
+
+# Error shown to a user when ImageQueueFullError is raised
+def busy_embed(interaction: discord.Interaction) -> discord.Embed:
+    embed = discord.Embed(
+        title="Busy",
+        description="Too many images are being processed right now. Please wait for your other images to finish, or try again later.",
+        color=Color.red(),
+    )
+    embed.set_footer(
+        text=f"@{interaction.user.name}",
+        icon_url=interaction.user.display_avatar.url,
+    )
+
+    return embed
+
+
+class _Job:
+    def __init__(self, future: asyncio.Future, func: Callable, args, kwargs) -> None:
+        self.future = future
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+
+class ImagePool:
+    """Runs CPU heavy image jobs in worker processes.
+
+    Jobs wait in a bounded queue and are started round robin across users, so
+    one user sending lots of images can't hold up everyone else. Job functions
+    must be importable module level functions, and should take and return
+    plain bytes rather than PIL images.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_queue: int = 32,
+        max_per_user: int = 2,
+        initializer: Callable | None = None,
+    ) -> None:
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_queue = max_queue
+        self.max_per_user = max_per_user
+        self.initializer = initializer
+
+        self.executor = self._start_executor()
+
+        # Waiting jobs per user, in round robin order
+        self.pending: collections.OrderedDict[int, collections.deque[_Job]] = (
+            collections.OrderedDict()
+        )
+        self.queued = 0
+        self.running = 0
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        # Spawn workers, forking a process with running threads is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=self.initializer,
+        )
+
+    # Run a job for a user, raises ImageQueueFullError if there is no space
+    async def run(self, user_id: int, func: Callable, *args, **kwargs) -> Any:
+        user_jobs = self.pending.get(user_id)
+
+        if self.queued >= self.max_queue or (
+            user_jobs is not None and len(user_jobs) >= self.max_per_user
+        ):
+            raise ImageQueueFullError
+
+        future = asyncio.get_running_loop().create_future()
+
+        self.pending.setdefault(user_id, collections.deque()).append(
+            _Job(future, func, args, kwargs)
+        )
+        self.queued += 1
+
+        self._dispatch()
+
+        # Cancelling the caller cancels the job if it hasn't started yet
+        return await future
+
+    # Get a user's place in the queue, 0 if they have nothing waiting
+    def position(self, user_id: int) -> int:
+        if user_id not in self.pending:
+            return 0
+
+        return list(self.pending).index(user_id) + 1
+
+    # Start waiting jobs while there are free workers
+    def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while self.running < self.workers and self.pending:
+            user_id, jobs = next(iter(self.pending.items()))
+            job = jobs.popleft()
+            self.queued -= 1
+
+            # Move user to the back of the line
+            if jobs:
+                self.pending.move_to_end(user_id)
+            else:
+                del self.pending[user_id]
+
+            if job.future.cancelled():
+                continue
+
+            self.running += 1
+
+            task = loop.run_in_executor(
+                self.executor, functools.partial(job.func, *job.args, **job.kwargs)
+            )
+            task.add_done_callback(
+                functools.partial(self._job_done, job, self.executor)
+            )
+
+    def _job_done(
+        self, job: _Job, executor: ProcessPoolExecutor, task: asyncio.Future
+    ) -> None:
+        self.running -= 1
+
+        # A worker died and took the pool with it, start a new one so later
+        # jobs can run. Jobs that were running on the old pool fail.
+        if (
+            not task.cancelled()
+            and isinstance(task.exception(), BrokenProcessPool)
+            and executor is self.executor
+        ):
+            logging.error("[IMAGES] Image worker crashed, restarting image pool.")
+
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = self._start_executor()
+
+        if not job.future.cancelled():
+            if task.cancelled():
+                job.future.cancel()
+            elif task.exception() is not None:
+                job.future.set_exception(task.exception())
+            else:
+                job.future.set_result(task.result())
+
+        self._dispatch()
+
+    def close(self) -> None:
+        for jobs in self.pending.values():
+            for job in jobs:
+                job.future.cancel()
+
+        self.pending.clear()
+        self.queued = 0
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
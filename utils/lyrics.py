@@ -0,0 +1,131 @@
+import datetime
+import json
+from urllib.parse import quote
+
+import aiohttp
+import asqlite
+
+
+class LyricsCache:
+    """Looks up lyrics on lrclib.net, keeping results in cache.db.
+
+    Searches are cached by track and artist and only return song info, the
+    lyrics themselves are cached by lrclib ID and loaded when a song is picked.
+    """
+
+    API_URL = "https://lrclib.net/api"
+    HEADERS = {"User-Agent": "Titanium Discord Bot (https://titaniumbot.me)"}
+
+    # Searches expire sooner, as lyrics are added to lrclib over time
+    SEARCH_TTL = 86400  # 1 day
+    LYRICS_TTL = 2592000  # 30 days
+
+    def __init__(self, session: aiohttp.ClientSession, pool: asqlite.Pool) -> None:
+        self.session = session
+        self.pool = pool
+
+    async def setup(self) -> None:
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "CREATE TABLE IF NOT EXISTS lyricsSearchCache (track text, artist text, results text, ttl int, PRIMARY KEY (track, artist))"
+            )
+            await sql.execute(
+                "CREATE TABLE IF NOT EXISTS lyricsCache (id int PRIMARY KEY, name text, artistName text, albumName text, plainLyrics text, ttl int)"
+            )
+
+            # Remove expired entries, they would be fetched again anyway
+            now = int(datetime.datetime.now().timestamp())
+
+            await sql.execute("DELETE FROM lyricsSearchCache WHERE ttl < ?", (now,))
+            await sql.execute("DELETE FROM lyricsCache WHERE ttl < ?", (now,))
+            await sql.commit()
+
+    # Search for a song, returning a list of song info without lyrics
+    async def search(self, track: str, artist: str | None = None) -> list[dict]:
+        track, artist = track.strip(), (artist or "").strip()
+        key = (track.lower(), artist.lower())
+        now = int(datetime.datetime.now().timestamp())
+
+        async with self.pool.acquire() as sql:
+            row = await sql.fetchone(
+                "SELECT results, ttl FROM lyricsSearchCache WHERE track = ? AND artist = ?",
+                key,
+            )
+
+        if row is not None and row[1] >= now:
+            return json.loads(row[0])
+
+        url = f"{self.API_URL}/search?track_name={quote(track)}"
+
+        if artist:
+            url += f"&artist_name={quote(artist)}"
+
+        async with self.session.get(url, headers=self.HEADERS) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        results = [
+            {
+                "id": item["id"],
+                "name": item["name"],
+                "artistName": item["artistName"],
+                "albumName": item["albumName"],
+            }
+            for item in data
+        ]
+
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "INSERT OR REPLACE INTO lyricsSearchCache (track, artist, results, ttl) VALUES (?, ?, ?, ?)",
+                (*key, json.dumps(results), now + self.SEARCH_TTL),
+            )
+            await sql.commit()
+
+        return results
+
+    # Get a song's info and plain lyrics by lrclib ID
+    async def get(self, lyrics_id: int) -> dict:
+        now = int(datetime.datetime.now().timestamp())
+
+        async with self.pool.acquire() as sql:
+            row = await sql.fetchone(
+                "SELECT id, name, artistName, albumName, plainLyrics, ttl FROM lyricsCache WHERE id = ?",
+                (lyrics_id,),
+            )
+
+        if row is not None and row[5] >= now:
+            return {
+                "id": row[0],
+                "name": row[1],
+                "artistName": row[2],
+                "albumName": row[3],
+                "plainLyrics": row[4],
+            }
+
+        async with self.session.get(
+            f"{self.API_URL}/get/{lyrics_id}", headers=self.HEADERS
+        ) as response:
+            response.raise_for_status()
+            item = await response.json()
+
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "INSERT OR REPLACE INTO lyricsCache (id, name, artistName, albumName, plainLyrics, ttl) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    item["id"],
+                    item["name"],
+                    item["artistName"],
+                    item["albumName"],
+                    item["plainLyrics"],
+                    now + self.LYRICS_TTL,
+                ),
+            )
+            await sql.commit()
+
+        return {
+            "id": item["id"],
+            "name": item["name"],
+            "artistName": item["artistName"],
+            "albumName": item["albumName"],
+            "plainLyrics": item["plainLyrics"],
+        }
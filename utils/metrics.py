@@ -0,0 +1,319 @@
+import logging
+import math
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+import aiohttp
+import asqlite
+
+# Default histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+# Format a number for the text exposition format
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    elif math.isnan(value):
+        return "NaN"
+    elif float(value).is_integer():
+        return str(int(value))
+    else:
+        return repr(float(value))
+
+
+# Format a label set, e.g. {host="example.com",status="200"}
+def _format_labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+
+    labels = []
+
+    for name, value in zip(names, values):
+        value = (
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        labels.append(f'{name}="{value}"')
+
+    return "{" + ",".join(labels) + "}"
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+
+        self.values: dict[tuple, float] = {}
+
+    # Get label values in the order they were declared
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labels):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labels}, got {tuple(labels)}"
+            )
+
+        return tuple(str(labels[name]) for name in self.labels)
+
+    # Remove all values, used by collectors that rebuild a metric every scrape
+    def clear(self) -> None:
+        self.values.clear()
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+
+        for key, value in self.values.items():
+            lines.append(
+                f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            )
+
+        return lines
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self.values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+
+        self.buckets = tuple(sorted(buckets))
+
+        # Per label set: [bucket counts..., sum, count]
+        self.values: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        data = self.values.get(key)
+
+        if data is None:
+            data = [0] * len(self.buckets) + [0.0, 0]
+            self.values[key] = data
+
+        for i, le in enumerate(self.buckets):
+            if value <= le:
+                data[i] += 1
+
+        data[-2] += value
+        data[-1] += 1
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+
+        for key, data in self.values.items():
+            for le, count in zip(self.buckets, data):
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labels + ('le',), key + (_format_value(le),))} {count}"
+                )
+
+            lines.append(
+                f"{self.name}_bucket{_format_labels(self.labels + ('le',), key + ('+Inf',))} {data[-1]}"
+            )
+            lines.append(
+                f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(data[-2])}"
+            )
+            lines.append(
+                f"{self.name}_count{_format_labels(self.labels, key)} {data[-1]}"
+            )
+
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.metrics: dict[str, _Metric] = {}
+        self.collectors: list[Callable[[], None]] = []
+
+    # Get a metric, creating it if it doesn't exist yet
+    def _get_or_create(self, metric_type: type, name: str, *args, **kwargs):
+        metric = self.metrics.get(name)
+
+        if metric is None:
+            metric = metric_type(name, *args, **kwargs)
+            self.metrics[name] = metric
+        elif not isinstance(metric, metric_type):
+            raise ValueError(f"Metric {name} is already registered as a {metric.type}")
+
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: tuple = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labels)
+
+    def gauge(self, name: str, documentation: str, labels: tuple = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labels)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labels, buckets)
+
+    # Collectors are called before every render, to update gauges
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self.collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], None]) -> None:
+        if collector in self.collectors:
+            self.collectors.remove(collector)
+
+    # Render all metrics in the Prometheus text exposition format
+    def render(self) -> str:
+        for collector in self.collectors:
+            try:
+                collector()
+            except Exception as e:
+                logging.error(f"[METRICS] Collector {collector} failed - {e}")
+
+        lines = []
+
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+
+# Make an aiohttp trace config that records request counts and latency by host
+def http_trace_config(registry: Registry) -> aiohttp.TraceConfig:
+    requests = registry.counter(
+        "titanium_http_requests_total",
+        "Outgoing HTTP requests.",
+        ("host", "status"),
+    )
+    latency = registry.histogram(
+        "titanium_http_request_duration_seconds",
+        "Outgoing HTTP request latency.",
+        ("host",),
+    )
+
+    async def on_request_start(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        context.start = time.perf_counter()
+
+    async def on_request_end(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        host = params.url.host or ""
+
+        requests.inc(host=host, status=params.response.status)
+        latency.observe(time.perf_counter() - context.start, host=host)
+
+    async def on_request_exception(
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestExceptionParams,
+    ) -> None:
+        requests.inc(host=params.url.host or "", status="error")
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+
+    return trace_config
+
+
+class _TimedAcquire:
+    def __init__(self, pool: "TimedPool") -> None:
+        self._pool = pool
+        self._context = pool.pool.acquire()
+
+    async def __aenter__(self) -> asqlite.ProxiedConnection:
+        start = time.perf_counter()
+
+        try:
+            return await self._context.__aenter__()
+        finally:
+            self._pool.wait_time.observe(
+                time.perf_counter() - start, pool=self._pool.name
+            )
+
+    async def __aexit__(self, *args) -> None:
+        await self._context.__aexit__(*args)
+
+    def __await__(self):
+        return self.__aenter__().__await__()
+
+
+class TimedPool:
+    """Wraps an asqlite pool, recording how long acquiring a connection takes"""
+
+    def __init__(self, pool: asqlite.Pool, name: str, registry: Registry) -> None:
+        self.pool = pool
+        self.name = name
+        self.wait_time = registry.histogram(
+            "titanium_sqlite_pool_wait_seconds",
+            "Time spent waiting for a SQLite pool connection.",
+            ("pool",),
+        )
+
+    def acquire(self) -> _TimedAcquire:
+        return _TimedAcquire(self)
+
+    def __getattr__(self, name: str):
+        return getattr(self.pool, name)
+
+
+class RateLimitHandler(logging.Handler):
+    """Counts Discord REST rate limit warnings logged by discord.py"""
+
+    def __init__(self, registry: Registry) -> None:
+        super().__init__(level=logging.WARNING)
+
+        self.hits = registry.counter(
+            "titanium_discord_rate_limit_hits_total",
+            "Discord REST rate limits hit.",
+            ("scope",),
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not isinstance(record.msg, str):
+            return
+
+        if record.msg.startswith("We are being rate limited"):
+            self.hits.inc(scope="bucket")
+        elif record.msg.startswith("Global rate limit has been hit"):
+            self.hits.inc(scope="global")
@@ -0,0 +1,247 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+import discord
+from discord import ButtonStyle, Color
+from discord.ui import View
+
+# Page number -> data for that page
+PageProvider = Callable[[int], Awaitable[Any]]
+
+# Interaction, page data, page number, page count -> embed or embeds to show
+EmbedMaker = Callable[
+    [discord.Interaction, Any, int, int], discord.Embed | list[discord.Embed]
+]
+
+
+class Paginator(View):
+    """Page controls that load each page only when it is needed.
+
+    Page data comes from an async provider, and embeds are made from it when
+    a page is shown, so footers always name whoever is controlling. Only the
+    current page and its neighbours are kept, with the neighbours loaded in
+    the background. Everything is dropped when the view times out.
+
+    Pass a user ID to add a lock button, letting that user stop others from
+    changing pages. The page count can be a function, for sources that only
+    find out how many pages they have while loading them.
+    """
+
+    def __init__(
+        self,
+        page_count: int | Callable[[], int],
+        get_page: PageProvider,
+        make_embed: EmbedMaker,
+        user_id: int | None = None,
+        timeout: float | None = 900,
+        errors: tuple[type[Exception], ...] = (),
+        error_message: str = "Failed to load this page. Please try again later.",
+    ):
+        super().__init__(timeout=timeout)
+        self.page = 0
+        self.count = page_count
+        self.get_page = get_page
+        self.make_embed = make_embed
+
+        # Errors from get_page shown to the user instead of raised
+        self.errors = errors
+        self.error_message = error_message
+
+        # Page number -> load, only the current page and its neighbours
+        self.pages: dict[int, asyncio.Task] = {}
+
+        self.locked = False
+        self.user_id = user_id
+        self.message: discord.Message | None = None
+
+        if user_id is None:
+            self.remove_item(self.lock_button)
+
+    @property
+    def page_count(self) -> int:
+        count = self.count() if callable(self.count) else self.count
+        return max(1, count)
+
+    def update_buttons(self) -> None:
+        for item in self.children:
+            if item.custom_id == "first" or item.custom_id == "prev":
+                item.disabled = self.page == 0
+            elif item.custom_id == "next" or item.custom_id == "last":
+                item.disabled = self.page >= self.page_count - 1
+
+    def _load(self, page: int) -> asyncio.Task:
+        task = self.pages.get(page)
+
+        if task is None:
+            task = asyncio.create_task(self.get_page(page))
+            self.pages[page] = task
+            task.add_done_callback(lambda t: self._load_done(page, t))
+
+        return task
+
+    def _load_done(self, page: int, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+
+        # Forget failed pages so they are loaded again when shown
+        if task.exception() is not None:
+            if self.pages.get(page) is task:
+                del self.pages[page]
+
+            logging.debug(f"[PAGES] Failed to load page {page} - {task.exception()}")
+
+    def _loaded(self, page: int) -> bool:
+        task = self.pages.get(page)
+        return task is not None and task.done() and task.exception() is None
+
+    # Drop pages that aren't next to the current one, and load its neighbours
+    def _keep(self, page: int) -> None:
+        wanted = {
+            neighbour
+            for neighbour in (page - 1, page, page + 1)
+            if 0 <= neighbour < self.page_count
+        }
+
+        # Not cancelled, another interaction may still be waiting on them
+        for other in list(self.pages):
+            if other not in wanted:
+                del self.pages[other]
+
+        for neighbour in wanted:
+            self._load(neighbour)
+
+    # Load a page and make its embeds, moving the view to it
+    async def render(
+        self, interaction: discord.Interaction, page: int
+    ) -> list[discord.Embed]:
+        page = max(0, min(page, self.page_count - 1))
+
+        # Shield, so a neighbour load isn't lost if this interaction fails
+        data = await asyncio.shield(self._load(page))
+
+        # Page count may have shrunk while loading, go to the real last page
+        if page > self.page_count - 1:
+            page = self.page_count - 1
+            data = await asyncio.shield(self._load(page))
+
+        self.page = page
+        self._keep(page)
+        self.update_buttons()
+
+        embeds = self.make_embed(interaction, data, page, self.page_count)
+        return embeds if isinstance(embeds, list) else [embeds]
+
+    async def show_page(self, interaction: discord.Interaction, page: int) -> None:
+        page = max(0, min(page, self.page_count - 1))
+
+        try:
+            if self._loaded(page):
+                await interaction.response.edit_message(
+                    embeds=await self.render(interaction, page), view=self
+                )
+            else:
+                # Loading may take a while
+                await interaction.response.defer()
+                await interaction.edit_original_response(
+                    embeds=await self.render(interaction, page), view=self
+                )
+        except self.errors as e:
+            logging.error(f"[PAGES] Failed to load page - {e}")
+
+            embed = discord.Embed(
+                title="Error",
+                description=self.error_message,
+                color=Color.red(),
+            )
+
+            if interaction.response.is_done():
+                await interaction.followup.send(embed=embed, ephemeral=True)
+            else:
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    # Timeout
+    async def on_timeout(self) -> None:
+        # Release page data, the view can't be used again
+        for task in self.pages.values():
+            task.cancel()
+
+        self.pages.clear()
+        self.get_page = None
+        self.make_embed = None
+
+        try:
+            for item in self.children:
+                item.disabled = True
+
+            if self.message is not None:
+                await self.message.edit(view=self)
+        except Exception:
+            pass
+
+    # Page lock
+    async def interaction_check(self, interaction: discord.Interaction):
+        if self.user_id is None or interaction.user.id == self.user_id:
+            return True
+
+        if self.locked:
+            embed = discord.Embed(
+                title="Error",
+                description="This command is locked. Only the owner can control it.",
+                color=Color.red(),
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        else:
+            return True
+
+    # First page
+    @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
+    async def first_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show_page(interaction, 0)
+
+    # Previous page
+    @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
+    async def prev_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.page - 1)
+
+    # Lock / unlock toggle
+    @discord.ui.button(emoji="🔓", style=ButtonStyle.green, custom_id="lock")
+    async def lock_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        if interaction.user.id == self.user_id:
+            self.locked = not self.locked
+
+            if self.locked:
+                button.emoji = "🔒"
+                button.style = ButtonStyle.red
+            else:
+                button.emoji = "🔓"
+                button.style = ButtonStyle.green
+
+            await interaction.response.edit_message(view=self)
+        else:
+            embed = discord.Embed(
+                title="Error",
+                description="Only the command runner can toggle the page controls lock.",
+                color=Color.red(),
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    # Next page
+    @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
+    async def next_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.page + 1)
+
+    # Last page
+    @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
+    async def last_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.page_count - 1)
@@ -1,14 +1,38 @@
+import logging
 from io import BytesIO
 from textwrap import shorten
-from urllib.parse import quote, quote_plus
+from urllib.parse import quote_plus
 
 import aiohttp
 import discord
 from colorthief import ColorThief
-from discord import ButtonStyle, Color
+from discord import Color
 from discord.ui import View
 from discord.utils import escape_markdown
 
+from utils.image_pool import ImageQueueFullError, busy_embed
+from utils.paginator import Paginator
+
+
+# Tell the user the image pool is full, instead of sending an embed
+async def _send_busy(
+    interaction: discord.Interaction, ephemeral: bool, responded: bool
+) -> None:
+    if responded:
+        await interaction.edit_original_response(
+            embed=busy_embed(interaction), view=None
+        )
+    else:
+        await interaction.followup.send(
+            embed=busy_embed(interaction), ephemeral=ephemeral
+        )
+
+
+# Get dominant colour of an image, runs in the image pool
+def _get_colour(image_data: bytes) -> tuple[int, int, int]:
+    return ColorThief(BytesIO(image_data)).get_color()
+
+
 # --- Song Classes and Functions ---
 
 
@@ -150,47 +174,48 @@ class SongMenuView(View):
     async def lyrics(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
 
-        url = f"https://lrclib.net/api/search?track_name={quote(self.item['name'])}&artist_name={quote(self.item['artists'][0]['name'])}"
-        headers = {"User-Agent": "Titanium Discord Bot (https://titaniumbot.me)"}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data != []:
-                        selector = SongLyricSelection(item=self.item)
-                        for lyric_data in data:
-                            selector.add_option(
-                                label=shorten(
-                                    lyric_data["name"], width=100, placeholder="..."
-                                ),
-                                value=lyric_data["id"],
-                                description=shorten(
-                                    f"{lyric_data['artistName']} - {lyric_data['albumName']}",
-                                    width=100,
-                                    placeholder="...",
-                                ),
-                            )
-
-                        view = SongLyricsSelectionView()
-                        view.add_item(selector)
-                        await interaction.edit_original_response(view=view)
-
-                        view.message = await interaction.original_response()
-                    else:
-                        embed = discord.Embed(
-                            title="No Lyrics Found",
-                            description="No lyrics were found for this song.",
-                            color=Color.red(),
-                        )
-                        await interaction.edit_original_response(embed=embed)
-                else:
-                    embed = discord.Embed(
-                        title="Error",
-                        description="Failed to fetch lyrics. Please try again later.",
-                        color=Color.red(),
-                    )
-                    await interaction.edit_original_response(embed=embed)
+        try:
+            data = await interaction.client.lyrics.search(
+                self.item["name"], self.item["artists"][0]["name"]
+            )
+        except Exception as error:
+            logging.error(f"[LYRICS] Error while searching lyrics: {error}")
+
+            embed = discord.Embed(
+                title="Error",
+                description="Failed to fetch lyrics. Please try again later.",
+                color=Color.red(),
+            )
+            await interaction.edit_original_response(embed=embed)
+
+            self.stop()
+            return
+
+        if data:
+            selector = SongLyricSelection(item=self.item)
+            for lyric_data in data:
+                selector.add_option(
+                    label=shorten(lyric_data["name"], width=100, placeholder="..."),
+                    value=lyric_data["id"],
+                    description=shorten(
+                        f"{lyric_data['artistName']} - {lyric_data['albumName']}",
+                        width=100,
+                        placeholder="...",
+                    ),
+                )
+
+            view = SongLyricsSelectionView()
+            view.add_item(selector)
+            await interaction.edit_original_response(view=view)
+
+            view.message = await interaction.original_response()
+        else:
+            embed = discord.Embed(
+                title="No Lyrics Found",
+                description="No lyrics were found for this song.",
+                color=Color.red(),
+            )
+            await interaction.edit_original_response(embed=embed)
 
         self.stop()
 
@@ -209,20 +234,21 @@ class SongLyricSelection(discord.ui.Select):
         await interaction.response.defer(ephemeral=True)
 
         self.view.stop()
-        request_url = f"https://lrclib.net/api/get/{self.values[0]}"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(request_url) as response:
-                if response.status == 200:
-                    selected_song_data = await response.json()
-                else:
-                    embed = discord.Embed(
-                        title="Error",
-                        description="Failed to fetch lyrics. Please try again later.",
-                        color=Color.red(),
-                    )
-                    await interaction.edit_original_response(embed=embed)
-                    return
+        try:
+            selected_song_data = await interaction.client.lyrics.get(
+                int(self.values[0])
+            )
+        except Exception as error:
+            logging.error(f"[LYRICS] Error while fetching lyrics: {error}")
+
+            embed = discord.Embed(
+                title="Error",
+                description="Failed to fetch lyrics. Please try again later.",
+                color=Color.red(),
+            )
+            await interaction.edit_original_response(embed=embed)
+            return
 
         raw_lyrics: str = selected_song_data["plainLyrics"]
 
@@ -252,8 +278,10 @@ class SongLyricSelection(discord.ui.Select):
             info=selected_song_data,
         )
 
-        embed = await view._create_embed(0, interaction)
-        await interaction.edit_original_response(embed=embed, view=view)
+        embeds = await view.render(interaction, 0)
+        view.message = await interaction.edit_original_response(
+            embeds=embeds, view=view
+        )
 
 
 class SongLyricsSelectionView(View):
@@ -266,7 +294,7 @@ class SongLyricsSelectionView(View):
         await self.message.delete()
 
 
-class SongLyricsView(View):
+class SongLyricsView(Paginator):
     def __init__(
         self,
         pages: list,
@@ -274,161 +302,35 @@ class SongLyricsView(View):
         creator_id: int,
         info: dict,
     ):
-        super().__init__(timeout=900)
-
-        self.pages = pages
-        self.page = 0
-        self.locked = False
-        self.info = info
-
-        self.private = private
-        self.creator_id = creator_id
-
-        for item in self.children:
-            if item.custom_id == "first" or item.custom_id == "prev":
-                item.disabled = True
-            elif (item.custom_id == "next" or item.custom_id == "last") and len(
-                self.pages
-            ) <= 1:
-                item.disabled = True
-            elif item.custom_id == "lock" and self.private:
-                self.remove_item(item)
-
-    async def _create_embed(self, page: int, interaction: discord.Interaction):
-        embed = discord.Embed(
-            title=f"{self.info['name']} - Lyrics",
-            description=self.pages[page],
-            color=Color.random(),
-        )
-
-        embed.set_footer(
-            text=f"@{interaction.user.name} • Page {page + 1}/{len(self.pages)} • lrclib.net",
-            icon_url=interaction.user.display_avatar.url,
-        )
-        embed.set_author(
-            name=f"{self.info['artistName']}",
-        )
-
-        return embed
-
-    async def interaction_check(self, interaction: discord.Interaction):
-        if interaction.user.id != self.creator_id:
-            if self.locked:
-                embed = discord.Embed(
-                    title="Error",
-                    description="This command is locked. Only the owner can control it.",
-                    color=Color.red(),
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-            else:
-                return True
-        else:
-            return True
-
-    @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first")
-    async def first_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        self.page = 0
+        async def get_page(page: int) -> str:
+            return pages[page]
 
-        for item in self.children:
-            item.disabled = False
-
-            if item.custom_id == "first" or item.custom_id == "prev":
-                item.disabled = True
-
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev")
-    async def prev_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        if self.page - 1 == 0:
-            self.page -= 1
-
-            for item in self.children:
-                item.disabled = False
-
-                if item.custom_id == "first" or item.custom_id == "prev":
-                    item.disabled = True
-        else:
-            self.page -= 1
-
-            for item in self.children:
-                item.disabled = False
-
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    @discord.ui.button(emoji="🔓", style=ButtonStyle.green, custom_id="lock")
-    async def lock_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        if interaction.user.id == self.creator_id:
-            self.locked = not self.locked
-
-            if self.locked:
-                button.emoji = "🔒"
-                button.style = ButtonStyle.red
-            else:
-                button.emoji = "🔓"
-                button.style = ButtonStyle.green
-
-            await interaction.response.edit_message(view=self)
-        else:
+        def make_embed(
+            interaction: discord.Interaction, lyrics: str, page: int, page_count: int
+        ) -> discord.Embed:
             embed = discord.Embed(
-                title="Error",
-                description="Only the command runner can toggle the page controls lock.",
-                color=Color.red(),
+                title=f"{info['name']} - Lyrics",
+                description=lyrics,
+                color=Color.random(),
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next")
-    async def next_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        if (self.page + 1) == (len(self.pages) - 1):
-            self.page += 1
-
-            for item in self.children:
-                item.disabled = False
-
-                if item.custom_id == "next" or item.custom_id == "last":
-                    item.disabled = True
-        else:
-            self.page += 1
-
-            for item in self.children:
-                item.disabled = False
-
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
 
-    @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last")
-    async def last_button(
-        self,
-        interaction: discord.Interaction,
-        button: discord.ui.Button,
-    ):
-        self.page = len(self.pages) - 1
-
-        for item in self.children:
-            item.disabled = False
+            embed.set_footer(
+                text=f"@{interaction.user.name} • Page {page + 1}/{page_count} • lrclib.net",
+                icon_url=interaction.user.display_avatar.url,
+            )
+            embed.set_author(
+                name=f"{info['artistName']}",
+            )
 
-            if item.custom_id == "next" or item.custom_id == "last":
-                item.disabled = True
+            return embed
 
-        embed = await self._create_embed(self.page, interaction)
-        await interaction.response.edit_message(embed=embed, view=self)
+        # Private lyrics are only visible to their owner, so there's no lock
+        super().__init__(
+            len(pages),
+            get_page,
+            make_embed,
+            user_id=None if private else creator_id,
+        )
 
 
 # Song element function
@@ -487,8 +389,13 @@ async def song(
             image_data.seek(0)  # Reset buffer position to start
 
     # Get dominant colour for embed
-    color_thief = ColorThief(image_data)
-    colours = color_thief.get_color()
+    try:
+        colours = await self.bot.image_pool.run(
+            interaction.user.id, _get_colour, image_data.getvalue()
+        )
+    except ImageQueueFullError:
+        await _send_busy(interaction, ephemeral, responded)
+        return
 
     embed.color = Color.from_rgb(r=colours[0], g=colours[1], b=colours[2])
 
@@ -669,8 +576,13 @@ async def artist(
             image_data.seek(0)  # Reset buffer position to start
 
     # Get dominant colour for embed
-    color_thief = ColorThief(image_data)
-    colours = color_thief.get_color()
+    try:
+        colours = await self.bot.image_pool.run(
+            interaction.user.id, _get_colour, image_data.getvalue()
+        )
+    except ImageQueueFullError:
+        await _send_busy(interaction, ephemeral, responded)
+        return
 
     embed.color = Color.from_rgb(r=colours[0], g=colours[1], b=colours[2])
 
@@ -689,7 +601,7 @@ async def artist(
 # --- Album Classes and Functions ---
 
 
-class AlbumViewPages(View):
+class AlbumViewPages(Paginator):
     def __init__(
         self,
         item: dict,
@@ -702,35 +614,52 @@ class AlbumViewPages(View):
         add_button_url: str = None,
         add_button_text: str = None,
     ):
-        super().__init__(timeout=259200)  # 3 days
+        async def get_page(page: int) -> str:
+            return pages[page]
+
+        def make_embed(
+            interaction: discord.Interaction, tracks: str, page: int, page_count: int
+        ) -> discord.Embed:
+            embed = discord.Embed(
+                title=item["name"],
+                description=tracks,
+                color=Color.from_rgb(colours[0], colours[1], colours[2]),
+            )
+
+            embed.set_footer(
+                text=f"{'Controlling: ' if page_count > 1 else ''}@{interaction.user.name} • Page {page + 1}/{page_count}{' • Cached Link' if cached else ''}",
+                icon_url=interaction.user.display_avatar.url,
+            )
+
+            embed.set_author(
+                name=artists,
+                url=item["artists"][0]["external_urls"]["spotify"],
+                icon_url=artist_img,
+            )
+
+            embed.set_thumbnail(url=item["images"][0]["url"])
+
+            return embed
+
+        super().__init__(
+            len(pages),
+            get_page,
+            make_embed,
+            user_id=op_id,
+            timeout=259200,  # 3 days
+        )
 
         self.item = item
         self.artists = artists
         self.artist_img = artist_img
-        self.cached = cached
-        self.pages = pages
         self.colours = colours
-        self.op_id = op_id
         self.add_button_url = add_button_url
         self.add_button_text = add_button_text
 
-        self.page = 0
-        self.locked = False
-
-        if len(self.pages) > 1:
-            # Hide first and prev buttons when starting
-            for child in self.children:
-                if child.custom_id == "first" or child.custom_id == "prev":
-                    child.disabled = True
-        else:
+        # Only the menu is needed for short albums
+        if self.page_count == 1:
             for child in self.children:
-                if (
-                    child.custom_id == "first"
-                    or child.custom_id == "prev"
-                    or child.custom_id == "lock"
-                    or child.custom_id == "next"
-                    or child.custom_id == "last"
-                ):
+                if child.custom_id in ("first", "prev", "lock", "next", "last"):
                     self.remove_item(child)
 
         # Add Open in Spotify button
@@ -742,201 +671,10 @@ class AlbumViewPages(View):
         )
         self.add_item(spotify_button)
 
-    # Page lock
-    async def interaction_check(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-
-        if interaction.user.id != self.op_id:
-            if self.locked:
-                embed = discord.Embed(
-                    title="Locked",
-                    description="The page is locked. Only the owner can control it.",
-                    color=Color.red(),
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-            else:
-                return True
-        else:
-            return True
-
-    # First page
-    @discord.ui.button(emoji="⏮️", style=ButtonStyle.red, custom_id="first", row=0)
-    async def first_button(
-        self, interaction: discord.Interaction, button: discord.ui.Button
-    ):
-        self.page = 0
-
-        for child in self.children:
-            child.disabled = False
-
-            if child.custom_id == "first" or child.custom_id == "prev":
-                child.disabled = True
-
-        # Create embed
-        embed = discord.Embed(
-            title=self.item["name"],
-            description=self.pages[self.page],
-            color=Color.from_rgb(self.colours[0], self.colours[1], self.colours[2]),
-        )
-
-        embed.set_footer(
-            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}{' • Cached Link' if self.cached else ''}",
-            icon_url=interaction.user.display_avatar.url,
-        )
-
-        embed.set_author(
-            name=self.artists,
-            url=self.item["artists"][0]["external_urls"]["spotify"],
-            icon_url=self.artist_img,
-        )
-
-        embed.set_thumbnail(url=self.item["images"][0]["url"])
-
-        await interaction.edit_original_response(embed=embed, view=self)
-
-    # Previous page
-    @discord.ui.button(emoji="⏪", style=ButtonStyle.gray, custom_id="prev", row=0)
-    async def prev_button(
-        self, interaction: discord.Interaction, button: discord.ui.Button
-    ):
-        if self.page - 1 == 0:
-            self.page -= 1
-
-            for child in self.children:
-                child.disabled = False
-
-                if child.custom_id == "first" or child.custom_id == "prev":
-                    child.disabled = True
-        else:
-            self.page -= 1
-
-            for child in self.children:
-                child.disabled = False
-
-        # Create embed
-        embed = discord.Embed(
-            title=self.item["name"],
-            description=self.pages[self.page],
-            color=Color.from_rgb(self.colours[0], self.colours[1], self.colours[2]),
-        )
-
-        embed.set_footer(
-            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}{' • Cached Link' if self.cached else ''}",
-            icon_url=interaction.user.display_avatar.url,
-        )
-
-        embed.set_author(
-            name=self.artists,
-            url=self.item["artists"][0]["external_urls"]["spotify"],
-            icon_url=self.artist_img,
-        )
-
-        embed.set_thumbnail(url=self.item["images"][0]["url"])
-
-        await interaction.edit_original_response(embed=embed, view=self)
-
-    # Lock / unlock toggle
-    @discord.ui.button(emoji="🔓", style=ButtonStyle.green, custom_id="lock", row=0)
-    async def lock_button(
-        self, interaction: discord.Interaction, button: discord.ui.Button
-    ):
-        if interaction.user.id == self.user_id:
-            self.locked = not self.locked
-
-            if self.locked:
-                button.emoji = "🔒"
-                button.style = ButtonStyle.red
-            else:
-                button.emoji = "🔓"
-                button.style = ButtonStyle.green
-
-            await interaction.response.edit_message(view=self)
-        else:
-            embed = discord.Embed(
-                title="Error",
-                description="Only the command runner can toggle the page controls lock.",
-                color=Color.red(),
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    # Next page
-    @discord.ui.button(emoji="⏩", style=ButtonStyle.gray, custom_id="next", row=0)
-    async def next_button(
-        self, interaction: discord.Interaction, button: discord.ui.Button
-    ):
-        if (self.page + 1) == (len(self.pages) - 1):
-            self.page += 1
-
-            for child in self.children:
-                child.disabled = False
-
-                if child.custom_id == "next" or child.custom_id == "last":
-                    child.disabled = True
-        else:
-            self.page += 1
-
-            for child in self.children:
-                child.disabled = False
-
-        # Create embed
-        embed = discord.Embed(
-            title=self.item["name"],
-            description=self.pages[self.page],
-            color=Color.from_rgb(self.colours[0], self.colours[1], self.colours[2]),
-        )
-
-        embed.set_footer(
-            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}{' • Cached Link' if self.cached else ''}",
-            icon_url=interaction.user.display_avatar.url,
-        )
-
-        embed.set_author(
-            name=self.artists,
-            url=self.item["artists"][0]["external_urls"]["spotify"],
-            icon_url=self.artist_img,
-        )
-
-        embed.set_thumbnail(url=self.item["images"][0]["url"])
-
-        await interaction.edit_original_response(embed=embed, view=self)
-
-    # Last page button
-    @discord.ui.button(emoji="⏭️", style=ButtonStyle.green, custom_id="last", row=0)
-    async def last_button(
-        self, interaction: discord.Interaction, button: discord.ui.Button
-    ):
-        self.page = len(self.pages) - 1
-
-        for child in self.children:
-            child.disabled = False
-
-            if child.custom_id == "next" or child.custom_id == "last":
-                child.disabled = True
-
-        # Create embed
-        embed = discord.Embed(
-            title=self.item["name"],
-            description=self.pages[self.page],
-            color=Color.from_rgb(self.colours[0], self.colours[1], self.colours[2]),
-        )
-
-        embed.set_footer(
-            text=f"Controlling: @{interaction.user.name} • Page {self.page + 1}/{len(self.pages)}{' • Cached Link' if self.cached else ''}",
-            icon_url=interaction.user.display_avatar.url,
-        )
-
-        embed.set_author(
-            name=self.artists,
-            url=self.item["artists"][0]["external_urls"]["spotify"],
-            icon_url=self.artist_img,
-        )
-
-        embed.set_thumbnail(url=self.item["images"][0]["url"])
-
-        await interaction.edit_original_response(embed=embed, view=self)
-
     @discord.ui.button(label="Menu", style=discord.ButtonStyle.gray, row=1)
     async def menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.defer(ephemeral=True)
+
         view = AlbumMenuView(
             item=self.item,
             artists=self.artists,
@@ -1123,28 +861,13 @@ async def album(
             image_data.seek(0)  # Reset buffer position to start
 
     # Get dominant colour for embed
-    color_thief = ColorThief(image_data)
-    colours = color_thief.get_color()
-
-    # Create embed
-    embed = discord.Embed(
-        title=item["name"],
-        description=pages[0],
-        color=Color.from_rgb(r=colours[0], g=colours[1], b=colours[2]),
-    )
-
-    embed.set_footer(
-        text=f"{'Controlling: ' if len(pages) > 1 else ''}@{interaction.user.name} • Page 1/{len(pages)}{' • Cached Link' if cached else ''}",
-        icon_url=interaction.user.display_avatar.url,
-    )
-
-    embed.set_author(
-        name=artists,
-        url=item["artists"][0]["external_urls"]["spotify"],
-        icon_url=artist_img,
-    )
-
-    embed.set_thumbnail(url=item["images"][0]["url"])
+    try:
+        colours = await self.bot.image_pool.run(
+            interaction.user.id, _get_colour, image_data.getvalue()
+        )
+    except ImageQueueFullError:
+        await _send_busy(interaction, ephemeral, responded)
+        return
 
     view = AlbumViewPages(
         item=item,
@@ -1158,7 +881,13 @@ async def album(
         add_button_text=add_button_text,
     )
 
+    embeds = await view.render(interaction, 0)
+
     if responded:
-        await interaction.edit_original_response(embed=embed, view=view)
+        view.message = await interaction.edit_original_response(
+            embeds=embeds, view=view
+        )
     else:
-        await interaction.followup.send(embed=embed, view=view, ephemeral=ephemeral)
+        view.message = await interaction.followup.send(
+            embeds=embeds, view=view, ephemeral=ephemeral, wait=True
+        )
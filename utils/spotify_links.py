@@ -0,0 +1,118 @@
+import asyncio
+import collections
+from urllib.parse import urljoin, urlparse
+
+import aiohttp
+import asqlite
+
+
+class SpotifyLinkError(Exception):
+    """Raised when a spotify.link URL doesn't redirect to Spotify"""
+
+
+class SpotifyLinkResolver:
+    """Expands spotify.link short URLs to open.spotify.com URLs.
+
+    Redirects are followed by hand with HEAD requests, so page bodies are
+    never downloaded. Results are stored in cache.db, since short links
+    always point to the same place, and concurrent lookups of the same link
+    share one request.
+    """
+
+    # Most redirects to follow before giving up
+    MAX_REDIRECTS = 5
+
+    # Max resolved links kept in memory, the rest are looked up in cache.db
+    MEMORY_CACHE_SIZE = 1024
+
+    def __init__(self, session: aiohttp.ClientSession, pool: asqlite.Pool) -> None:
+        self.session = session
+        self.pool = pool
+
+        self.cache: collections.OrderedDict[str, str] = collections.OrderedDict()
+        self.resolving: dict[str, asyncio.Task] = {}
+
+    async def setup(self) -> None:
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "CREATE TABLE IF NOT EXISTS spotifyLinkCache (shortURL text PRIMARY KEY, url text)"
+            )
+            await sql.commit()
+
+    # Tidy a user provided short link, so the same link always has one key
+    @staticmethod
+    def normalise(url: str) -> str:
+        # noinspection HttpUrlsUsage
+        url = (
+            url.strip()
+            .replace("www.", "")
+            .replace("http://", "")
+            .replace("https://", "")
+            .rstrip("/")
+        )
+        return f"https://{url}"
+
+    # Get the full Spotify URL for a short link
+    async def resolve(self, url: str) -> str:
+        url = self.normalise(url)
+
+        if url in self.cache:
+            self.cache.move_to_end(url)
+            return self.cache[url]
+
+        task = self.resolving.get(url)
+
+        if task is None:
+            task = asyncio.create_task(self._resolve(url))
+            self.resolving[url] = task
+            task.add_done_callback(lambda _: self.resolving.pop(url, None))
+
+        # Shield, so one caller giving up doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _resolve(self, url: str) -> str:
+        async with self.pool.acquire() as sql:
+            row = await sql.fetchone(
+                "SELECT url FROM spotifyLinkCache WHERE shortURL = ?", (url,)
+            )
+
+        if row is not None:
+            resolved = row[0]
+        else:
+            resolved = await self._follow(url)
+
+            async with self.pool.acquire() as sql:
+                await sql.execute(
+                    "INSERT OR REPLACE INTO spotifyLinkCache (shortURL, url) VALUES (?, ?)",
+                    (url, resolved),
+                )
+                await sql.commit()
+
+        self.cache[url] = resolved
+
+        if len(self.cache) > self.MEMORY_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+        return resolved
+
+    # Follow redirects until reaching open.spotify.com
+    async def _follow(self, url: str) -> str:
+        for _ in range(self.MAX_REDIRECTS):
+            async with self.session.head(url, allow_redirects=False) as response:
+                location = response.headers.get("Location")
+
+                if response.status == 405:
+                    # HEAD not allowed, ask again without reading the body
+                    async with self.session.get(url, allow_redirects=False) as response:
+                        location = response.headers.get("Location")
+
+                if location is None:
+                    response.raise_for_status()
+                    raise SpotifyLinkError(f"{url} did not redirect to Spotify")
+
+            url = urljoin(url, location)
+
+            if urlparse(url).hostname == "open.spotify.com":
+                return url
+
+        raise SpotifyLinkError(f"Too many redirects while expanding {url}")
@@ -0,0 +1,106 @@
+import bisect
+import collections
+from typing import Iterable, Iterator
+
+from thefuzz import process
+
+
+# Padded three letter chunks of a name, so short names and starts match too
+def _trigrams(text: str) -> set[str]:
+    text = f"  {text} "
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TagSearchIndex:
+    """Tag names for one owner, indexed for autocomplete.
+
+    Names are kept sorted for prefix lookups, and each name is listed under
+    its trigrams. A search only fuzzy scores names that share a prefix or
+    the most trigrams with the query, rather than every name.
+    """
+
+    # Most names fuzzy scored per search
+    MAX_CANDIDATES = 50
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.names: set[str] = set()
+        self.sorted: list[str] = []
+        self.trigrams: collections.defaultdict[str, set[str]] = collections.defaultdict(
+            set
+        )
+
+        for name in names:
+            self.add(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sorted)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(self, name: str) -> None:
+        if name in self.names:
+            return
+
+        self.names.add(name)
+        bisect.insort(self.sorted, name)
+
+        for trigram in _trigrams(name):
+            self.trigrams[trigram].add(name)
+
+    def discard(self, name: str) -> None:
+        if name not in self.names:
+            return
+
+        self.names.remove(name)
+        del self.sorted[bisect.bisect_left(self.sorted, name)]
+
+        for trigram in _trigrams(name):
+            names = self.trigrams[trigram]
+            names.discard(name)
+
+            if not names:
+                del self.trigrams[trigram]
+
+    # First names in alphabetical order
+    def first(self, count: int) -> list[str]:
+        return self.sorted[:count]
+
+    # Names starting with a prefix, in alphabetical order
+    def starting_with(self, prefix: str, limit: int) -> list[str]:
+        start = bisect.bisect_left(self.sorted, prefix)
+        matches = []
+
+        for name in self.sorted[start : start + limit]:
+            if not name.startswith(prefix):
+                break
+
+            matches.append(name)
+
+        return matches
+
+    # Fuzzy search, returning (name, score) pairs with the best first
+    def search(self, query: str, limit: int = 10) -> list[tuple[str, int]]:
+        query = query.lower()
+
+        candidates = set(self.starting_with(query, self.MAX_CANDIDATES))
+
+        # Names sharing the most trigrams with the query
+        shared = collections.Counter()
+
+        for trigram in _trigrams(query):
+            shared.update(self.trigrams.get(trigram, ()))
+
+        for name, _ in shared.most_common(self.MAX_CANDIDATES):
+            candidates.add(name)
+
+        if not candidates:
+            return []
+
+        return [
+            (match[0], match[1])
+            for match in process.extract(query, candidates, limit=limit)
+        ]
@@ -0,0 +1,121 @@
+import collections
+
+import asqlite
+
+from utils.tag_search import TagSearchIndex
+
+
+class TagCache:
+    """Tags for each owner, a server or user ID, shared by the tag cogs.
+
+    Only names are kept in memory, loaded when an owner is first needed and
+    indexed for autocomplete and existence checks. Tag content is read from
+    tags.db when a tag is used, and owners that haven't been used recently
+    are dropped. Names are unique per owner.
+    """
+
+    # Most owners with names kept in memory
+    MAX_OWNERS = 2048
+
+    def __init__(self, pool: asqlite.Pool) -> None:
+        self.pool = pool
+        self.owners: collections.OrderedDict[int, TagSearchIndex] = (
+            collections.OrderedDict()
+        )
+
+    async def setup(self) -> None:
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "CREATE TABLE IF NOT EXISTS tags (id INTEGER PRIMARY KEY, creatorID INTEGER, name TEXT, content TEXT)"
+            )
+
+            # Keep only the newest of any duplicate names, so they can be
+            # made unique
+            await sql.execute(
+                "DELETE FROM tags WHERE id NOT IN (SELECT MAX(id) FROM tags GROUP BY creatorID, name)"
+            )
+
+            # Tags are always looked up by owner, then name
+            await sql.execute("DROP INDEX IF EXISTS tags_creator_name")
+            await sql.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS tags_creator_name_unique ON tags (creatorID, name)"
+            )
+            await sql.commit()
+
+    # Get an owner's tag names
+    async def names(self, owner_id: int) -> TagSearchIndex:
+        names = self.owners.get(owner_id)
+
+        if names is not None:
+            self.owners.move_to_end(owner_id)
+            return names
+
+        async with self.pool.acquire() as sql:
+            rows = await sql.fetchall(
+                "SELECT name FROM tags WHERE creatorID = ?", (owner_id,)
+            )
+
+        # Another lookup may have loaded them while waiting
+        names = self.owners.setdefault(owner_id, TagSearchIndex(row[0] for row in rows))
+        self.owners.move_to_end(owner_id)
+
+        while len(self.owners) > self.MAX_OWNERS:
+            self.owners.popitem(last=False)
+
+        return names
+
+    # Get a tag's content, None if it doesn't exist
+    async def content(self, owner_id: int, name: str) -> str | None:
+        async with self.pool.acquire() as sql:
+            row = await sql.fetchone(
+                "SELECT content FROM tags WHERE creatorID = ? AND name = ?",
+                (owner_id, name),
+            )
+
+        return row[0] if row is not None else None
+
+    # Get a page of an owner's tags, oldest first, with the start of their content
+    async def previews(
+        self, owner_id: int, length: int, limit: int, offset: int = 0
+    ) -> list[tuple[str, str]]:
+        async with self.pool.acquire() as sql:
+            rows = await sql.fetchall(
+                "SELECT name, substr(content, 1, ?) FROM tags WHERE creatorID = ? ORDER BY id LIMIT ? OFFSET ?",
+                (length, owner_id, limit, offset),
+            )
+
+        return [(row[0], row[1]) for row in rows]
+
+    async def create(self, owner_id: int, name: str, content: str) -> None:
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "INSERT INTO tags (creatorID, name, content) VALUES (?, ?, ?) ON CONFLICT (creatorID, name) DO UPDATE SET content = excluded.content",
+                (owner_id, name, content),
+            )
+
+        if owner_id in self.owners:
+            self.owners[owner_id].add(name)
+
+    async def set_content(self, owner_id: int, name: str, content: str) -> None:
+        await self.create(owner_id, name, content)
+
+    async def rename(self, owner_id: int, name: str, new_name: str) -> None:
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "UPDATE tags SET name = ? WHERE creatorID = ? AND name = ?",
+                (new_name, owner_id, name),
+            )
+
+        if owner_id in self.owners:
+            self.owners[owner_id].discard(name)
+            self.owners[owner_id].add(new_name)
+
+    async def delete(self, owner_id: int, name: str) -> None:
+        async with self.pool.acquire() as sql:
+            await sql.execute(
+                "DELETE FROM tags WHERE creatorID = ? AND name = ?",
+                (owner_id, name),
+            )
+
+        if owner_id in self.owners:
+            self.owners[owner_id].discard(name)
@@ -0,0 +1,77 @@
+import asyncio
+import collections
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class TTLCache:
+    """Bounded in-memory cache for results of slow async lookups.
+
+    Results are fresh for `ttl` seconds. For `stale_ttl` seconds after that
+    the old result is still returned, while a new one is fetched in the
+    background. Concurrent lookups of the same key share one fetch.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0, max_size: int = 256) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+
+        # Key -> (value, time fetched), least recently used first
+        self.entries: collections.OrderedDict[Hashable, tuple[Any, float]] = (
+            collections.OrderedDict()
+        )
+        self.fetching: dict[Hashable, asyncio.Task] = {}
+
+    # Get a cached value, calling fetch if it is missing or too old
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            value, fetched = entry
+            age = time.monotonic() - fetched
+
+            if age < self.ttl + self.stale_ttl:
+                self.entries.move_to_end(key)
+
+                if age >= self.ttl:
+                    self._refresh(key, fetch)
+
+                return value
+
+        # Shield, so one caller giving up doesn't cancel it for the others
+        return await asyncio.shield(self._refresh(key, fetch))
+
+    def _refresh(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        task = self.fetching.get(key)
+
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, fetch))
+            self.fetching[key] = task
+            task.add_done_callback(lambda t: self._fetch_done(key, t))
+
+        return task
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+
+        self.entries[key] = (value, time.monotonic())
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+        return value
+
+    def _fetch_done(self, key: Hashable, task: asyncio.Task) -> None:
+        self.fetching.pop(key, None)
+
+        # Background refreshes have nobody waiting, the stale value is kept
+        if not task.cancelled() and task.exception() is not None:
+            logging.debug(f"[CACHE] Failed to fetch {key} - {task.exception()}")
+
+    def clear(self) -> None:
+        self.entries.clear()